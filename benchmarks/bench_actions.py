@@ -0,0 +1,76 @@
+# benchmarks/bench_actions.py
+"""Cost of bulk process actions on a synthetic fork storm.
+
+Starts a shell with N sleeping children (one of them ignores SIGTERM, so
+terminate has to escalate) and ends the whole tree through
+ProcessActions. Reports the time submit() takes on the calling (Tk)
+thread separately from the time the worker needs for the batch.
+
+    python -m benchmarks.bench_actions [--sizes 100 500 2000] [--repeat 3]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import psutil
+
+from benchmarks.common import summarize, write_results
+from modules.processes.actions import ProcessActions
+
+
+def spawn_storm(count):
+    """A shell with `count` sleeping children; returns it once all are running."""
+    script = f"for i in $(seq {count - 1}); do sleep 600 & done; (trap '' TERM; sleep 600) & wait"
+    shell = subprocess.Popen(["sh", "-c", script])
+    proc = psutil.Process(shell.pid)
+    deadline = time.monotonic() + 60
+    while len(proc.children(recursive=True)) < count and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return shell, (proc.pid, proc.create_time())
+
+
+def run(action, count, timeout):
+    shell, key = spawn_storm(count)
+    done = threading.Event()
+    actions = ProcessActions(lambda result: done.set())
+    try:
+        t0 = time.perf_counter()
+        future = actions.submit(action, [key], tree=True, timeout=timeout)
+        submitted = time.perf_counter() - t0
+        result = future.result()
+        done.wait(5)
+        return submitted, result.elapsed, result
+    finally:
+        actions.close()
+        shell.wait(5)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 2000])
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--timeout", type=float, default=0.5, help="terminate grace period (s)")
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+    if os.name != "posix":
+        sys.exit("bench_actions needs a POSIX shell")
+
+    results = {}
+    for count in args.sizes:
+        for action in ("terminate", "kill"):
+            ui, worker = [], []
+            for _ in range(args.repeat):
+                submitted, elapsed, result = run(action, count, args.timeout)
+                ui.append(submitted)
+                worker.append(elapsed)
+            print(f"{action} {count}: {result.summary()}")
+            results[f"{action} tree {count}, submit (UI thread)"] = summarize(ui)
+            results[f"{action} tree {count}, worker"] = summarize(worker)
+    write_results("actions", results, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# benchmarks/bench_backends.py
+"""Cost of each collection function against the live system.
+
+Times the performance backend functions one by one (get_cpu_percent,
+get_ram_percent, get_disk_percent, get_network_delta), a full performance
+sample, one per-disk / per-NIC device sample, the legacy fetch_all_processes() and one tick of the process
+sampler the collector actually uses, plus the per-tick store work
+(TimeSeriesStore + Rollups append) fed by the fake metric source.
+
+Numbers depend on the machine and on how many processes are running;
+compare runs from the same box.
+
+    python -m benchmarks.bench_backends [--repeat 200] [--process-repeat 20]
+"""
+import argparse
+
+import psutil
+
+from benchmarks.common import measure, write_results
+from benchmarks.fakes import FakeMetricSource
+from modules.performance import backend as perf
+from modules.processes import backend as procs
+from modules.rollup import Rollups
+from modules.timeseries import TimeSeriesStore
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=200)
+    ap.add_argument("--process-repeat", type=int, default=20)
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    results = {"processes running": len(psutil.pids())}
+    prev = {}
+    for name, fn in (("get_cpu_percent", perf.get_cpu_percent),
+                     ("get_ram_percent", perf.get_ram_percent),
+                     ("get_disk_percent", perf.get_disk_percent),
+                     ("get_network_delta", lambda: perf.get_network_delta(prev)),
+                     ("performance sample", perf.make_sampler()),
+                     ("device sample", perf.make_device_sampler())):
+        results[name] = measure(fn, repeat=args.repeat, warmup=3)
+
+    results["fetch_all_processes"] = measure(procs.fetch_all_processes,
+                                             repeat=args.process_repeat, warmup=1)
+    results["process sampler tick"] = measure(procs.make_sampler(),
+                                              repeat=args.process_repeat, warmup=1)
+
+    source = FakeMetricSource()
+    store = TimeSeriesStore.for_retention(perf.METRICS, 3600, source.interval)
+    rollups = Rollups(perf.METRICS)
+    store.extend(source.take(store.capacity))
+
+    def append():
+        sample = source()
+        store.append(sample)
+        rollups.append(sample)
+    results["store + rollup append"] = measure(append, repeat=args.repeat * 10, warmup=10)
+
+    write_results("backends", results, args.out)
+
+
+if __name__ == "__main__":
+    main()
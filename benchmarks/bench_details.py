@@ -0,0 +1,50 @@
+# benchmarks/bench_details.py
+"""Cost of the process detail panel's fetches.
+
+Times, for this benchmark's own process, every detail attribute fetched
+one by one, a first (cold) ProcessDetails fetch of all of them inside
+oneshot(), and a refresh where the TTL cache is warm, so only what
+expired is read again. All of it runs on the detail worker, never on
+the Tk thread.
+
+    python -m benchmarks.bench_details [--repeat 50]
+"""
+import argparse
+import os
+import threading
+
+import psutil
+
+from benchmarks.common import measure, write_results
+from modules.processes.details import ATTRIBUTES, ProcessDetails
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=50)
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    proc = psutil.Process(os.getpid())
+    key = (proc.pid, proc.create_time())
+    results = {}
+    for name, _, fetch in ATTRIBUTES:
+        results[f"attribute {name}"] = measure(lambda: fetch(proc), repeat=args.repeat, warmup=2)
+
+    done = threading.Event()
+    details = ProcessDetails(lambda k, d: done.set())
+
+    def fetch(cold):
+        if cold:
+            details._cache.clear()
+        done.clear()
+        details.select(key)
+        done.wait(5)
+    results["fetch, cold cache"] = measure(lambda: fetch(True), repeat=args.repeat, warmup=2)
+    results["fetch, warm cache"] = measure(lambda: fetch(False), repeat=args.repeat, warmup=2)
+    details.close()
+    write_results("details", results, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/bench_groups.py
+"""Grouped process view: incremental aggregation vs rebuilding each tick.
+
+Feeds ProcessChurn snapshots (1k/10k processes, ~1% starting and exiting
+and ~30% changing per tick) to ProcessGroups (by name, by user) and
+ProcessTree, updating the sums incrementally, and compares that with
+building the structure from scratch every tick. Also times flatten() for
+one table with everything collapsed and with the top groups expanded.
+
+    python -m benchmarks.bench_groups [--ticks 30]
+"""
+import argparse
+
+from benchmarks.common import measure, write_results
+from benchmarks.fakes import ProcessChurn
+from modules.processes.groups import ProcessGroups, ProcessTree
+
+SIZES = (1000, 10000)
+USER = "alice"
+
+
+def _is_app(p):
+    return p.user == USER
+
+
+MODES = (
+    ("name", lambda: ProcessGroups(lambda p: p.name, _is_app)),
+    ("user", lambda: ProcessGroups(lambda p: p.user, _is_app)),
+    ("tree", lambda: ProcessTree(_is_app)),
+)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--ticks", type=int, default=30)
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    results = {}
+    for size in SIZES:
+        churn = ProcessChurn(size, user=USER)
+        snapshots = [churn() for _ in range(args.ticks + 3)]
+        for mode, make in MODES:
+            grouping = make()
+            grouping.update(snapshots[0])
+            ticks = iter(snapshots[1:])
+            results[f"{mode}: incremental update ({size} procs)"] = measure(
+                lambda: grouping.update(next(ticks)), repeat=args.ticks, warmup=1)
+            ticks = iter(snapshots[1:])
+            results[f"{mode}: rebuild ({size} procs)"] = measure(
+                lambda: make().update(next(ticks)), repeat=args.ticks, warmup=1)
+
+            results[f"{mode}: flatten, collapsed ({size} procs)"] = measure(
+                lambda: grouping.flatten(True, set(), 50, "cpu", True), repeat=args.ticks)
+            top = grouping.flatten(True, set(), 5, "cpu", True)
+            expanded = {r.pid for r in top if r.state is False}
+            results[f"{mode}: flatten, top 5 expanded ({size} procs)"] = measure(
+                lambda: grouping.flatten(True, expanded, 50, "cpu", True), repeat=args.ticks)
+    write_results("groups", results, args.out)
+
+
+if __name__ == "__main__":
+    main()
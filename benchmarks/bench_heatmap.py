@@ -0,0 +1,71 @@
+# benchmarks/bench_heatmap.py
+"""Frame cost of the per-core CPU heatmap as the core count grows.
+
+Fills a MatrixRing with two minutes of synthetic per-core samples and
+times HeatmapGraph.update() (slot resampling + set_data + draw) off-screen
+with the Agg canvas, for 4 to 256 cores, full draw and blit.
+
+    python -m benchmarks.bench_heatmap [--frames 200]
+"""
+import argparse
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from benchmarks.common import measure, write_results
+from modules import styles
+from modules.performance.graphs import HeatmapGraph
+from modules.performance.ui import HEATMAP_COLUMNS, HEATMAP_SECONDS
+from modules.timeseries import MatrixRing
+
+CORES = (4, 16, 64, 128, 256)
+INTERVAL = 0.25
+RETENTION = 120
+
+
+def _ring(cores, now):
+    n = int(RETENTION / INTERVAL)
+    ring = MatrixRing(cores, n)
+    rng = np.random.default_rng(cores)
+    for i in range(n):
+        ring.append((now - (n - i) * INTERVAL, rng.uniform(0, 100, cores)))
+    return ring
+
+
+def bench_heatmap(cores, frames, blit):
+    fig = Figure(figsize=(6, 2.4), dpi=100)
+    ax = fig.add_subplot(111)
+    fig.patch.set_facecolor(styles.CARD_BG)
+    canvas = FigureCanvasAgg(fig)
+    now = 1_000_000.0
+    ring = _ring(cores, now)
+    graph = HeatmapGraph(ax, canvas, cores, HEATMAP_COLUMNS, HEATMAP_SECONDS, blit=blit)
+    state = {"now": now}
+
+    def frame():
+        state["now"] += INTERVAL
+        ring.append((state["now"], np.full(cores, state["now"] % 100)))
+        ts, rows = ring.window()
+        graph.update(ts, rows, state["now"])
+
+    return measure(frame, repeat=frames)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--frames", type=int, default=200)
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    results = {}
+    for cores in CORES:
+        results[f"full draw, {cores} cores"] = bench_heatmap(cores, args.frames, blit=False)
+        results[f"blit, {cores} cores"] = bench_heatmap(cores, args.frames, blit=True)
+    write_results("heatmap", results, args.out)
+
+
+if __name__ == "__main__":
+    main()
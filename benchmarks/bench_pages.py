@@ -0,0 +1,206 @@
+# benchmarks/bench_pages.py
+"""UI cost per frame and per page, with fake data.
+
+  performance  PerformanceUI._refresh_ui per frame, for each time window,
+               with a full hour of fake samples in its store
+  processes    ProcessesUI._fill_tree and _update_ui at 1k/10k synthetic
+               processes (1% churn + 30% changes per tick), or replaying
+               the process lists of a recording (--replay FILE)
+  pages        MainApp page construction (first show) and switching back
+               to an already built page
+  frames       FrameScheduler under 20 requests/s from a worker thread:
+               requested / drawn / dropped counts and frame latency, which
+               must stay within one frame interval plus the render time
+
+The pages are detached from the live collector. Each frame includes
+update_idletasks() so Tk's redraw is counted. Needs a display (use
+xvfb-run on a headless Linux box).
+
+    python -m benchmarks.bench_pages [--frames 50] [--sizes 1000 10000] [--replay FILE]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+from benchmarks.common import measure, summarize, write_results
+from benchmarks.fakes import FakeMetricSource, ProcessChurn
+from modules.performance.backend import METRICS
+from modules.rollup import Rollups
+from modules.timeseries import TimeSeriesStore
+
+
+def bench_performance(root, frames):
+    import customtkinter as ctk
+    from modules.performance import ui as perf_ui
+
+    container = ctk.CTkFrame(root)
+    container.pack(fill="both", expand=True)
+    page = perf_ui.PerformanceUI(container)
+    page.on_hide()   # no live samples; feed the page from the fake source instead
+
+    # an hour of history ending now
+    source = FakeMetricSource(interval=page.collector.interval, start=time.time() - 3600)
+    samples = source.take(int(3600 / source.interval))
+    page.history = TimeSeriesStore(METRICS, len(samples))
+    page.rollups = Rollups(METRICS)
+    for s in samples:
+        page.history.append(s)
+        page.rollups.append(s)
+    page.running = True
+    root.update()
+
+    results = {}
+    try:
+        for label, seconds in perf_ui.WINDOWS:
+            page._set_window(label)
+
+            def frame():
+                s = source()
+                page.history.append(s)
+                page.rollups.append(s)
+                page._refresh_ui()
+                root.update_idletasks()
+            results[f"performance frame ({label})"] = measure(frame, repeat=frames, warmup=3)
+    finally:
+        page.stop_updates()
+        container.destroy()
+    return results
+
+
+def _replayed_processes(path):
+    from modules.replay import ProcessReplay, ReplayClock, read_header
+    header = read_header(path)
+    return ProcessReplay(path, ReplayClock(), header["interval"], loop=True)
+
+
+def bench_processes(root, sizes, frames, replay=None):
+    import customtkinter as ctk
+    from modules.processes import ui as proc_ui
+
+    results = {}
+    for size in ([None] if replay else sizes):
+        container = ctk.CTkFrame(root)
+        container.pack(fill="both", expand=True)
+        page = proc_ui.ProcessesUI(container)
+        page.on_hide()
+        if replay:
+            churn = _replayed_processes(replay)
+        else:
+            churn = ProcessChurn(size, user=page.current_user)
+        page._snapshot = snapshot = churn()
+        page._update_ui()
+        root.update()
+
+        rows = sorted(snapshot, key=lambda p: p.name.lower())
+        size = size or f"replay, {len(rows)}"
+
+        def fill():
+            page._fill_tree(page.apps_tree, rows)
+            root.update_idletasks()
+        results[f"_fill_tree ({size} rows)"] = measure(fill, repeat=frames, warmup=2)
+
+        def update():
+            page._snapshot = churn()
+            page._update_ui()
+            root.update_idletasks()
+        results[f"_update_ui ({size} procs)"] = measure(update, repeat=frames, warmup=2)
+
+        page.stop_updates()
+        container.destroy()
+    return results
+
+
+def bench_main_app(root, repeat):
+    import main as app_main
+    from modules import adaptive
+
+    build = {}
+    switch = {}
+    for _ in range(repeat):
+        app = app_main.MainApp(root)
+        root.update()
+        names = ("performance", "processes", "startup", "settings")
+        for name in names:
+            t0 = time.perf_counter()
+            app.pages.show(name)
+            root.update_idletasks()
+            build.setdefault(name, []).append(time.perf_counter() - t0)
+        for name in names:
+            t0 = time.perf_counter()
+            app.pages.show(name)
+            root.update_idletasks()
+            switch.setdefault(name, []).append(time.perf_counter() - t0)
+        # the next MainApp starts its own rate controller; don't let them stack
+        adaptive.stop()
+        app.pages.close()
+        for w in root.winfo_children():
+            w.destroy()
+
+    results = {}
+    for name in build:
+        results[f"build page ({name})"] = summarize(build[name])
+        results[f"switch to page ({name})"] = summarize(switch[name])
+    return results
+
+
+def bench_frames(root, seconds=3.0, rate=20.0, max_fps=4, render_s=0.005):
+    from modules.scheduler import FrameScheduler
+
+    frames = FrameScheduler(root, lambda: time.sleep(render_s), max_fps=max_fps)
+    stop = threading.Event()
+
+    def producer():
+        while not stop.wait(1.0 / rate):
+            frames.request()
+    worker = threading.Thread(target=producer, daemon=True)
+    worker.start()
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        root.update()
+        time.sleep(0.002)
+    stop.set()
+    worker.join()
+    frames.close()
+
+    stats = frames.stats()
+    # every request is either drawn or dropped (one may still be pending)
+    unaccounted = stats["requested"] - stats["rendered"] - stats["dropped"]
+    if not 0 <= unaccounted <= 1:
+        sys.exit(f"frame scheduler lost requests: {stats}")
+    bound_ms = (frames.min_interval + render_s) * 1000 + 50   # + Tk timer slack
+    if stats["max_latency_ms"] > bound_ms:
+        sys.exit(f"frame latency {stats['max_latency_ms']} ms over {bound_ms:.0f} ms: {stats}")
+    return {f"frame scheduler ({rate:g} requests/s, {max_fps} fps)": stats}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--frames", type=int, default=50)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    ap.add_argument("--repeat", type=int, default=3, help="MainApp constructions")
+    ap.add_argument("--replay", metavar="FILE", help="process lists from a recording (see modules/replay.py)")
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY") \
+            and not os.environ.get("WAYLAND_DISPLAY"):
+        sys.exit("bench_pages needs a display (try: xvfb-run python -m benchmarks.bench_pages)")
+
+    import main as app_main
+    app_main._load_gui()
+    root = app_main.ctk.CTk()
+    root.geometry("1400x820")
+
+    results = {}
+    results.update(bench_performance(root, args.frames))
+    results.update(bench_processes(root, args.sizes, args.frames, args.replay))
+    results.update(bench_main_app(root, args.repeat))
+    results.update(bench_frames(root))
+    root.destroy()
+    write_results("pages", results, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# benchmarks/bench_procfs.py
+"""Process collection cost: ProcfsScanner vs the psutil ProcessTable.
+
+Builds synthetic procfs trees with 1k/5k/10k processes (copies of this
+process's stat/statm/status/cmdline) in a temporary directory and points
+both collectors at it (psutil through psutil.PROCFS_PATH). Each timed
+iteration is one full collector tick. Linux only.
+
+    python -m benchmarks.bench_procfs [--sizes 1000 5000 10000] [--ticks 10]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+import psutil
+
+from benchmarks.common import measure, write_results
+from modules.processes.procfs import ProcfsScanner
+from modules.processes.table import ProcessTable
+
+
+def build_procfs(root, count):
+    me = os.getpid()
+    with open(f"/proc/{me}/stat", "rb") as f:
+        stat = f.read()
+    rest = stat[stat.rindex(b")"):]
+    files = {}
+    for name in ("statm", "status", "cmdline"):
+        with open(f"/proc/{me}/{name}", "rb") as f:
+            files[name] = f.read()
+    for name in ("stat", "meminfo", "uptime"):
+        shutil.copy(f"/proc/{name}", os.path.join(root, name))
+
+    base = 400000  # well above pid_max defaults, so no clash with real PIDs
+    for i in range(count):
+        pid = base + i
+        d = os.path.join(root, str(pid))
+        os.mkdir(d)
+        with open(os.path.join(d, "stat"), "wb") as f:
+            f.write(b"%d (proc-%d) " % (pid, i % 500) + rest[2:])
+        for name, data in files.items():
+            with open(os.path.join(d, name), "wb") as f:
+                f.write(data)
+
+
+def bench_size(count, ticks):
+    root = tempfile.mkdtemp(prefix="procfs-bench-")
+    try:
+        build_procfs(root, count)
+
+        scanner = ProcfsScanner(root)
+        scanner.update()
+        native = measure(scanner.update, repeat=ticks, warmup=1)
+        native["rows"] = len(scanner.rows)
+
+        saved = psutil.PROCFS_PATH
+        psutil.PROCFS_PATH = root
+        try:
+            table = ProcessTable()
+            table.update()
+            via_psutil = measure(table.update, repeat=ticks, warmup=1)
+            via_psutil["rows"] = len(table.rows)
+        finally:
+            psutil.PROCFS_PATH = saved
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    if native["mean_ms"]:
+        native["speedup_vs_psutil"] = round(via_psutil["mean_ms"] / native["mean_ms"], 2)
+    return native, via_psutil
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000])
+    ap.add_argument("--ticks", type=int, default=10)
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    if not sys.platform.startswith("linux"):
+        sys.exit("bench_procfs needs Linux")
+
+    results = {}
+    for count in args.sizes:
+        native, via_psutil = bench_size(count, args.ticks)
+        results[f"procfs ({count} procs)"] = native
+        results[f"psutil ({count} procs)"] = via_psutil
+    write_results("procfs", results, args.out)
+
+
+if __name__ == "__main__":
+    main()
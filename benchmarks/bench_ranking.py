@@ -0,0 +1,39 @@
+# benchmarks/bench_ranking.py
+"""Cost of ordering one table's rows: full sort vs top-K heap selection.
+
+Ranks synthetic process lists (1k/10k/50k rows) by CPU% and by name the
+way ProcessesUI._update_ui does, once with every row sorted and once
+with modules.processes.ranking.top_k for K = 20 / 50 / 100.
+
+    python -m benchmarks.bench_ranking [--repeat 50]
+"""
+import argparse
+
+from benchmarks.common import measure, write_results
+from benchmarks.fakes import synthetic_processes
+from modules.processes.ranking import top_k
+
+SIZES = (1000, 10000, 50000)
+KS = (20, 50, 100)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=50)
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    results = {}
+    for size in SIZES:
+        rows = synthetic_processes(size)
+        for column, descending in (("cpu", True), ("name", False)):
+            results[f"{column}, full sort ({size} rows)"] = measure(
+                lambda: top_k(rows, None, column, descending), repeat=args.repeat, warmup=2)
+            for k in KS:
+                results[f"{column}, top {k} ({size} rows)"] = measure(
+                    lambda: top_k(rows, k, column, descending), repeat=args.repeat, warmup=2)
+    write_results("ranking", results, args.out)
+
+
+if __name__ == "__main__":
+    main()
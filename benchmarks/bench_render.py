@@ -0,0 +1,132 @@
+# benchmarks/bench_render.py
+"""Frame cost of the Performance page graphs.
+
+Renders the page's six figures (five single-line graphs + network) off-screen
+with the Agg canvas and compares:
+
+  legacy      ax.clear() + plot + fill_between + legend + canvas.draw()
+  persistent  LineGraph artists updated in place, full canvas.draw()
+  blit        LineGraph artists updated in place, restore background + blit
+
+Agg has no on-screen blit, so the TkAgg photo-image copy is not included.
+
+    python -m benchmarks.bench_render [--frames 200]
+"""
+import argparse
+import math
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from benchmarks.common import measure, write_results
+from modules import styles
+from modules.performance.graphs import LineGraph
+
+MAXLEN = 120
+COLORS = [styles.NEON_YELLOW, styles.NEON_BLUE, styles.NEON_PINK, styles.NEON_PURPLE, styles.NEON_ORANGE]
+
+
+def _figure():
+    fig = Figure(figsize=(6, 2.4), dpi=100)
+    ax = fig.add_subplot(111)
+    ax.set_facecolor(styles.CARD_BG)
+    fig.patch.set_facecolor(styles.CARD_BG)
+    ax.tick_params(colors="white", labelsize=9)
+    for spine in ax.spines.values():
+        spine.set_color("#222225")
+    return fig, ax, FigureCanvasAgg(fig)
+
+
+def _series(frame):
+    t = np.arange(MAXLEN) + frame
+    pct = 50 + 40 * np.sin(t / 7.0)
+    net = 300 + 200 * np.sin(t / 5.0) ** 2
+    return pct, net, net / 3
+
+
+# -------- legacy renderer (what PerformanceUI._draw_line/_draw_network did)
+def _legacy_line(ax, canvas, data, color):
+    ax.clear()
+    ax.set_facecolor(styles.CARD_BG)
+    ax.tick_params(colors="white", labelsize=9)
+    for spine in ax.spines.values():
+        spine.set_color("#222225")
+    x = range(len(data))
+    ax.plot(x, data, color=color, linewidth=styles.GRAPH_LINEWIDTH)
+    ax.fill_between(x, data, [0] * len(data), color=color, alpha=0.12)
+    canvas.draw()
+
+
+def _legacy_network(ax, canvas, down, up):
+    ax.clear()
+    ax.set_facecolor(styles.CARD_BG)
+    ax.tick_params(colors="white", labelsize=9)
+    for spine in ax.spines.values():
+        spine.set_color("#222225")
+    x = range(len(down))
+    ax.plot(x, down, color=styles.NEON_CYAN, linewidth=styles.GRAPH_LINEWIDTH)
+    ax.plot(x, up, color=styles.NEON_LIME, linewidth=styles.GRAPH_LINEWIDTH)
+    ax.fill_between(x, down, [0] * len(down), color=styles.NEON_CYAN, alpha=0.12)
+    ax.fill_between(x, up, [0] * len(up), color=styles.NEON_LIME, alpha=0.08)
+    ax.legend(["Download KB/s", "Upload KB/s"], facecolor=styles.CARD_BG, labelcolor=styles.TEXT_PRIMARY)
+    canvas.draw()
+
+
+def bench_legacy(frames):
+    figs = [_figure() for _ in range(6)]
+    state = {"frame": 0}
+
+    def frame():
+        pct, down, up = _series(state["frame"])
+        state["frame"] += 1
+        for (fig, ax, canvas), color in zip(figs[:5], COLORS):
+            _legacy_line(ax, canvas, list(pct), color)
+        fig, ax, canvas = figs[5]
+        _legacy_network(ax, canvas, list(down), list(up))
+
+    return measure(frame, repeat=frames)
+
+
+def bench_graphs(frames, blit):
+    graphs = []
+    for color in COLORS:
+        fig, ax, canvas = _figure()
+        graphs.append(LineGraph(ax, canvas, [(color, 0.12)], MAXLEN, ylim=(0, 100), blit=blit))
+    fig, ax, canvas = _figure()
+    net = LineGraph(ax, canvas, [(styles.NEON_CYAN, 0.12), (styles.NEON_LIME, 0.08)], MAXLEN,
+                    legend=["Download KB/s", "Upload KB/s"], blit=blit)
+    state = {"frame": 0}
+
+    def frame():
+        pct, down, up = _series(state["frame"])
+        state["frame"] += 1
+        for g in graphs:
+            g.update(pct)
+        net.update(down, up)
+
+    return measure(frame, repeat=frames)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--frames", type=int, default=200)
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    results = {
+        "legacy (6 figures)": bench_legacy(args.frames),
+        "persistent (6 figures)": bench_graphs(args.frames, blit=False),
+        "blit (6 figures)": bench_graphs(args.frames, blit=True),
+    }
+    legacy = results["legacy (6 figures)"]["mean_ms"]
+    for key in ("persistent (6 figures)", "blit (6 figures)"):
+        mean = results[key]["mean_ms"]
+        results[key]["speedup_vs_legacy"] = round(legacy / mean, 2) if mean else math.inf
+    write_results("render", results, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# benchmarks/bench_replay.py
+"""Headless replay at --replay-speed max: throughput and completeness.
+
+Writes a synthetic recording (FakeMetricSource + ProcessChurn through the
+real Recorder), then replays it with `main.py --headless --replay FILE
+--replay-speed max` in a subprocess. Every run must emit exactly one
+metrics line per recorded performance sample and one processes line per
+recorded process list, with the same timestamp spacing on every run;
+otherwise the benchmark fails.
+
+    python -m benchmarks.bench_replay [--ticks 200] [--procs 1000] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import summarize, write_results
+from benchmarks.fakes import FakeMetricSource, ProcessChurn
+from modules.replay import Recorder
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class _Source:
+    ts = None
+
+
+class _Collector:
+    """Just enough of a Collector for the Recorder (its callbacks are driven here)."""
+
+    interval = 0.25
+
+    def __init__(self):
+        self.processes = _Source()
+
+    def source(self, name):
+        return self.processes if name == "processes" else None
+
+    def subscribe(self, name, callback):
+        pass
+
+    unsubscribe = subscribe
+
+
+def write_recording(path, ticks, procs):
+    collector = _Collector()
+    perf = FakeMetricSource(interval=collector.interval)
+    churn = ProcessChurn(procs)
+    recorder = Recorder(collector, path)
+    for _ in range(ticks):
+        sample = perf()
+        recorder._on_performance(sample)
+        collector.processes.ts = sample.ts
+        recorder._on_processes(churn())
+    recorder.close()
+
+
+def replay(path, top):
+    cmd = [sys.executable, "main.py", "--headless", "--top", str(top),
+           "--replay", path, "--replay-speed", "max"]
+    t0 = time.perf_counter()
+    out = subprocess.run(cmd, cwd=ROOT, stdout=subprocess.PIPE, text=True, check=True).stdout
+    elapsed = time.perf_counter() - t0
+    lines = [json.loads(line) for line in out.splitlines()]
+    counts = {"metrics": 0, "processes": 0}
+    for line in lines:
+        counts[line["type"]] += 1
+    t0 = lines[0]["ts"] if lines else 0.0
+    offsets = [(line["type"], round(line["ts"] - t0, 3)) for line in lines]
+    return elapsed, counts, offsets
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--ticks", type=int, default=200)
+    ap.add_argument("--procs", type=int, default=1000)
+    ap.add_argument("--top", type=int, default=10)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.rec.gz")
+        write_recording(path, args.ticks, args.procs)
+        times = []
+        first = None
+        for _ in range(args.repeat):
+            elapsed, counts, offsets = replay(path, args.top)
+            if counts != {"metrics": args.ticks, "processes": args.ticks}:
+                sys.exit(f"replay lost samples: {counts}, recorded {args.ticks} of each")
+            if first is None:
+                first = offsets
+            elif offsets != first:
+                sys.exit("replayed timestamps differ between runs")
+            times.append(elapsed)
+    write_results("replay", {
+        f"headless replay, max speed ({args.ticks} ticks, {args.procs} procs)": summarize(times),
+    }, args.out)
+
+
+if __name__ == "__main__":
+    main()
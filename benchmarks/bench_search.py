@@ -0,0 +1,67 @@
+# benchmarks/bench_search.py
+"""Process search: index build, per-tick maintenance and per-keystroke queries.
+
+Indexes synthetic process lists (1k/10k rows with generated command lines)
+with modules.processes.search.ProcessIndex, then times one update() under
+ProcessChurn (~1% of processes starting and exiting per tick) and the
+queries typed one keystroke at a time, against a linear scan of the same
+text for comparison.
+
+    python -m benchmarks.bench_search [--repeat 50]
+"""
+import argparse
+import random
+
+from benchmarks.common import measure, write_results
+from benchmarks.fakes import ProcessChurn
+from modules.processes.search import ProcessIndex
+
+SIZES = (1000, 10000)
+QUERY = "gunicorn --work"
+WORDS = ("python3", "/usr/bin/java", "-jar", "/opt/app/server.jar", "node", "worker.js",
+         "gunicorn", "--workers=4", "--config=/etc/app/app.yaml", "postgres:", "nginx:")
+
+
+def _cmdline(pid):
+    rnd = random.Random(pid)
+    return " ".join(rnd.choice(WORDS) for _ in range(rnd.randrange(1, 8)))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=50)
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    results = {}
+    for size in SIZES:
+        churn = ProcessChurn(size)
+        first = churn()
+        results[f"build ({size} procs)"] = measure(
+            lambda: ProcessIndex(cmdline=_cmdline).update(first), repeat=3)
+        index = ProcessIndex(cmdline=_cmdline)
+        index.update(first)
+        # snapshots are generated up front so only the index maintenance is timed
+        ticks = iter([churn() for _ in range(args.repeat + 2)])
+        results[f"update per tick ({size} procs)"] = measure(
+            lambda: index.update(next(ticks)), repeat=args.repeat, warmup=2)
+
+        for n in range(1, len(QUERY) + 1):
+            query = QUERY[:n]
+            if query.endswith(" "):
+                continue
+
+            def search():
+                index._cache = (None, None, None)   # time the lookup, not the cache
+                return index.search(query)
+            results[f"query {query!r} ({size} procs)"] = measure(search, repeat=args.repeat)
+
+        texts = dict(index._text)
+        results[f"linear scan {QUERY!r} ({size} procs)"] = measure(
+            lambda: [k for k, t in texts.items() if all(w in t for w in QUERY.split())],
+            repeat=args.repeat)
+    write_results("search", results, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# benchmarks/bench_startup.py
+"""Startup latency of the dashboard: time-to-first-window and time-to-first-data.
+
+Launches `python main.py` repeatedly with SYSMON_STARTUP_PROBE set; the app
+reports when its window first maps and when the first page first renders
+data, then quits. Times are measured from process launch. Needs a display
+(use xvfb-run on a headless Linux box).
+
+Results are compared with the previous run in benchmarks/results/ (or
+--baseline FILE); a milestone whose median got more than --threshold
+percent slower is reported as a regression and the exit status is 1.
+
+    python -m benchmarks.bench_startup [--runs 5] [--baseline FILE] [--threshold 15]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import RESULTS_DIR, summarize, write_results
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MILESTONES = ("window", "data")
+
+
+def launch(timeout):
+    fd, probe = tempfile.mkstemp(prefix="startup-probe-")
+    os.close(fd)
+    env = dict(os.environ, SYSMON_STARTUP_PROBE=probe)
+    try:
+        start = time.time()
+        subprocess.run([sys.executable, os.path.join(ROOT, "main.py")], env=env, cwd=ROOT,
+                       timeout=timeout, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        marks = {}
+        with open(probe) as f:
+            for line in f:
+                name, ts = line.split()
+                marks[name] = float(ts) - start
+        return marks
+    finally:
+        os.remove(probe)
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name in MILESTONES:
+        new, old = results.get(name), baseline.get(name)
+        if not new or not old or not old.get("p50_ms"):
+            continue
+        change = (new["p50_ms"] - old["p50_ms"]) / old["p50_ms"] * 100.0
+        print(f"{name:<10} {old['p50_ms']:>9.1f} ms -> {new['p50_ms']:>9.1f} ms  ({change:+.1f}%)")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--timeout", type=float, default=60.0)
+    ap.add_argument("--baseline", default=os.path.join(RESULTS_DIR, "startup.json"))
+    ap.add_argument("--threshold", type=float, default=15.0, help="allowed slowdown in percent")
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY") \
+            and not os.environ.get("WAYLAND_DISPLAY"):
+        sys.exit("bench_startup needs a display (try: xvfb-run python -m benchmarks.bench_startup)")
+
+    baseline = {}
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f).get("results", {})
+
+    samples = {name: [] for name in MILESTONES}
+    for _ in range(args.runs):
+        marks = launch(args.timeout)
+        for name in MILESTONES:
+            if name in marks:
+                samples[name].append(marks[name])
+
+    results = {name: summarize(times) for name, times in samples.items() if times}
+    if not results:
+        sys.exit("the app never reported a startup milestone")
+    write_results("startup", results, args.out)
+
+    if baseline and compare(results, baseline, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# benchmarks/bench_treesync.py
+"""Process table update cost: delete-all/reinsert vs keyed diff (TreeSync).
+
+Feeds synthetic process snapshots (default 10k rows, ~1% exits, ~1% new
+processes and ~30% CPU/RAM changes per tick, sorted by name) into a
+ttk.Treeview. Without a display, a list-backed stand-in with the same
+methods is used instead; it reports the same operation counts but its
+timings only cover the Python side.
+
+    python -m benchmarks.bench_treesync [--rows 10000] [--ticks 30]
+"""
+import argparse
+import random
+
+from benchmarks.common import summarize, write_results
+from modules.processes.treesync import TreeSync
+
+COLUMNS = ("pid", "name", "cpu", "mem")
+
+
+class FakeTree:
+    """Minimal list-backed stand-in for ttk.Treeview."""
+
+    def __init__(self, columns=COLUMNS, visible_rows=30):
+        self.columns = columns
+        self.visible_rows = visible_rows
+        self.children = []
+        self.items = {}
+        self.calls = 0
+
+    def __getitem__(self, key):
+        return self.columns
+
+    def configure(self, **kwargs):
+        pass
+
+    def get_children(self, item=""):
+        return tuple(self.children)
+
+    def insert(self, parent, index, iid=None, values=(), tags=()):
+        self.calls += 1
+        self.items[iid] = {"values": list(values), "tags": tags}
+        self.children.insert(len(self.children) if index == "end" else index, iid)
+        return iid
+
+    def delete(self, *iids):
+        self.calls += 1
+        drop = set(iids)
+        self.children = [i for i in self.children if i not in drop]
+        for iid in iids:
+            self.items.pop(iid, None)
+
+    def detach(self, *iids):
+        self.calls += 1
+        drop = set(iids)
+        self.children = [i for i in self.children if i not in drop]
+
+    def move(self, iid, parent, index):
+        self.calls += 1
+        if iid in self.children:
+            self.children.remove(iid)
+        self.children.insert(index, iid)
+
+    def set(self, iid, column, value):
+        self.calls += 1
+        self.items[iid]["values"][self.columns.index(column)] = value
+
+    def item(self, iid, **kwargs):
+        self.calls += 1
+        if "values" in kwargs:
+            kwargs["values"] = list(kwargs["values"])
+        self.items[iid].update(kwargs)
+
+    def yview(self):
+        n = max(1, len(self.children))
+        return 0.0, min(1.0, self.visible_rows / n)
+
+
+def make_tree(use_tk):
+    if use_tk:
+        try:
+            import tkinter as tk
+            from tkinter import ttk
+            root = tk.Tk()
+            root.withdraw()
+            return ttk.Treeview(root, columns=COLUMNS, show="headings"), "ttk.Treeview"
+        except Exception:
+            pass
+    return FakeTree(), "FakeTree (no display)"
+
+
+def snapshots(rows, ticks, seed=1):
+    rnd = random.Random(seed)
+    next_pid = 1
+    procs = {}
+    for _ in range(rows):
+        procs[next_pid] = [f"proc-{rnd.randrange(rows):05d}", 0.0, rnd.random() * 2]
+        next_pid += 1
+    for _ in range(ticks):
+        for pid in rnd.sample(list(procs), rows // 100):
+            del procs[pid]
+        for _ in range(rows // 100):
+            procs[next_pid] = [f"proc-{rnd.randrange(rows):05d}", 0.0, rnd.random() * 2]
+            next_pid += 1
+        for pid in rnd.sample(list(procs), int(len(procs) * 0.3)):
+            procs[pid][1] = rnd.random() * 100
+            procs[pid][2] = rnd.random() * 2
+        items = sorted(procs.items(), key=lambda kv: kv[1][0])
+        yield [(pid, (pid, name, f"{cpu:.1f}", f"{mem:.1f}")) for pid, (name, cpu, mem) in items]
+
+
+def bench_rebuild(tree, snaps):
+    import time
+    times = []
+    for rows in snaps:
+        t0 = time.perf_counter()
+        tree.delete(*tree.get_children())
+        for i, (pid, values) in enumerate(rows):
+            tree.insert("", "end", iid=str(pid), values=values, tags=("even" if i % 2 == 0 else "odd",))
+        times.append(time.perf_counter() - t0)
+    stats = summarize(times)
+    if isinstance(tree, FakeTree):
+        stats["tree_calls_per_tick"] = round(tree.calls / len(times), 1)
+    return stats
+
+
+def bench_sync(tree, snaps):
+    import time
+    sync = TreeSync(tree)
+    times = []
+    calls = 0
+    ops = {"insert": 0, "delete": 0, "cells": 0, "move": 0}
+    for n, rows in enumerate(snaps):
+        before = getattr(tree, "calls", 0)
+        t0 = time.perf_counter()
+        sync.set_rows(rows)
+        times.append(time.perf_counter() - t0)
+        if n:  # first tick is the initial fill
+            calls += getattr(tree, "calls", 0) - before
+            for k, v in sync.last_ops.items():
+                ops[k] += v
+    stats = summarize(times[1:])
+    stats["initial_fill_ms"] = round(times[0] * 1000, 3)
+    stats["ops_per_tick"] = {k: round(v / max(1, len(times) - 1), 1) for k, v in ops.items()}
+    expected = [str(pid) for pid, _ in rows]
+    if isinstance(tree, FakeTree):
+        stats["tree_calls_per_tick"] = round(calls / max(1, len(times) - 1), 1)
+    stats["order_ok"] = list(tree.get_children()) == expected
+    return stats
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=10000)
+    ap.add_argument("--ticks", type=int, default=30)
+    ap.add_argument("--no-tk", action="store_true", help="always use the list-backed stand-in")
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    snaps = list(snapshots(args.rows, args.ticks + 1))
+    tree, kind = make_tree(not args.no_tk)
+    rebuild = bench_rebuild(tree, snaps[1:])
+    tree, kind = make_tree(not args.no_tk)
+    sync = bench_sync(tree, snaps)
+    write_results("treesync", {
+        "tree": kind,
+        f"rebuild ({args.rows} rows)": rebuild,
+        f"keyed diff ({args.rows} rows)": sync,
+    }, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/common.py
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def measure(fn, repeat=100, warmup=5):
+    """Call fn repeatedly and return timing stats in milliseconds."""
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return summarize(times)
+
+
+def summarize(times):
+    ms = sorted(t * 1000.0 for t in times)
+    n = len(ms)
+    mean = sum(ms) / n
+    return {
+        "n": n,
+        "mean_ms": round(mean, 4),
+        "p50_ms": round(ms[n // 2], 4),
+        "p95_ms": round(ms[min(n - 1, int(n * 0.95))], 4),
+        "max_ms": round(ms[-1], 4),
+        "per_sec": round(1000.0 / mean, 2) if mean else None,
+    }
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, cwd=os.path.dirname(RESULTS_DIR)).stdout.strip()
+    except Exception:
+        commit = ""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "commit": commit,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def write_results(name, results, path=None):
+    """Print a short table and write {"env": ..., "results": ...} as JSON."""
+    for key, stats in results.items():
+        if isinstance(stats, dict) and "mean_ms" in stats:
+            print(f"{key:<40} {stats['mean_ms']:>10.3f} ms   p95 {stats['p95_ms']:>9.3f} ms"
+                  f"   {stats['per_sec'] or 0:>9.1f}/s")
+        else:
+            print(f"{key:<40} {stats}")
+
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{name}.json")
+    with open(path, "w") as f:
+        json.dump({"benchmark": name, "env": environment(), "results": results}, f, indent=2)
+    print(f"-> {path}", file=sys.stderr)
+    return path
@@ -0,0 +1,74 @@
+# benchmarks/compare.py
+"""Compare two benchmark runs and flag regressions.
+
+Takes two result files or two result directories (as written by
+run_all); every timing present in both is compared on --metric
+(p50_ms by default). Exits with status 1 when any timing got more than
+--threshold percent slower, ignoring timings below --floor ms, where
+scheduler noise dominates.
+
+    python -m benchmarks.compare OLD NEW [--threshold 10] [--metric p50_ms]
+"""
+import argparse
+import json
+import os
+import sys
+
+
+def load(path):
+    """{(benchmark, key): stats} for a result file or a directory of them."""
+    if os.path.isdir(path):
+        files = [os.path.join(path, f) for f in sorted(os.listdir(path))
+                 if f.endswith(".json") and f != "index.json"]
+    else:
+        files = [path]
+    timings = {}
+    for file in files:
+        with open(file) as f:
+            data = json.load(f)
+        name = data.get("benchmark", os.path.splitext(os.path.basename(file))[0])
+        for key, stats in data.get("results", {}).items():
+            if isinstance(stats, dict) and "mean_ms" in stats:
+                timings[(name, key)] = stats
+    return timings
+
+
+def compare(old, new, metric="p50_ms", threshold=10.0, floor=0.05):
+    """Rows of (benchmark, key, old, new, change %, regressed)."""
+    rows = []
+    for k in sorted(old.keys() & new.keys()):
+        a, b = old[k].get(metric), new[k].get(metric)
+        if not a or b is None:
+            continue
+        change = (b - a) / a * 100.0
+        rows.append((k[0], k[1], a, b, change, change > threshold and b >= floor))
+    return rows
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("old")
+    ap.add_argument("new")
+    ap.add_argument("--metric", default="p50_ms", choices=("mean_ms", "p50_ms", "p95_ms", "max_ms"))
+    ap.add_argument("--threshold", type=float, default=10.0, help="allowed slowdown in percent")
+    ap.add_argument("--floor", type=float, default=0.05, help="ignore timings below this many ms")
+    args = ap.parse_args(argv)
+
+    old, new = load(args.old), load(args.new)
+    rows = compare(old, new, args.metric, args.threshold, args.floor)
+    regressions = 0
+    for bench, key, a, b, change, regressed in rows:
+        mark = "  REGRESSION" if regressed else ""
+        print(f"{bench:<10} {key:<40} {a:>10.3f} -> {b:>10.3f} ms  {change:+7.1f}%{mark}")
+        regressions += regressed
+    for bench, key in sorted(old.keys() ^ new.keys()):
+        print(f"{bench:<10} {key:<40} only in {'old' if (bench, key) in old else 'new'}")
+
+    print(f"{len(rows)} timings compared, {regressions} regressions "
+          f"(> {args.threshold:g}% on {args.metric})")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
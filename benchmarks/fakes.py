@@ -0,0 +1,76 @@
+# benchmarks/fakes.py
+"""Deterministic stand-ins for the live data sources.
+
+Everything here is seeded, so two runs (or two commits) benchmark exactly
+the same inputs.
+"""
+import random
+
+from modules.performance.backend import PerfSample
+from modules.processes.table import ProcRow
+
+USERS = ("alice", "root", "", "systemd-resolve", "messagebus")
+
+
+class FakeMetricSource:
+    """Callable producing PerfSamples: a bounded random walk per metric,
+    timestamps `interval` seconds apart starting at `start`."""
+
+    def __init__(self, seed=1, interval=0.25, start=1_700_000_000.0):
+        self.rnd = random.Random(seed)
+        self.interval = interval
+        self.ts = start
+        self.values = [20.0, 45.0, 60.0, 0.0, 0.0, 50.0, 10.0]
+
+    def __call__(self):
+        self.ts += self.interval
+        rnd = self.rnd
+        v = self.values
+        for i in (0, 1, 2):
+            v[i] = min(100.0, max(0.0, v[i] + rnd.uniform(-5, 5)))
+        v[5] = max(0.0, v[5] + rnd.uniform(-40, 40))
+        v[6] = max(0.0, v[6] + rnd.uniform(-10, 10))
+        return PerfSample(self.ts, *v)
+
+    def take(self, n):
+        return [self() for _ in range(n)]
+
+
+def synthetic_processes(count, seed=1, user="alice"):
+    """`count` ProcRows; about a third belong to `user` (the "apps" table).
+    Parents form a tree: the parent of PID n is n // 8."""
+    rnd = random.Random(seed)
+    users = (user,) + USERS[1:]
+    return [ProcRow(pid, 1_700_000_000.0 + pid, f"proc-{rnd.randrange(count):05d}",
+                    users[rnd.randrange(len(users))], round(rnd.random() * 100, 1),
+                    rnd.random() * 2, pid // 8)
+            for pid in range(1, count + 1)]
+
+
+class ProcessChurn:
+    """Successive process snapshots: per tick ~1% of processes exit, ~1%
+    start and ~30% change CPU/RAM (unchanged rows keep their ProcRow)."""
+
+    def __init__(self, count, seed=1, user="alice"):
+        self.rnd = random.Random(seed)
+        self.user = user
+        self.rows = {p.pid: p for p in synthetic_processes(count, seed, user)}
+        self.next_pid = count + 1
+
+    def __call__(self):
+        rnd = self.rnd
+        rows = self.rows
+        churn = max(1, len(rows) // 100)
+        for pid in rnd.sample(list(rows), churn):
+            del rows[pid]
+        for _ in range(churn):
+            pid = self.next_pid
+            self.next_pid += 1
+            rows[pid] = ProcRow(pid, 1_700_000_000.0 + pid, f"proc-{rnd.randrange(len(rows)):05d}",
+                                self.user if rnd.random() < 0.3 else "root", 0.0, rnd.random() * 2,
+                                pid // 8)
+        for pid in rnd.sample(list(rows), int(len(rows) * 0.3)):
+            p = rows[pid]
+            rows[pid] = ProcRow(pid, p.create_time, p.name, p.user,
+                                round(rnd.random() * 100, 1), rnd.random() * 2, p.ppid)
+        return tuple(rows.values())
@@ -0,0 +1,77 @@
+# benchmarks/run_all.py
+"""Run every benchmark and collect the results of one commit in one place.
+
+Each benchmark runs in its own interpreter and writes
+benchmarks/results/<commit>/<name>.json; benchmarks that can't run here
+(no display, not Linux) are recorded as skipped. Compare two commits with
+
+    python -m benchmarks.run_all [--only render treesync] [--out-dir DIR] [--baseline DIR]
+    python -m benchmarks.compare benchmarks/results/<old> benchmarks/results/<new>
+
+--baseline names an earlier run's results directory; bench_startup checks
+its milestones against that run's startup.json (without it, nothing).
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.common import RESULTS_DIR, environment
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> module; order is cheapest first
+BENCHMARKS = (
+    ("backends", "benchmarks.bench_backends"),
+    ("render", "benchmarks.bench_render"),
+    ("heatmap", "benchmarks.bench_heatmap"),
+    ("treesync", "benchmarks.bench_treesync"),
+    ("ranking", "benchmarks.bench_ranking"),
+    ("search", "benchmarks.bench_search"),
+    ("details", "benchmarks.bench_details"),
+    ("groups", "benchmarks.bench_groups"),
+    ("actions", "benchmarks.bench_actions"),
+    ("replay", "benchmarks.bench_replay"),
+    ("procfs", "benchmarks.bench_procfs"),
+    ("pages", "benchmarks.bench_pages"),
+    ("startup", "benchmarks.bench_startup"),
+)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--only", nargs="+", choices=[name for name, _ in BENCHMARKS])
+    ap.add_argument("--out-dir", default=None, help="default: benchmarks/results/<commit>")
+    ap.add_argument("--baseline", metavar="DIR", default=None,
+                    help="results directory of an earlier run to check startup against")
+    args = ap.parse_args(argv)
+
+    env = environment()
+    out_dir = args.out_dir or os.path.join(RESULTS_DIR, env["commit"] or "working-tree")
+    os.makedirs(out_dir, exist_ok=True)
+
+    summary = {}
+    for name, module in BENCHMARKS:
+        if args.only and name not in args.only:
+            continue
+        print(f"== {name}", flush=True)
+        cmd = [sys.executable, "-m", module, "--out", os.path.join(out_dir, f"{name}.json")]
+        if name == "startup":
+            # never the file this run is about to write; "" = no comparison
+            cmd += ["--baseline", os.path.join(args.baseline, "startup.json") if args.baseline else ""]
+        proc = subprocess.run(cmd, cwd=ROOT, stderr=subprocess.PIPE, text=True)
+        if proc.returncode == 0:
+            summary[name] = "ok"
+        else:
+            reason = (proc.stderr.strip().splitlines() or ["failed"])[-1]
+            summary[name] = f"skipped: {reason}"
+            print(f"   {summary[name]}")
+
+    with open(os.path.join(out_dir, "index.json"), "w") as f:
+        json.dump({"env": env, "benchmarks": summary}, f, indent=2)
+    print(f"-> {out_dir}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,59 @@
 # main.py
+import argparse
 import os
 import sys
-import customtkinter as ctk
+import time
 
 # ensure project root in path
 script_dir = os.path.dirname(os.path.abspath(__file__))
 if script_dir not in sys.path:
     sys.path.insert(0, script_dir)
 
-from modules import styles
-from modules.performance.ui import PerformanceUI
-from modules.processes.ui import ProcessesUI
-from modules.startup.ui import StartupUI
-from modules.settings.ui import SettingsUI  # lightweight placeholder
+from modules import styles, headless, exporter, replay, adaptive
+from modules.collector import enable_persistence, get_collector
+from modules.settings.backend import SettingsManager
 
-ctk.set_appearance_mode("dark")
-ctk.set_default_color_theme("dark-blue")
+# set to a file path (or "-") to report startup milestones, see benchmarks/bench_startup.py
+STARTUP_PROBE = os.environ.get("SYSMON_STARTUP_PROBE")
+
+# Tk side, imported by _load_gui() only: --headless never loads Tk or matplotlib
+ctk = PageManager = preload = None
+
+
+def _load_gui():
+    global ctk, PageManager, preload
+    import customtkinter as ctk
+    from modules.pages import PageManager, preload
+
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("dark-blue")
 
 
 class MainApp:
-    def __init__(self, root):
+    def __init__(self, root, live=True):
         self.root = root
         self.root.title("System Monitoring Dashboard")
         self.root.geometry("1400x820")
         self.root.minsize(1100, 700)
+        self._started = False
 
-        self.current_page = None
-        self.pages = {}
+        # live system (not a replay): keep recording history to disk (and load
+        # the last run's) from the start, and keep our own CPU use on budget.
+        # main() already did this before the recorder and exporter subscribed;
+        # this call only matters when MainApp is built on its own (benchmarks)
+        self.settings = SettingsManager()
+        if live:
+            enable_persistence()
+            adaptive.start(self.root, get_collector(), self.settings)
 
         self._create_sidebar()
         self._create_content_area()
-        self.show_performance()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # matplotlib is the slowest import by far: load it while the first frame paints
+        preload("matplotlib.figure", "matplotlib.backends.backend_tkagg", "modules.performance.ui")
+        # let the window (sidebar) appear before the first page is built
+        self.root.bind("<Map>", self._on_first_map, add="+")
 
     def _create_sidebar(self):
         self.sidebar = ctk.CTkFrame(self.root, fg_color=styles.SIDEBAR_BG, width=220, corner_radius=0)
@@ -76,15 +99,23 @@ class MainApp:
         self.content = ctk.CTkFrame(self.root, fg_color=styles.BG_MAIN)
         self.content.pack(side="right", fill="both", expand=True)
 
-    def _clear_content(self):
-        # stop page updates if exists
-        try:
-            if self.current_page and hasattr(self.pages[self.current_page], "stop_updates"):
-                self.pages[self.current_page].stop_updates()
-        except Exception:
-            pass
-        for w in self.content.winfo_children():
-            w.destroy()
+        # pages are built on first visit and kept alive (hidden) afterwards
+        self.pages = PageManager(self.content)
+        # page modules are imported on first navigation
+        self.pages.register("performance", "modules.performance.ui:PerformanceUI")
+        self.pages.register("processes", "modules.processes.ui:ProcessesUI")
+        self.pages.register("startup", "modules.startup.ui:StartupUI")
+        self.pages.register("settings", "modules.settings.ui:SettingsUI")
+
+    def _on_first_map(self, event):
+        if event.widget is self.root and not self._started:
+            self._started = True
+            self.root.after_idle(self.show_performance)
+
+    def _on_close(self):
+        adaptive.stop()
+        self.pages.close()
+        self.root.destroy()
 
     def _highlight_button(self, active_btn):
         for b in (self.btn_perf, self.btn_proc, self.btn_startup, self.btn_settings):
@@ -92,35 +123,87 @@ class MainApp:
         active_btn.configure(fg_color=styles.NEON_ORANGE)
 
     def show_performance(self):
-        self._clear_content()
         self._highlight_button(self.btn_perf)
-        page = PerformanceUI(self.content)
-        self.pages["performance"] = page
-        self.current_page = "performance"
+        self.pages.show("performance")
 
     def show_processes(self):
-        self._clear_content()
         self._highlight_button(self.btn_proc)
-        page = ProcessesUI(self.content)
-        self.pages["processes"] = page
-        self.current_page = "processes"
+        self.pages.show("processes")
 
     def show_startup(self):
-        self._clear_content()
         self._highlight_button(self.btn_startup)
-        page = StartupUI(self.content)
-        self.pages["startup"] = page
-        self.current_page = "startup"
+        self.pages.show("startup")
 
     def show_settings(self):
-        self._clear_content()
         self._highlight_button(self.btn_settings)
-        page = SettingsUI(self.content)
-        self.pages["settings"] = page
-        self.current_page = "settings"
+        self.pages.show("settings")
+
+
+def _probe_startup(root, app, out):
+    """Report when the window first maps and when the first page first
+    renders data (FrameScheduler.rendered), then quit."""
+    marks = {}
+
+    def report(name):
+        if name not in marks:
+            marks[name] = time.time()
+            line = f"{name} {marks[name]:.6f}\n"
+            if out == "-":
+                sys.stdout.write(line)
+                sys.stdout.flush()
+            else:
+                with open(out, "a") as f:
+                    f.write(line)
+
+    def on_map(event):
+        if event.widget is root:
+            report("window")
+
+    def poll():
+        frames = getattr(app.pages.page(app.pages.current), "frames", None)
+        if frames is not None and frames.rendered:
+            report("data")
+            root.after(0, app._on_close)
+            return
+        root.after(5, poll)
+
+    root.bind("<Map>", on_map, add="+")
+    poll()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="System Monitoring Dashboard")
+    headless.add_arguments(ap)
+    exporter.add_arguments(ap)
+    replay.add_arguments(ap)
+    args = ap.parse_args(argv)
+    if not (args.replay or args.headless):
+        # load the on-disk history before anything (recorder, exporter)
+        # subscribes and starts live samples flowing into the same store
+        enable_persistence()
+    try:
+        playback, _ = replay.setup(get_collector(), args)
+    except (OSError, ValueError) as e:
+        ap.error(str(e))
+    try:
+        if args.headless:
+            return headless.run(args, replay=playback)
+        exporter.start(get_collector(), args)
+    except OSError as e:
+        ap.error(f"cannot serve metrics on port {args.exporter_port}: {e}")
+    if playback is not None:
+        # pages subscribe as they are shown; the replay clock lets them catch up
+        playback.start()
+
+    _load_gui()
+    root = ctk.CTk()
+    # a replay must not end up in (or be mixed with) the on-disk history
+    app = MainApp(root, live=playback is None)
+    if STARTUP_PROBE:
+        _probe_startup(root, app, STARTUP_PROBE)
+    root.mainloop()
+    return 0
 
 
 if __name__ == "__main__":
-    root = ctk.CTk()
-    app = MainApp(root)
-    root.mainloop()
+    sys.exit(main())
@@ -0,0 +1,156 @@
+# modules/adaptive.py
+import threading
+import time
+
+from modules import scheduler
+
+DEFAULT_BUDGET = 2.0       # percent of one core the dashboard may use
+CHECK_INTERVAL = 2.0       # seconds between adjustments
+MAX_INTERVAL = 5.0         # slowest sampling interval, seconds
+UNFOCUSED_FACTOR = 4.0     # background pace relative to the base interval
+IDLE_CPU = 20.0            # system CPU% below which the machine counts as idle
+SLOW_DOWN = 1.5
+SPEED_UP = 1.25
+
+
+class AdaptiveRate:
+    """Keeps the dashboard's own CPU use under a budget.
+
+    Every CHECK_INTERVAL seconds it compares the process CPU time used
+    (time.process_time(): collector, rendering and everything else) with
+    the wall time that passed. Over budget, the collector interval is
+    stretched and every FrameScheduler throttled by the same factor. Well
+    under budget, it speeds back up to the base interval, but only while
+    the window has focus or the machine is idle; otherwise it settles at
+    UNFOCUSED_FACTOR x the base interval.
+
+    check() is driven by the Tk loop (start(root)), but has no Tk calls
+    apart from the focus query, so it can be called from anywhere.
+    """
+
+    def __init__(self, collector, base_interval, budget=DEFAULT_BUDGET, enabled=True):
+        self.collector = collector
+        self.base_interval = base_interval
+        self.budget = budget
+        self.enabled = enabled
+        self.interval = base_interval
+        self.overhead = 0.0           # % of one core, last window
+        self.tick_cost_ms = 0.0       # CPU ms per collector tick, last window
+        self.focused = True
+        self._root = None
+        self._job = None
+        self._lock = threading.Lock()
+        self._mark()
+        self._apply()
+
+    def _mark(self):
+        self._cpu = time.process_time()
+        self._wall = time.monotonic()
+        self._ticks = self.collector.ticks
+
+    # -------- configuration (Settings page)
+    def configure(self, base_interval=None, budget=None, enabled=None):
+        with self._lock:
+            if base_interval is not None:
+                self.base_interval = base_interval
+            if budget is not None:
+                self.budget = budget
+            if enabled is not None:
+                self.enabled = enabled
+            # start over from the base pace
+            self.interval = self.base_interval
+            self._mark()
+            self._apply()
+
+    # -------- control loop
+    def start(self, root):
+        self._root = root
+        self._job = root.after(int(CHECK_INTERVAL * 1000), self._poll)
+
+    def stop(self):
+        """Stop adjusting and hand back the base interval and frame rates."""
+        if self._job is not None:
+            try:
+                self._root.after_cancel(self._job)
+            except Exception:
+                pass   # root already destroyed
+            self._job = None
+        self.collector.set_interval(self.base_interval)
+        scheduler.set_throttle(1.0)
+
+    def _poll(self):
+        try:
+            self.focused = self._root.focus_displayof() is not None
+        except Exception:
+            self.focused = True
+        self.check()
+        self._job = self._root.after(int(CHECK_INTERVAL * 1000), self._poll)
+
+    def check(self):
+        with self._lock:
+            cpu, wall, ticks = time.process_time(), time.monotonic(), self.collector.ticks
+            used = cpu - self._cpu
+            elapsed = wall - self._wall
+            if elapsed <= 0:
+                return
+            self.overhead = used / elapsed * 100.0
+            if ticks > self._ticks:
+                self.tick_cost_ms = used * 1000.0 / (ticks - self._ticks)
+            self._mark()
+            if not self.enabled:
+                return
+
+            latest = self.collector.latest("performance")
+            idle = latest is not None and latest.cpu < IDLE_CPU
+            floor = self.base_interval
+            if not (self.focused or idle):
+                floor *= UNFOCUSED_FACTOR
+
+            interval = self.interval
+            if self.overhead > self.budget:
+                interval *= SLOW_DOWN
+            elif self.overhead < self.budget / 2:
+                interval /= SPEED_UP
+            # never faster than the floor allows, never slower than MAX_INTERVAL
+            interval = min(MAX_INTERVAL, max(floor, interval))
+            if interval != self.interval:
+                self.interval = interval
+                self._apply()
+
+    def _apply(self):
+        interval = self.interval if self.enabled else self.base_interval
+        self.collector.set_interval(interval)
+        scheduler.set_throttle(interval / self.base_interval)
+
+    def status(self):
+        return {"interval": self.interval, "overhead": self.overhead,
+                "tick_cost_ms": self.tick_cost_ms, "budget": self.budget,
+                "enabled": self.enabled, "focused": self.focused}
+
+
+_controller = None
+
+
+def get_controller():
+    """The app-wide controller, or None when rate control isn't running."""
+    return _controller
+
+
+def start(root, collector, settings):
+    """Create the controller from SettingsManager values and attach it to Tk,
+    replacing (and stopping) any earlier one."""
+    global _controller
+    stop()
+    _controller = AdaptiveRate(collector, float(settings.get_setting("update_interval", 0.25)),
+                               float(settings.get_setting("cpu_budget", DEFAULT_BUDGET)),
+                               bool(settings.get_setting("adaptive_rate", True)))
+    _controller.start(root)
+    return _controller
+
+
+def stop():
+    """Stop the app-wide controller, if any (the window is closing)."""
+    global _controller
+    if _controller is not None:
+        _controller.stop()
+        _controller = None
@@ -0,0 +1,206 @@
+# modules/collector.py
+import logging
+import threading
+import time
+
+from modules import profiling
+
+TICK_INTERVAL = 0.25  # seconds
+HISTORY_RETENTION = 3600  # seconds of performance samples kept in memory
+PERSIST_RETENTION = 24 * 3600  # seconds of performance samples kept on disk
+CORE_RETENTION = 120  # seconds of per-core samples kept in memory
+
+log = logging.getLogger(__name__)
+
+
+class Collector:
+    """Single sampling thread shared by every page.
+
+    Each registered source is sampled once per tick (only while somebody is
+    subscribed to it) and the resulting immutable snapshot is handed to all of
+    that source's subscribers. Callbacks run on the collector thread, so pages
+    must hop back to Tk themselves.
+    """
+
+    def __init__(self, interval=TICK_INTERVAL):
+        self.interval = interval
+        self._sources = {}       # name -> callable returning a snapshot
+        self._subscribers = {}   # name -> tuple of callbacks
+        self._latest = {}
+        self._stores = {}        # name -> stores fed with every snapshot
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._nudge = threading.Event()   # cuts the current sleep short
+        self._thread = None
+        self.ticks = 0           # completed sampling ticks
+        self._broken_stores = set()   # ids of stores whose failure was logged
+
+    def add_source(self, name, sample_fn):
+        """Register (or replace) a source: any callable, usually a MetricSource."""
+        with self._lock:
+            old = self._sources.get(name)
+            self._sources[name] = sample_fn
+            self._subscribers.setdefault(name, ())
+        if old is not None and hasattr(old, "close"):
+            old.close()
+
+    def source(self, name):
+        return self._sources.get(name)
+
+    def add_store(self, name, store):
+        """Append every snapshot of source `name` to `store` before it is published."""
+        with self._lock:
+            self._stores[name] = self._stores.get(name, ()) + (store,)
+
+    def store(self, name, kind=None):
+        """First store attached to `name` (of type `kind`, if given)."""
+        for store in self._stores.get(name, ()):
+            if kind is None or isinstance(store, kind):
+                return store
+        return None
+
+    def subscribe(self, name, callback):
+        with self._lock:
+            if name not in self._sources:
+                raise KeyError(f"unknown source: {name}")
+            self._subscribers[name] = self._subscribers[name] + (callback,)
+            self._wake.set()
+        self._ensure_thread()
+        return callback
+
+    def unsubscribe(self, name, callback):
+        with self._lock:
+            subs = self._subscribers.get(name, ())
+            self._subscribers[name] = tuple(cb for cb in subs if cb != callback)
+
+    def set_interval(self, interval):
+        """Change the tick interval; a long sleep in progress is cut short."""
+        self.interval = interval
+        self._nudge.set()
+
+    def latest(self, name):
+        return self._latest.get(name)
+
+    # -------- sampling thread
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="collector", daemon=True)
+            self._thread.start()
+
+    def _active(self):
+        with self._lock:
+            active = [(name, self._sources[name], subs)
+                      for name, subs in self._subscribers.items() if subs]
+            if not active:
+                self._wake.clear()
+            return active
+
+    def _run(self):
+        while True:
+            active = self._active()
+            if not active:
+                # nothing to do until the next subscribe()
+                self._wake.wait()
+                continue
+
+            start = time.monotonic()
+            for name, sample_fn, subs in active:
+                t0 = profiling.start()
+                try:
+                    snapshot = sample_fn()
+                except Exception:
+                    continue
+                profiling.stop("sample." + name, t0)
+                self._latest[name] = snapshot
+                t0 = profiling.start()
+                for store in self._stores.get(name, ()):
+                    try:
+                        store.append(snapshot)
+                    except Exception:
+                        # one bad store must not stop sampling for everyone;
+                        # log it once, not on every tick
+                        if id(store) not in self._broken_stores:
+                            self._broken_stores.add(id(store))
+                            log.exception("%s store %s failed to append a sample",
+                                          name, type(store).__name__)
+                profiling.stop("store." + name, t0)
+                for cb in subs:
+                    t0 = profiling.start()
+                    try:
+                        cb(snapshot)
+                    except Exception:
+                        pass
+                    profiling.stop("publish." + name, t0)
+
+            self.ticks += 1
+            elapsed = time.monotonic() - start
+            if self._nudge.wait(max(0.0, self.interval - elapsed)):
+                self._nudge.clear()
+
+
+_collector = None
+_collector_lock = threading.Lock()
+_ring = None
+
+
+def get_collector():
+    """Return the process-wide collector with the default sources registered."""
+    global _collector
+    with _collector_lock:
+        if _collector is None:
+            from modules.performance import backend as perf_backend
+            from modules.processes import backend as proc_backend
+            from modules.timeseries import TimeSeriesStore, MatrixRing, np
+            from modules.rollup import Rollups
+
+            _collector = Collector()
+            _collector.add_source("performance", perf_backend.PerformanceSource())
+            _collector.add_store("performance", TimeSeriesStore.for_retention(
+                perf_backend.METRICS, HISTORY_RETENTION, _collector.interval))
+            _collector.add_store("performance", Rollups(perf_backend.METRICS))
+            _collector.add_source("processes", proc_backend.ProcessSource())
+            _collector.add_source("cores", perf_backend.CoreSource())
+            _collector.add_source("devices", perf_backend.DeviceSource())
+            if np is not None:
+                _collector.add_store("cores", MatrixRing(
+                    perf_backend.core_count(), int(CORE_RETENTION / _collector.interval)))
+        return _collector
+
+
+def enable_persistence(path=None, retention=PERSIST_RETENTION):
+    """Mirror every performance sample into a memory-mapped ring file and
+    preload the in-memory history from what earlier runs left there.
+
+    Keeps the performance source sampling while the app runs, so history has
+    no gaps when the Performance page is not shown. Call it before anything
+    subscribes to "performance": history can only go in front of an empty
+    store, so once live samples are in, the preload is skipped. Returns the
+    RingFile, or None when the file can't be used (e.g. another instance
+    holds it).
+    """
+    global _ring
+    import atexit
+    from modules.ringfile import RingFile, default_path
+    from modules.rollup import Rollups
+
+    collector = get_collector()
+    with _collector_lock:
+        if _ring is not None:
+            return _ring
+        store = collector.store("performance")
+        try:
+            ring = RingFile(path or default_path(), store.columns,
+                            int(retention / collector.interval))
+        except OSError:
+            return None
+        now = time.time()
+        # older rows after newer ones would break every ts-ordered reader
+        if not len(store):
+            store.extend(ring.tail(store.capacity, since=now - store.capacity * collector.interval))
+            rollups = collector.store("performance", Rollups)
+            if rollups is not None:
+                rollups.extend(ring.tail(since=now - max(t.retention for t in rollups.tiers)))
+        _ring = ring
+    collector.subscribe("performance", ring.append)
+    atexit.register(ring.close)
+    return ring
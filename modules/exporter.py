@@ -0,0 +1,194 @@
+# modules/exporter.py
+"""Prometheus / OpenMetrics text endpoint: python main.py --exporter-port 9101
+
+Serves the latest collector samples at /metrics. Each collector callback
+only formats its own section; the first scrape after a tick joins and
+gzips them once, and every other scrape until the next tick copies those
+bytes. Scrapers never trigger psutil calls, a tick nobody scrapes costs
+no serialisation, and many concurrent scrapers cost next to nothing.
+"""
+import gzip
+import heapq
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_TOP = 10
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# PerfSample field -> (metric name, help)
+PERF_METRICS = (
+    ("cpu", "sysmon_cpu_usage_percent", "System-wide CPU utilisation."),
+    ("ram", "sysmon_memory_usage_percent", "Physical memory in use."),
+    ("disk", "sysmon_disk_usage_percent", "Root filesystem usage."),
+    ("gpu", "sysmon_gpu_usage_percent", "GPU utilisation (0 when unavailable)."),
+    ("gpu_mem", "sysmon_gpu_memory_usage_percent", "GPU memory in use (0 when unavailable)."),
+    ("net_down", "sysmon_network_receive_kilobytes_per_second", "Network receive rate (last interval)."),
+    ("net_up", "sysmon_network_transmit_kilobytes_per_second", "Network transmit rate (last interval)."),
+)
+
+
+def add_arguments(parser):
+    group = parser.add_argument_group("Prometheus exporter")
+    group.add_argument("--exporter-port", type=int, default=None,
+                       help="serve /metrics on this port (off by default)")
+    group.add_argument("--exporter-host", default=DEFAULT_HOST,
+                       help="address to bind (default %(default)s)")
+    group.add_argument("--exporter-top", type=int, default=DEFAULT_TOP,
+                       help="processes exported per scrape, by CPU (default %(default)s)")
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_performance(sample):
+    lines = []
+    for field, name, help_text in PERF_METRICS:
+        lines.append(f"# HELP {name} {help_text}\n# TYPE {name} gauge\n"
+                     f"{name} {getattr(sample, field):.3f}\n")
+    lines.append("# HELP sysmon_last_sample_timestamp_seconds Time of the latest sample.\n"
+                 "# TYPE sysmon_last_sample_timestamp_seconds gauge\n"
+                 f"sysmon_last_sample_timestamp_seconds {sample.ts:.3f}\n")
+    return "".join(lines)
+
+
+# DiskRate / NicRate field -> (metric name, help)
+DISK_METRICS = (
+    ("read_bps", "sysmon_disk_read_bytes_per_second", "Per-disk read rate."),
+    ("write_bps", "sysmon_disk_write_bytes_per_second", "Per-disk write rate."),
+    ("read_iops", "sysmon_disk_reads_per_second", "Per-disk completed reads."),
+    ("write_iops", "sysmon_disk_writes_per_second", "Per-disk completed writes."),
+    ("busy", "sysmon_disk_busy_percent", "Share of time the disk had I/O in flight."),
+)
+NIC_METRICS = (
+    ("rx_bps", "sysmon_interface_receive_bytes_per_second", "Per-interface receive rate."),
+    ("tx_bps", "sysmon_interface_transmit_bytes_per_second", "Per-interface transmit rate."),
+)
+
+
+def format_devices(sample):
+    lines = []
+    for rows, label, metrics in ((sample.disks, "device", DISK_METRICS),
+                                 (sample.nics, "interface", NIC_METRICS)):
+        for field, name, help_text in metrics:
+            lines.append(f"# HELP {name} {help_text}\n# TYPE {name} gauge\n")
+            for row in rows:
+                lines.append(f'{name}{{{label}="{_label(row.name)}"}} {getattr(row, field):.1f}\n')
+    return "".join(lines)
+
+
+def format_processes(rows, top):
+    busiest = heapq.nlargest(top, rows, key=lambda p: p.cpu)
+    cpu = ["# HELP sysmon_process_cpu_percent CPU use of the busiest processes (100 = one core).\n"
+           "# TYPE sysmon_process_cpu_percent gauge\n"]
+    mem = ["# HELP sysmon_process_memory_percent Physical memory share of the busiest processes.\n"
+           "# TYPE sysmon_process_memory_percent gauge\n"]
+    for p in busiest:
+        labels = f'pid="{p.pid}",name="{_label(p.name)}",user="{_label(p.user)}"'
+        cpu.append(f"sysmon_process_cpu_percent{{{labels}}} {p.cpu:.1f}\n")
+        mem.append(f"sysmon_process_memory_percent{{{labels}}} {p.mem:.3f}\n")
+    return (f"# HELP sysmon_processes Number of processes.\n# TYPE sysmon_processes gauge\n"
+            f"sysmon_processes {len(rows)}\n" + "".join(cpu) + "".join(mem))
+
+
+class MetricsExporter:
+    """Collector subscriber that keeps a ready-to-send /metrics response."""
+
+    def __init__(self, collector, host=DEFAULT_HOST, port=9101, top=DEFAULT_TOP):
+        self.collector = collector
+        self.top = top
+        self._perf_text = ""
+        self._proc_text = ""
+        self._dev_text = ""
+        self._response = None     # (plain bytes, gzipped bytes), swapped atomically
+        self._dirty = False       # a section changed since _response was built
+        self._build_lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self.address = self._server.server_address
+        self._thread = None
+
+    def start(self):
+        self.collector.subscribe("performance", self._on_performance)
+        self.collector.subscribe("devices", self._on_devices)
+        if self.top > 0:
+            self.collector.subscribe("processes", self._on_processes)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="exporter",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.collector.unsubscribe("performance", self._on_performance)
+        self.collector.unsubscribe("devices", self._on_devices)
+        self.collector.unsubscribe("processes", self._on_processes)
+        self._server.shutdown()
+        self._server.server_close()
+
+    # -------- collector thread: format each section once per tick
+    def _on_performance(self, sample):
+        self._perf_text = format_performance(sample)
+        self._dirty = True
+
+    def _on_devices(self, sample):
+        self._dev_text = format_devices(sample)
+        self._dirty = True
+
+    def _on_processes(self, rows):
+        self._proc_text = format_processes(rows, self.top)
+        self._dirty = True
+
+    # -------- HTTP threads: encode and gzip at most once per tick
+    def response(self):
+        """(plain, gzipped) body of the latest samples, or None before the first."""
+        if self._dirty:
+            with self._build_lock:
+                if self._dirty:
+                    self._dirty = False
+                    body = (self._perf_text + self._dev_text + self._proc_text).encode()
+                    self._response = (body, gzip.compress(body, compresslevel=1))
+        return self._response
+
+    # -------- HTTP
+    def _handler(self):
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self._send(404, b"try /metrics\n", "text/plain")
+                    return
+                response = exporter.response()
+                if response is None:
+                    self._send(503, b"no samples yet\n", "text/plain")
+                    return
+                plain, packed = response
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    self._send(200, packed, CONTENT_TYPE, encoding="gzip")
+                else:
+                    self._send(200, plain, CONTENT_TYPE)
+
+            def _send(self, status, body, content_type, encoding=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                if encoding:
+                    self.send_header("Content-Encoding", encoding)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def start(collector, args):
+    """Start the exporter from parsed arguments; None when it isn't enabled."""
+    if not args.exporter_port:
+        return None
+    return MetricsExporter(collector, args.exporter_host, args.exporter_port,
+                           args.exporter_top).start()
@@ -0,0 +1,282 @@
+# modules/headless.py
+"""Display-less collector: python main.py --headless
+
+Runs the shared sampling engine without Tk or matplotlib and streams
+performance samples and the top-N processes (by CPU) to stdout or to
+size-rotated files, as JSON lines or CSV.
+"""
+import csv
+import heapq
+import io
+import json
+import os
+import signal
+import sys
+import threading
+import time
+
+from modules import exporter
+from modules.collector import get_collector
+
+DEFAULT_INTERVAL = 1.0     # seconds between samples
+DEFAULT_TOP = 10           # processes per snapshot (0 = none)
+FLUSH_INTERVAL = 5.0       # seconds between buffer flushes
+BUFFER_SIZE = 64 * 1024
+PROC_FIELDS = ("ts", "rank", "pid", "name", "user", "cpu", "mem")
+
+
+def add_arguments(parser):
+    group = parser.add_argument_group("headless mode")
+    group.add_argument("--headless", action="store_true",
+                       help="collect without a window and stream the samples")
+    group.add_argument("--interval", type=float, default=DEFAULT_INTERVAL,
+                       help="seconds between samples (default %(default)s)")
+    group.add_argument("--top", type=int, default=DEFAULT_TOP,
+                       help="processes per snapshot, by CPU; 0 disables (default %(default)s)")
+    group.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    group.add_argument("--output", default="-",
+                       help="directory for rotating files, or - for stdout (default)")
+    group.add_argument("--rotate-mb", type=float, default=16.0,
+                       help="start a new file after this many MB (default %(default)s)")
+    group.add_argument("--keep", type=int, default=10,
+                       help="rotated files kept per stream (default %(default)s)")
+    group.add_argument("--duration", type=float, default=None,
+                       help="stop after this many seconds (default: run until interrupted)")
+
+
+# --------------------------------------------------
+# OUTPUTS
+# --------------------------------------------------
+class RotatingFile:
+    """Buffered text file that rolls over to a new timestamped file once
+    it exceeds max_bytes, keeping the newest `keep` files."""
+
+    def __init__(self, directory, stem, ext, max_bytes, keep, header=None):
+        self.directory = directory
+        self.stem = stem
+        self.ext = ext
+        self.max_bytes = max_bytes
+        self.keep = keep
+        self.header = header
+        os.makedirs(directory, exist_ok=True)
+        self._f = None
+        self._size = 0
+        self._open()
+
+    def _open(self):
+        name = f"{self.stem}-{time.strftime('%Y%m%d-%H%M%S')}.{self.ext}"
+        path = os.path.join(self.directory, name)
+        n = 1
+        while os.path.exists(path):   # several rotations within one second
+            path = os.path.join(self.directory, f"{name[:-len(self.ext) - 1]}-{n}.{self.ext}")
+            n += 1
+        self._f = open(path, "w", buffering=BUFFER_SIZE, newline="")
+        self._size = 0
+        if self.header:
+            self.write(self.header)
+        self._prune()
+
+    def _prune(self):
+        prefix = self.stem + "-"
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith(prefix) and entry.name.endswith("." + self.ext):
+                files.append((entry.stat().st_mtime_ns, entry.path))
+        files.sort()
+        for _, old in files[:-self.keep] if self.keep > 0 else ():
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+    def write(self, text):
+        self._f.write(text)
+        self._size += len(text)
+        if self._size >= self.max_bytes:
+            self._f.close()
+            self._open()
+
+    def flush(self):
+        self._f.flush()
+
+    def close(self):
+        self._f.close()
+
+
+class StdoutStream:
+    """stdout through a large buffer; `header` is written once."""
+
+    def __init__(self, header=None):
+        self._f = io.TextIOWrapper(io.BufferedWriter(io.FileIO(os.dup(sys.stdout.fileno()), "w"),
+                                                     BUFFER_SIZE), newline="")
+        if header:
+            self._f.write(header)
+
+    def write(self, text):
+        self._f.write(text)
+
+    def flush(self):
+        self._f.flush()
+
+    def close(self):
+        self._f.close()
+
+
+# --------------------------------------------------
+# ENCODING
+# --------------------------------------------------
+def _csv_line(values):
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerow(values)
+    return buf.getvalue()
+
+
+class Encoder:
+    """Turns samples into text lines. JSON lines carry a "type" field;
+    CSV on a shared stream (stdout) gets the type as its first column."""
+
+    def __init__(self, fmt, perf_fields, shared):
+        self.fmt = fmt
+        self.shared = shared
+        self.perf_fields = perf_fields
+        self._dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+    def header(self, kind):
+        if self.fmt != "csv":
+            return None
+        fields = self.perf_fields if kind == "metrics" else PROC_FIELDS
+        return _csv_line((("type",) if self.shared else ()) + tuple(fields))
+
+    def metrics(self, sample):
+        values = [round(v, 3) for v in sample]
+        if self.fmt == "csv":
+            return _csv_line((["metrics"] if self.shared else []) + values)
+        record = {"type": "metrics"}
+        record.update(zip(self.perf_fields, values))
+        return self._dumps(record) + "\n"
+
+    def processes(self, ts, rows):
+        if self.fmt == "csv":
+            lead = ["processes"] if self.shared else []
+            return "".join(_csv_line(lead + [ts, rank, p.pid, p.name, p.user, p.cpu, round(p.mem, 2)])
+                           for rank, p in enumerate(rows, 1))
+        return self._dumps({"type": "processes", "ts": ts,
+                            "top": [{"pid": p.pid, "name": p.name, "user": p.user,
+                                     "cpu": p.cpu, "mem": round(p.mem, 2)} for p in rows]}) + "\n"
+
+
+# --------------------------------------------------
+# RUNNER
+# --------------------------------------------------
+class HeadlessRunner:
+    """Subscribes to the collector and writes every sample.
+
+    Callbacks run on the collector thread and only format and append to
+    an in-memory buffer; the buffer goes to the OS every FLUSH_INTERVAL
+    seconds (and on stop), so each tick costs one sample plus a few
+    string operations.
+    """
+
+    def __init__(self, args, collector=None):
+        from modules.performance.backend import PerfSample
+
+        self.collector = collector or get_collector()
+        if not getattr(args, "replay", None):
+            # a replay runs at the recording's pace instead
+            self.collector.interval = args.interval
+        self.top = max(0, args.top)
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self.stopped = threading.Event()
+
+        shared = args.output == "-"
+        self.encoder = Encoder(args.format, PerfSample._fields, shared)
+        if shared:
+            # metrics and processes interleave on one stream
+            header = self.encoder.header("metrics") or ""
+            if self.top:
+                header += self.encoder.header("processes") or ""
+            self.metrics_out = self.procs_out = StdoutStream(header)
+        else:
+            ext = "jsonl" if args.format == "jsonl" else "csv"
+            max_bytes = int(args.rotate_mb * 1024 * 1024)
+            self.metrics_out = RotatingFile(args.output, "metrics", ext, max_bytes, args.keep,
+                                            self.encoder.header("metrics"))
+            self.procs_out = RotatingFile(args.output, "processes", ext, max_bytes, args.keep,
+                                          self.encoder.header("processes")) if self.top else None
+
+    def start(self):
+        self.collector.subscribe("performance", self._on_metrics)
+        if self.top:
+            self.collector.subscribe("processes", self._on_processes)
+
+    def stop(self):
+        self.collector.unsubscribe("performance", self._on_metrics)
+        self.collector.unsubscribe("processes", self._on_processes)
+        with self._lock:
+            for out in {self.metrics_out, self.procs_out} - {None}:
+                try:
+                    out.flush()
+                    out.close()
+                except (OSError, ValueError):
+                    pass
+            self.metrics_out = self.procs_out = None
+        self.stopped.set()
+
+    # -------- collector thread
+    def _on_metrics(self, sample):
+        self._write("metrics_out", self.encoder.metrics(sample))
+
+    def _on_processes(self, rows):
+        top = heapq.nlargest(self.top, rows, key=lambda p: p.cpu)
+        # a process list has no timestamp of its own; a replay knows the recorded one
+        ts = getattr(self.collector.source("processes"), "ts", None)
+        if ts is None:
+            ts = time.time()
+        self._write("procs_out", self.encoder.processes(round(ts, 3), top))
+
+    def _write(self, attr, text):
+        with self._lock:
+            out = getattr(self, attr)
+            if out is None:
+                return
+            try:
+                out.write(text)
+                now = time.monotonic()
+                if now - self._last_flush >= FLUSH_INTERVAL:
+                    for o in {self.metrics_out, self.procs_out} - {None}:
+                        o.flush()
+                    self._last_flush = now
+            except (BrokenPipeError, ValueError):
+                # reader went away (e.g. piped into head)
+                self.stopped.set()
+
+
+def run(args, replay=None):
+    """Stream until interrupted, --duration elapses or `replay` (a
+    modules.replay.Replay, started here once everything has subscribed)
+    has finished."""
+    runner = HeadlessRunner(args)
+    finished = replay.finished if replay is not None else None
+
+    def on_signal(signum, frame):
+        runner.stopped.set()
+    signal.signal(signal.SIGINT, on_signal)
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, on_signal)
+
+    runner.start()
+    metrics = exporter.start(runner.collector, args)
+    if replay is not None:
+        replay.start()
+    deadline = None if args.duration is None else time.monotonic() + args.duration
+    while not runner.stopped.wait(0.2):
+        if finished is not None and finished.is_set():
+            time.sleep(runner.collector.interval)   # let the last samples through
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+    if metrics is not None:
+        metrics.stop()
+    runner.stop()
+    return 0
@@ -0,0 +1,96 @@
+# modules/pages.py
+import importlib
+import threading
+
+import customtkinter as ctk
+from modules import styles
+
+
+class PageManager:
+    """Builds each page once and swaps them in the content area.
+
+    Every page lives in its own container frame; navigating away only
+    pack_forget()s the container, so widgets, figures and scroll/selection
+    state survive. Pages may define on_show() / on_hide() to resume and
+    pause their data subscriptions; a hidden page should schedule nothing.
+
+    A page can be registered as a "package.module:Class" string, in which
+    case its module is only imported the first time the page is shown.
+    """
+
+    def __init__(self, content):
+        self.content = content
+        self._factories = {}   # name -> callable(container) returning the page
+        self._pages = {}       # name -> (container, page)
+        self.current = None
+
+    def register(self, name, factory):
+        """factory: callable(container) or a lazy "package.module:Class" string."""
+        self._factories[name] = factory
+
+    def _factory(self, name):
+        factory = self._factories[name]
+        if isinstance(factory, str):
+            module, _, attr = factory.partition(":")
+            factory = self._factories[name] = getattr(importlib.import_module(module), attr)
+        return factory
+
+    def page(self, name):
+        entry = self._pages.get(name)
+        return entry[1] if entry else None
+
+    def show(self, name):
+        if name == self.current:
+            return self.page(name)
+        self.hide_current()
+
+        entry = self._pages.get(name)
+        if entry is None:
+            container = ctk.CTkFrame(self.content, fg_color=styles.BG_MAIN, corner_radius=0)
+            container.pack(fill="both", expand=True)
+            entry = self._pages[name] = (container, self._factory(name)(container))
+        else:
+            entry[0].pack(fill="both", expand=True)
+
+        self.current = name
+        _call(entry[1], "on_show")
+        return entry[1]
+
+    def hide_current(self):
+        entry = self._pages.get(self.current)
+        self.current = None
+        if entry is None:
+            return
+        _call(entry[1], "on_hide")
+        entry[0].pack_forget()
+
+    def close(self):
+        """Stop every page (app shutdown)."""
+        self.hide_current()
+        for container, page in self._pages.values():
+            _call(page, "stop_updates")
+            container.destroy()
+        self._pages.clear()
+
+
+def _call(page, hook):
+    fn = getattr(page, hook, None)
+    if fn is not None:
+        fn()
+
+
+def preload(*modules):
+    """Import modules on a daemon thread so a later first use doesn't pay for it.
+
+    An import racing with the same import on the Tk thread just waits for
+    it (module imports are serialised), so this is never slower.
+    """
+    def run():
+        for name in modules:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass
+    thread = threading.Thread(target=run, name="preload", daemon=True)
+    thread.start()
+    return thread
@@ -1,11 +1,31 @@
 # modules/performance/backend.py
 import psutil
+import os
 import platform
 import time
+import collections
+from modules.sources import MetricSource
+
+# one immutable sample of every system-wide metric, taken in the same tick
+PerfSample = collections.namedtuple(
+    "PerfSample", "ts cpu ram disk gpu gpu_mem net_down net_up")
+METRICS = PerfSample._fields[1:]
+# per-core CPU% of one tick (a separate source: only sampled while shown)
+CoreSample = collections.namedtuple("CoreSample", "ts cores")
+# per-device rates of one tick: tuples of DiskRate / NicRate, busiest first
+DeviceSample = collections.namedtuple("DeviceSample", "ts disks nics")
+DiskRate = collections.namedtuple("DiskRate", "name read_bps write_bps read_iops write_iops busy")
+NicRate = collections.namedtuple("NicRate", "name rx_bps tx_bps")
 
 def get_cpu_percent():
     return psutil.cpu_percent(interval=None)
 
+def get_per_core_percent():
+    return psutil.cpu_percent(interval=None, percpu=True)
+
+def core_count():
+    return psutil.cpu_count() or 1
+
 def get_ram_percent():
     return psutil.virtual_memory().percent
 
@@ -16,15 +36,139 @@ def get_disk_percent(path="/"):
         return 0.0
 
 def get_network_delta(prev):
+    """Receive / transmit rate in KB/s since the previous call (0 on the first).
+
+    Divided by the time that actually passed, so the values stay per second
+    when the sampling interval changes.
+    """
     io = psutil.net_io_counters()
+    now = time.monotonic()
     sent = io.bytes_sent
     recv = io.bytes_recv
-    down_kb = max(0.0, (recv - prev.get("recv", recv)) / 1024.0)
-    up_kb = max(0.0, (sent - prev.get("sent", sent)) / 1024.0)
+    dt = now - prev["ts"] if "ts" in prev else 0.0
+    down_kb = up_kb = 0.0
+    if dt > 0:
+        down_kb = max(0.0, (recv - prev["recv"]) / 1024.0 / dt)
+        up_kb = max(0.0, (sent - prev["sent"]) / 1024.0 / dt)
     prev["recv"] = recv
     prev["sent"] = sent
+    prev["ts"] = now
     return down_kb, up_kb
 
+_DISK_NAMES = {}   # device name -> whether it is a whole disk
+
+def _is_disk(name):
+    """Whole disks only: partitions, loop and ram devices would double count."""
+    ok = _DISK_NAMES.get(name)
+    if ok is None:
+        if name.startswith(("loop", "ram", "zram")):
+            ok = False
+        elif os.path.isdir("/sys/block"):
+            ok = os.path.isdir(os.path.join("/sys/block", name.replace("/", "!")))
+        else:
+            ok = True
+        _DISK_NAMES[name] = ok
+    return ok
+
+def make_device_sampler():
+    """Return a callable producing one DeviceSample per call.
+
+    Each call reads all disk and NIC counters with one psutil call apiece
+    and turns them into per-second rates against the previous call in a
+    single pass; the first call only primes the counters.
+    """
+    prev = {"ts": None, "disks": {}, "nics": {}}
+
+    def sample():
+        now = time.monotonic()
+        try:
+            disks = psutil.disk_io_counters(perdisk=True) or {}
+        except Exception:
+            disks = {}
+        try:
+            nics = psutil.net_io_counters(pernic=True) or {}
+        except Exception:
+            nics = {}
+        dt = now - prev["ts"] if prev["ts"] is not None else 0.0
+
+        disk_rates = []
+        prev_disks = prev["disks"]
+        for name, c in disks.items():
+            if not _is_disk(name):
+                continue
+            old = prev_disks.get(name)
+            if old is not None and dt > 0:
+                busy = getattr(c, "busy_time", 0) - getattr(old, "busy_time", 0)
+                disk_rates.append(DiskRate(
+                    name,
+                    max(0.0, (c.read_bytes - old.read_bytes) / dt),
+                    max(0.0, (c.write_bytes - old.write_bytes) / dt),
+                    max(0.0, (c.read_count - old.read_count) / dt),
+                    max(0.0, (c.write_count - old.write_count) / dt),
+                    min(100.0, max(0.0, busy / (dt * 10.0)))))   # busy_time is in ms
+        nic_rates = []
+        prev_nics = prev["nics"]
+        for name, c in nics.items():
+            old = prev_nics.get(name)
+            if name == "lo" or old is None or dt <= 0:
+                continue
+            nic_rates.append(NicRate(name, max(0.0, (c.bytes_recv - old.bytes_recv) / dt),
+                                     max(0.0, (c.bytes_sent - old.bytes_sent) / dt)))
+
+        prev["ts"], prev["disks"], prev["nics"] = now, disks, nics
+        disk_rates.sort(key=lambda d: d.read_bps + d.write_bps, reverse=True)
+        nic_rates.sort(key=lambda n: n.rx_bps + n.tx_bps, reverse=True)
+        return DeviceSample(time.time(), tuple(disk_rates), tuple(nic_rates))
+
+    return sample
+
 def get_gpu_metrics_placeholder():
     # GPU not available: return zeros
     return 0.0, 0.0
+
+def make_sampler():
+    """Return a callable producing one PerfSample per call (used by the collector)."""
+    prev_net = {}
+
+    def sample():
+        cpu = get_cpu_percent()
+        ram = get_ram_percent()
+        disk = get_disk_percent()
+        down, up = get_network_delta(prev_net)
+        gpu, gpu_mem = get_gpu_metrics_placeholder()
+        return PerfSample(time.time(), cpu, ram, disk, gpu, gpu_mem, down, up)
+
+    return sample
+
+
+class PerformanceSource(MetricSource):
+    """Live system-wide metrics: one PerfSample per call."""
+
+    name = "performance"
+
+    def __init__(self):
+        self._sample = make_sampler()
+
+    def sample(self):
+        return self._sample()
+
+
+class CoreSource(MetricSource):
+    """Live per-core CPU%: one CoreSample per call."""
+
+    name = "cores"
+
+    def sample(self):
+        return CoreSample(time.time(), tuple(get_per_core_percent()))
+
+
+class DeviceSource(MetricSource):
+    """Live per-disk and per-NIC rates: one DeviceSample per call."""
+
+    name = "devices"
+
+    def __init__(self):
+        self._sample = make_device_sampler()
+
+    def sample(self):
+        return self._sample()
@@ -0,0 +1,205 @@
+# modules/performance/graphs.py
+import numpy as np
+from matplotlib.lines import Line2D
+from matplotlib.patches import Polygon
+from modules import styles, profiling
+
+
+class _BlitGraph:
+    """Frame drawing shared by the graph types.
+
+    When the canvas supports it, frames are drawn by restoring a cached
+    background and blitting only the animated artists; the full figure is
+    redrawn only on resize or when the axes have to change.
+    """
+
+    def __init__(self, ax, canvas, blit=True):
+        self.ax = ax
+        self.canvas = canvas
+        self.blit = blit and getattr(canvas, "supports_blit", False)
+        self._bg = None
+        self._needs_full_draw = True
+
+    def _connect(self):
+        if self.blit:
+            self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    # -------- blitting
+    def _on_draw(self, event):
+        self._bg = self.canvas.copy_from_bbox(self.ax.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        raise NotImplementedError
+
+    def set_xlim(self, lo, hi):
+        if self.ax.get_xlim() != (lo, hi):
+            self.ax.set_xlim(lo, hi)
+            self._needs_full_draw = True
+
+    def draw(self):
+        t0 = profiling.start()
+        if not self.blit or self._needs_full_draw or self._bg is None:
+            self._needs_full_draw = False
+            self.canvas.draw()   # draw_event re-captures the background
+            profiling.stop("graph.full_draw", t0)
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_artists()
+        self.canvas.blit(self.ax.bbox)
+        profiling.stop("graph.blit", t0)
+
+    def invalidate(self):
+        """Force a full redraw on the next frame (e.g. after a resize)."""
+        self._needs_full_draw = True
+
+
+class LineGraph(_BlitGraph):
+    """Persistent line + gradient-fill artists for one axes.
+
+    Artists are created once and updated in place; a full redraw happens
+    only on resize or when the y-range has to change.
+    """
+
+    def __init__(self, ax, canvas, series, capacity, ylim=None, legend=None, blit=True):
+        super().__init__(ax, canvas, blit)
+        self.capacity = capacity
+        self.fixed_ylim = ylim
+
+        self.x = np.arange(capacity, dtype=float)
+        ax.set_xlim(0, capacity - 1)
+        ax.set_ylim(*(ylim or (0, 1)))
+
+        self.lines = []
+        self.fills = []
+        self._verts = []
+        for color, alpha in series:
+            line = Line2D([], [], color=color, linewidth=styles.GRAPH_LINEWIDTH, animated=self.blit)
+            ax.add_line(line)
+            # top edge (capacity points) + bottom-right, bottom-left and closing vertex
+            verts = np.zeros((capacity + 3, 2))
+            fill = Polygon(verts, closed=True, facecolor=color, alpha=alpha,
+                           linewidth=0, animated=self.blit)
+            ax.add_patch(fill)
+            self.lines.append(line)
+            self.fills.append(fill)
+            # Polygon keeps our array as its path vertices, so edit that in place
+            self._verts.append(fill.get_path().vertices)
+
+        self.legend = None
+        if legend:
+            self.legend = ax.legend(self.lines, legend, facecolor=styles.CARD_BG,
+                                    labelcolor=styles.TEXT_PRIMARY, loc="upper left")
+            self.legend.set_animated(self.blit)
+
+        self._connect()
+
+    def _draw_artists(self):
+        ax = self.ax
+        for fill in self.fills:
+            ax.draw_artist(fill)
+        for line in self.lines:
+            ax.draw_artist(line)
+        if self.legend is not None:
+            ax.draw_artist(self.legend)
+
+    # -------- data
+    def update(self, *ys, x=None):
+        """ys: one sequence per series, oldest sample first. x: shared x values,
+        a list with one array per series, or None for 0..n-1."""
+        xs = x if isinstance(x, (list, tuple)) else [x] * len(ys)
+        cap = self.capacity
+        peak = 0.0
+        for y, xv, line, verts in zip(ys, xs, self.lines, self._verts):
+            n = min(len(y), cap)
+            if n == 0:
+                verts[:] = 0.0
+                line.set_data(self.x[:0], self.x[:0])
+                continue
+            if len(y) > n:
+                y = y[-n:]
+                xv = xv[-n:] if xv is not None else None
+            if xv is None:
+                xv = self.x[:n]
+            top = verts[:cap]
+            top[:n, 0] = xv
+            top[:n, 1] = y
+            top[n:] = top[n - 1]
+            verts[cap] = (top[n - 1, 0], 0.0)
+            verts[cap + 1] = (top[0, 0], 0.0)
+            verts[cap + 2] = top[0]
+            line.set_data(top[:n, 0], top[:n, 1])
+            if self.fixed_ylim is None:
+                peak = max(peak, float(top[:n, 1].max()))
+
+        if self.fixed_ylim is None:
+            self._rescale(peak)
+        self.draw()
+
+    def _rescale(self, peak):
+        # only move the y-range when the data leaves it (or shrinks well below),
+        # so the cached background stays valid for most frames
+        lo, hi = self.ax.get_ylim()
+        if peak > hi or (hi > 1 and peak < hi / 4):
+            self.ax.set_ylim(0, _nice_ceiling(peak))
+            self._needs_full_draw = True
+
+
+class HeatmapGraph(_BlitGraph):
+    """Rows x time heatmap (one row per CPU core) drawn as a single image.
+
+    A frame is one set_data() on one AxesImage, which matplotlib resamples
+    to the axes' pixel size, so drawing 256 cores costs about the same as
+    drawing 4.
+    """
+
+    def __init__(self, ax, canvas, rows, columns, seconds, cmap="inferno", vmax=100.0, blit=True):
+        super().__init__(ax, canvas, blit)
+        self.columns = columns
+        self.seconds = seconds
+        self._frame = np.zeros((rows, columns))
+        self._step = seconds / columns
+        self.image = ax.imshow(self._frame, aspect="auto", interpolation="nearest", origin="lower",
+                               cmap=cmap, vmin=0.0, vmax=vmax, animated=self.blit,
+                               extent=(-seconds, 0, -0.5, rows - 0.5))
+        self._connect()
+
+    def _draw_artists(self):
+        self.ax.draw_artist(self.image)
+
+    def update(self, ts, rows, now, max_gap=5.0):
+        """ts / rows: sample times and a (samples x cores) matrix, oldest first.
+
+        Each of the `columns` time slots over the last `seconds` shows the
+        latest sample at or before it, so the x axis stays in seconds when
+        the sampling interval changes. Slots with no sample in the previous
+        max_gap seconds stay blank.
+        """
+        frame = self._frame
+        width = rows.shape[1] if rows.ndim == 2 else frame.shape[0]
+        if width != frame.shape[0]:
+            frame = self._frame = np.zeros((width, self.columns))
+            self.image.set_extent((-self.seconds, 0, -0.5, width - 0.5))
+            self._needs_full_draw = True
+        if len(ts):
+            slots = now - self.seconds + self._step * np.arange(1, self.columns + 1)
+            idx = ts.searchsorted(slots, side="right") - 1
+            valid = idx >= 0
+            idx[~valid] = 0
+            valid &= slots - ts[idx] <= max_gap
+            frame[:] = rows[idx].T
+            frame[:, ~valid] = 0.0
+        else:
+            frame[:] = 0.0
+        self.image.set_data(frame)
+        self.draw()
+
+
+def _nice_ceiling(value):
+    if value <= 1:
+        return 1.0
+    mag = 10 ** np.floor(np.log10(value))
+    for step in (1, 2, 5, 10):
+        if step * mag >= value:
+            return float(step * mag)
+    return float(10 * mag)
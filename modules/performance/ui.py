@@ -1,38 +1,63 @@
 # modules/performance/ui.py
 import customtkinter as ctk
-import matplotlib
-matplotlib.use("TkAgg")
-import matplotlib.pyplot as plt
+# Figure + the Tk canvas directly: pyplot (and its backend machinery) is never loaded
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import threading
+from matplotlib.figure import Figure
+from matplotlib.ticker import FuncFormatter
 import time
 from modules import styles
-from modules.performance import backend as perf_backend
-import collections
+from modules.collector import get_collector
+from modules.performance.graphs import LineGraph, HeatmapGraph
+from modules.rollup import Rollups, lttb_columns
+from modules.scheduler import FrameScheduler
 
-UPDATE_INTERVAL = 0.25  # seconds
+# redraw only the changed artists over a cached background (False = full canvas.draw())
+BLIT_GRAPHS = True
+MAX_FPS = 4  # redraw cap, independent of the collector tick
+
+# selectable time ranges (label, seconds)
+WINDOWS = (("30s", 30), ("5m", 300), ("1h", 3600), ("24h", 86400))
+MAX_POINTS = 2000         # most points a graph ever draws (LTTB target <= pixel width)
+MAX_SOURCE_POINTS = 4000  # raw samples beyond this come from a rollup tier instead
+HEATMAP_SECONDS = 60      # per-core heatmap span, independent of the selected window
+HEATMAP_COLUMNS = 240     # time slots across the heatmap
+TOP_DEVICES = 3           # disks / interfaces listed on the device cards
+
+
+def _fmt_ago(seconds, pos=None):
+    seconds = -seconds
+    if seconds <= 0:
+        return "now"
+    if seconds < 120:
+        return f"-{seconds:.0f}s"
+    if seconds < 7200:
+        return f"-{seconds / 60:.0f}m"
+    return f"-{seconds / 3600:.0f}h"
+
+
+def _fmt_rate(bps):
+    for unit in ("B/s", "KB/s", "MB/s"):
+        if bps < 1024:
+            return f"{bps:.0f} {unit}" if unit == "B/s" else f"{bps:.1f} {unit}"
+        bps /= 1024.0
+    return f"{bps:.1f} GB/s"
 
 class PerformanceUI:
     def __init__(self, parent):
         self.parent = parent
         self.running = True
 
-        self.prev_net = {"sent": 0, "recv": 0}
-
-        # fixed length buffers (60 samples)
-        self.maxlen = 120  # keep a bit more since we update every .25s -> 30s = 120
-        self.cpu_hist = collections.deque(maxlen=self.maxlen)
-        self.ram_hist = collections.deque(maxlen=self.maxlen)
-        self.disk_hist = collections.deque(maxlen=self.maxlen)
-        self.gpu_hist = collections.deque(maxlen=self.maxlen)
-        self.gpu_mem_hist = collections.deque(maxlen=self.maxlen)
-        self.net_down_hist = collections.deque(maxlen=self.maxlen)
-        self.net_up_hist = collections.deque(maxlen=self.maxlen)
+        self.window = WINDOWS[0][1]
+        # history lives in the collector's shared stores and outlives the page
+        self.collector = get_collector()
+        self.history = self.collector.store("performance")
+        self.rollups = self.collector.store("performance", Rollups)
+        self._lttb_cache = {}
+        self.cores = self.collector.store("cores")
 
         self._build_ui()
-        # start background updater
-        self.updater_thread = threading.Thread(target=self._update_loop, daemon=True)
-        self.updater_thread.start()
+        self.frames = FrameScheduler(self.parent, self._refresh_ui, max_fps=MAX_FPS)
+        self._subscribe()
 
     def _build_ui(self):
         self.parent.configure(fg_color=styles.BG_MAIN)
@@ -44,6 +69,11 @@ class PerformanceUI:
                      text_color=styles.TEXT_PRIMARY).pack(side="left")
         ctk.CTkLabel(header, text="System Resource Monitoring", font=ctk.CTkFont(size=12),
                      text_color=styles.NEON_ORANGE).pack(side="left", padx=10)
+        self.window_selector = ctk.CTkSegmentedButton(header, values=[label for label, _ in WINDOWS],
+                                                      command=self._set_window,
+                                                      selected_color=styles.NEON_ORANGE)
+        self.window_selector.set(WINDOWS[0][0])
+        self.window_selector.pack(side="right")
 
         # Top metric cards (CPU, RAM, DISK, NET)
         top = ctk.CTkFrame(self.parent, fg_color=styles.BG_MAIN)
@@ -54,6 +84,13 @@ class PerformanceUI:
         self.val_disk = self._create_value_card(top, "DISK", styles.NEON_YELLOW)
         self.val_net = self._create_value_card(top, "NET", styles.NEON_CYAN)
 
+        # busiest disks and interfaces (text rows, not a graph per device)
+        devices = ctk.CTkFrame(self.parent, fg_color=styles.BG_MAIN)
+        devices.pack(fill="x", padx=16, pady=(0,6))
+        self.val_disks = self._create_device_card(devices, "Disks", styles.NEON_YELLOW)
+        self.val_nics = self._create_device_card(devices, "Interfaces", styles.NEON_CYAN)
+        self._devices_shown = None
+
         # Graph grid
         grid = ctk.CTkFrame(self.parent, fg_color=styles.BG_MAIN)
         grid.pack(fill="both", expand=True, padx=16, pady=(6,16))
@@ -64,7 +101,13 @@ class PerformanceUI:
         self.card_ram = self._create_graph_card(grid, "Memory Usage", 0, 1, styles.NEON_BLUE)
         self.card_gpu_mem = self._create_graph_card(grid, "GPU Memory", 1, 0, styles.NEON_PINK)
         self.card_gpu_usage = self._create_graph_card(grid, "GPU Usage", 1, 1, styles.NEON_PURPLE)
-        self.card_cpu = self._create_graph_card(grid, "CPU Usage", 2, 0, styles.NEON_ORANGE, colspan=2)
+        if self.cores is not None:
+            self.card_cpu = self._create_graph_card(grid, "CPU Usage", 2, 0, styles.NEON_ORANGE)
+            self.card_cores = self._create_graph_card(grid, f"CPU Cores (last {HEATMAP_SECONDS}s)", 2, 1,
+                                                      styles.NEON_ORANGE, heatmap=True)
+        else:
+            self.card_cpu = self._create_graph_card(grid, "CPU Usage", 2, 0, styles.NEON_ORANGE, colspan=2)
+            self.card_cores = None
         self.card_net = self._create_graph_card(grid, "Network I/O", 3, 0, styles.NEON_CYAN, colspan=2, multi=True)
 
     def _create_value_card(self, parent, title, accent):
@@ -77,7 +120,17 @@ class PerformanceUI:
         val.pack(anchor="w", padx=12, pady=(4,12))
         return val
 
-    def _create_graph_card(self, parent, title, r, c, color, colspan=1, multi=False):
+    def _create_device_card(self, parent, title, accent):
+        frame = ctk.CTkFrame(parent, fg_color=styles.CARD_BG, corner_radius=styles.CORNER_RADIUS)
+        frame.pack(side="left", expand=True, fill="both", padx=8, pady=4)
+        ctk.CTkLabel(frame, text=title, text_color=styles.TEXT_PRIMARY,
+                     font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w", padx=12, pady=(8,0))
+        val = ctk.CTkLabel(frame, text="—", text_color=accent, justify="left", anchor="w",
+                           font=ctk.CTkFont(family="Courier", size=12))
+        val.pack(anchor="w", fill="x", padx=12, pady=(4,10))
+        return val
+
+    def _create_graph_card(self, parent, title, r, c, color, colspan=1, multi=False, heatmap=False):
         card = ctk.CTkFrame(parent, fg_color=styles.CARD_BG, corner_radius=styles.CORNER_RADIUS)
         card.grid(row=r, column=c, columnspan=colspan, sticky="nsew", padx=8, pady=8)
         # title
@@ -85,105 +138,155 @@ class PerformanceUI:
                          font=ctk.CTkFont(size=16, weight="bold"))
         t.pack(anchor="w", padx=10, pady=(10,4))
 
-        fig = plt.Figure(figsize=(6,2.4), dpi=100)
+        fig = Figure(figsize=(6,2.4), dpi=100)
         ax = fig.add_subplot(111)
         ax.set_facecolor(styles.CARD_BG)
         fig.patch.set_facecolor(styles.CARD_BG)
         ax.tick_params(colors="white", labelsize=9)
         for spine in ax.spines.values():
             spine.set_color("#222225")
-
-        if multi:
-            # network has two lines
-            line_down, = ax.plot([], [], color=styles.NEON_CYAN, linewidth=styles.GRAPH_LINEWIDTH)
-            line_up, = ax.plot([], [], color=styles.NEON_LIME, linewidth=styles.GRAPH_LINEWIDTH)
-            legend = ax.legend(["Download KB/s", "Upload KB/s"], facecolor=styles.CARD_BG, labelcolor=styles.TEXT_PRIMARY)
-        else:
-            line, = ax.plot([], [], color=color, linewidth=styles.GRAPH_LINEWIDTH)
-            line_down = line_up = None
+        ax.xaxis.set_major_formatter(FuncFormatter(_fmt_ago))
 
         canvas = FigureCanvasTkAgg(fig, master=card)
         canvas.get_tk_widget().pack(fill="both", expand=True, padx=8, pady=(6,10))
 
+        if heatmap:
+            # one image row per core; y ticks are core numbers
+            graph = HeatmapGraph(ax, canvas, self.cores.width, HEATMAP_COLUMNS, HEATMAP_SECONDS,
+                                 blit=BLIT_GRAPHS)
+            ax.yaxis.get_major_locator().set_params(integer=True)
+            return {"card": card, "ax": ax, "fig": fig, "canvas": canvas, "color": color,
+                    "graph": graph, "multi": False}
+        if multi:
+            # network has two lines and rescales its y-range as traffic changes
+            graph = LineGraph(ax, canvas, [(styles.NEON_CYAN, 0.12), (styles.NEON_LIME, 0.08)], MAX_POINTS,
+                              legend=["Download KB/s", "Upload KB/s"], blit=BLIT_GRAPHS)
+        else:
+            graph = LineGraph(ax, canvas, [(color, 0.12)], MAX_POINTS, ylim=(0, 100), blit=BLIT_GRAPHS)
+        graph.set_xlim(-self.window, 0)
+
         return {"card": card, "ax": ax, "fig": fig, "canvas": canvas, "color": color,
-                "line": line if not multi else None, "line_down": line_down, "line_up": line_up, "multi": multi}
-
-    # -------- update loop in background thread (collect samples)
-    def _update_loop(self):
-        while self.running:
-            try:
-                cpu = perf_backend.get_cpu_percent()
-                ram = perf_backend.get_ram_percent()
-                disk = perf_backend.get_disk_percent()
-                down, up = perf_backend.get_network_delta(self.prev_net)
-                gpu, gpu_mem = perf_backend.get_gpu_metrics_placeholder()
-
-                # append
-                self.cpu_hist.append(cpu)
-                self.ram_hist.append(ram)
-                self.disk_hist.append(disk)
-                self.gpu_hist.append(gpu)
-                self.gpu_mem_hist.append(gpu_mem)
-                self.net_down_hist.append(down)
-                self.net_up_hist.append(up)
-
-                # schedule UI update on main thread
-                self.parent.after(0, self._refresh_ui)
-            except Exception:
-                pass
-
-            time.sleep(UPDATE_INTERVAL)
+                "graph": graph, "multi": multi}
+
+    def _subscribe(self):
+        self.collector.subscribe("performance", self._on_sample)
+        if self.cores is not None:
+            # per-core sampling only runs while someone is listening
+            self.collector.subscribe("cores", self._on_sample)
+        self.collector.subscribe("devices", self._on_sample)
+
+    # -------- called on the collector thread for every sample
+    def _on_sample(self, sample):
+        # the collector already appended the sample to self.history;
+        # schedule UI update on main thread (coalesced)
+        self.frames.request()
+
+    def _set_window(self, label):
+        self.window = dict(WINDOWS)[label]
+        self._lttb_cache.clear()
+        self.frames.request()
+
+    def _window_series(self, columns, width):
+        """{column: (x, y)} for the selected window, x in seconds before now.
+
+        Short windows read raw samples; longer ones read the averages of the
+        finest rollup tier that covers them. Anything with more points than
+        the graph has pixels is reduced with LTTB, all columns in one
+        vectorised call (cached per tier version, since tiers only change
+        once per bucket).
+        """
+        window = self.window
+        now = time.time()
+        # the sampling interval may change at run time (adaptive rate), so
+        # windows are cut by timestamp rather than by sample count
+        interval = max(self.collector.interval, 1e-3)
+        if window / interval <= MAX_SOURCE_POINTS or self.rollups is None:
+            source, n = self.history, None
+        else:
+            tier = self.rollups.pick(window, MAX_SOURCE_POINTS)
+            source, n = tier.avg, int(window / tier.bucket) + 1
+
+        target = min(width, MAX_POINTS)
+        key = (id(source), source.version, window, target)
+        cached = self._lttb_cache.get(key)
+        if cached is None:
+            views = source.views(["ts"] + list(columns), n=n)
+            first = int(views["ts"].searchsorted(now - window))
+            ts = views["ts"][first:]
+            ys = [views[col][first:] for col in columns]
+            if len(ts) > target:
+                idx = lttb_columns(ts, ys, target)
+                cached = {col: (ts[i], y[i]) for col, y, i in zip(columns, ys, idx)}
+            else:
+                cached = dict(zip(columns, ((ts, y) for y in ys)))
+            if source is not self.history:
+                # raw samples change every tick; only tier results are worth keeping
+                self._lttb_cache = {key: cached}
+        return {col: (ts - now, y) for col, (ts, y) in cached.items()}
 
     def _refresh_ui(self):
+        if not self.running or not len(self.history):
+            return
+
         # update numeric cards
-        if self.cpu_hist:
-            self.val_cpu.configure(text=f"{self.cpu_hist[-1]:.1f}%")
-        if self.ram_hist:
-            self.val_ram.configure(text=f"{self.ram_hist[-1]:.1f}%")
-        if self.disk_hist:
-            self.val_disk.configure(text=f"{self.disk_hist[-1]:.1f}%")
-        if self.net_down_hist:
-            self.val_net.configure(text=f"{self.net_down_hist[-1]:.1f} KB/s")
-
-        # update graphs
-        self._draw_line(self.card_cpu, list(self.cpu_hist), styles.NEON_ORANGE)
-        self._draw_line(self.card_ram, list(self.ram_hist), styles.NEON_BLUE)
-        self._draw_line(self.card_disk, list(self.disk_hist), styles.NEON_YELLOW)
-        # GPU placeholders (zero or flat)
-        self._draw_line(self.card_gpu_usage, list(self.gpu_hist), styles.NEON_PURPLE)
-        self._draw_line(self.card_gpu_mem, list(self.gpu_mem_hist), styles.NEON_PINK)
+        latest = self.history.latest
+        self.val_cpu.configure(text=f"{latest('cpu'):.1f}%")
+        self.val_ram.configure(text=f"{latest('ram'):.1f}%")
+        self.val_disk.configure(text=f"{latest('disk'):.1f}%")
+        self.val_net.configure(text=f"{latest('net_down'):.1f} KB/s")
+
+        # update graphs (persistent artists, blitted)
+        width = max(50, int(self.card_cpu["ax"].bbox.width))
+        h = self._window_series(("cpu", "ram", "disk", "gpu", "gpu_mem", "net_down", "net_up"), width)
+        for card, col in ((self.card_cpu, "cpu"), (self.card_ram, "ram"), (self.card_disk, "disk"),
+                          # GPU placeholders (zero or flat)
+                          (self.card_gpu_usage, "gpu"), (self.card_gpu_mem, "gpu_mem")):
+            x, y = h[col]
+            card["graph"].set_xlim(-self.window, 0)
+            card["graph"].update(y, x=x)
         # network multi line
-        self._draw_network(self.card_net, list(self.net_down_hist), list(self.net_up_hist))
+        (xd, down), (xu, up) = h["net_down"], h["net_up"]
+        self.card_net["graph"].set_xlim(-self.window, 0)
+        self.card_net["graph"].update(down, up, x=[xd, xu])
 
-    def _draw_line(self, card, data, color):
-        ax = card["ax"]
-        ax.clear()
-        ax.set_facecolor(styles.CARD_BG)
-        ax.tick_params(colors="white", labelsize=9)
-        for spine in ax.spines.values():
-            spine.set_color("#222225")
-        if not data:
-            data = [0]
-        x = range(len(data))
-        ax.plot(x, data, color=color, linewidth=styles.GRAPH_LINEWIDTH)
-        # gradient
-        ax.fill_between(x, data, [0]*len(data), color=color, alpha=0.12)
-        card["canvas"].draw()
-
-    def _draw_network(self, card, down, up):
-        ax = card["ax"]
-        ax.clear()
-        ax.set_facecolor(styles.CARD_BG)
-        ax.tick_params(colors="white", labelsize=9)
-        for spine in ax.spines.values():
-            spine.set_color("#222225")
-        x = range(len(down))
-        ax.plot(x, down, color=styles.NEON_CYAN, linewidth=styles.GRAPH_LINEWIDTH)
-        ax.plot(x, up, color=styles.NEON_LIME, linewidth=styles.GRAPH_LINEWIDTH)
-        ax.fill_between(x, down, [0]*len(down), color=styles.NEON_CYAN, alpha=0.12)
-        ax.fill_between(x, up, [0]*len(up), color=styles.NEON_LIME, alpha=0.08)
-        ax.legend(["Download KB/s", "Upload KB/s"], facecolor=styles.CARD_BG, labelcolor=styles.TEXT_PRIMARY)
-        card["canvas"].draw()
+        self._refresh_devices()
 
-    def stop_updates(self):
+        if self.card_cores is not None and len(self.cores):
+            ts, rows = self.cores.window()
+            self.card_cores["graph"].update(ts, rows, time.time())
+
+    def _refresh_devices(self):
+        sample = self.collector.latest("devices")
+        if sample is None or sample is self._devices_shown:
+            return
+        self._devices_shown = sample
+        disks = [f"{d.name:<10} R {_fmt_rate(d.read_bps):>10}  W {_fmt_rate(d.write_bps):>10}"
+                 f"  {d.read_iops + d.write_iops:>6.0f} IOPS  {d.busy:>3.0f}% busy"
+                 for d in sample.disks[:TOP_DEVICES]]
+        nics = [f"{n.name:<10} ↓ {_fmt_rate(n.rx_bps):>10}  ↑ {_fmt_rate(n.tx_bps):>10}"
+                for n in sample.nics[:TOP_DEVICES]]
+        self.val_disks.configure(text="\n".join(disks) or "no disk counters")
+        self.val_nics.configure(text="\n".join(nics) or "no interface counters")
+
+    # -------- page lifecycle (PageManager)
+    def on_show(self):
+        if self.running:
+            return
+        self.running = True
+        for card in (self.card_cpu, self.card_ram, self.card_disk, self.card_gpu_usage,
+                     self.card_gpu_mem, self.card_net, self.card_cores):
+            if card is not None:
+                card["graph"].invalidate()
+        self._subscribe()
+        # catch up with what was sampled while hidden without waiting a tick
+        self.frames.request()
+
+    def on_hide(self):
         self.running = False
+        self.collector.unsubscribe("performance", self._on_sample)
+        self.collector.unsubscribe("cores", self._on_sample)
+        self.collector.unsubscribe("devices", self._on_sample)
+
+    def stop_updates(self):
+        self.on_hide()
+        self.frames.close()
@@ -0,0 +1,211 @@
+# modules/processes/actions.py
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import psutil
+
+DEFAULT_TIMEOUT = 3.0   # seconds a terminated process gets before SIGKILL
+PROTECTED_PIDS = (0, 1)  # the idle task / init are never targets
+ACTIONS = ("terminate", "kill", "suspend", "resume", "renice")
+_DONE = {"terminate": "Ended", "kill": "Killed", "suspend": "Suspended",
+         "resume": "Resumed", "renice": "Reniced"}
+
+
+class ActionResult:
+    """Outcome of one batch, summed over all of its processes."""
+
+    def __init__(self, action, requested):
+        self.action = action
+        self.requested = requested
+        self.done = 0
+        self.escalated = 0      # terminated processes that needed a kill
+        self.gone = 0           # had exited before we got to them
+        self.failed = {}        # reason -> count
+        self.elapsed = 0.0
+
+    def fail(self, reason):
+        self.failed[reason] = self.failed.get(reason, 0) + 1
+
+    @property
+    def ok(self):
+        return not self.failed
+
+    def summary(self):
+        parts = [f"{_DONE[self.action]} {self.done} process{'es' if self.done != 1 else ''}"]
+        if self.escalated:
+            parts[0] += f" ({self.escalated} killed after the timeout)"
+        if self.gone:
+            parts.append(f"{self.gone} already gone")
+        if self.failed:
+            parts.append(", ".join(f"{n} failed: {reason}" for reason, n in self.failed.items()))
+        parts.append(f"{self.elapsed:.2f} s")
+        return "  ·  ".join(parts)
+
+
+class ProcessActions:
+    """Runs bulk process actions off the Tk thread.
+
+    submit() returns at once; the batch runs on a single worker thread
+    (batches execute in order) and on_done(ActionResult) is called there
+    when it has finished, with every failure counted in one result instead
+    of reported per process.
+
+    Targets are (pid, create_time) keys, so a PID that was reused since
+    the table showed it is skipped. With tree=True every descendant is
+    included; for terminate and kill the whole set is suspended first
+    (then looked over once more for children forked meanwhile), so a fork
+    storm cannot replace what is being killed. terminate sends SIGTERM,
+    waits up to `timeout` for the processes to exit and kills what is
+    left. This process, PID 0 and init are never targets.
+    """
+
+    def __init__(self, on_done=None):
+        self.on_done = on_done
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="actions")
+        self._lock = threading.Lock()
+        self.pending = 0
+
+    def submit(self, action, keys, tree=False, timeout=DEFAULT_TIMEOUT, nice=None):
+        if action not in ACTIONS:
+            raise ValueError(f"unknown action {action!r}")
+        with self._lock:
+            self.pending += 1
+        return self._executor.submit(self._run, action, list(keys), tree, timeout, nice)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # -------- worker thread
+    def _run(self, action, keys, tree, timeout, nice):
+        start = time.monotonic()
+        result = ActionResult(action, len(keys))
+        try:
+            procs = self._resolve(keys, result)
+            if tree:
+                procs = self._with_children(procs)
+            getattr(self, "_" + action)(procs, result, tree, timeout, nice)
+        finally:
+            result.elapsed = time.monotonic() - start
+            with self._lock:
+                self.pending -= 1
+        if self.on_done is not None:
+            self.on_done(result)
+        return result
+
+    def _resolve(self, keys, result):
+        procs = []
+        own = os.getpid()
+        for pid, create_time in keys:
+            if pid == own or pid in PROTECTED_PIDS:
+                result.fail("protected")
+                continue
+            try:
+                proc = psutil.Process(pid)
+                if create_time is not None and abs(proc.create_time() - create_time) > 1.0:
+                    raise psutil.NoSuchProcess(pid)
+                procs.append(proc)
+            except psutil.NoSuchProcess:
+                result.gone += 1
+            except psutil.AccessDenied:
+                result.fail("access denied")
+        return procs
+
+    def _with_children(self, procs):
+        """procs plus all their descendants, from one scan of the process list
+        (Process.children() would rescan it for every process)."""
+        children = {}
+        for proc in psutil.process_iter(["ppid"]):
+            children.setdefault(proc.info["ppid"], []).append(proc)
+        found = {p.pid: p for p in procs}
+        todo = list(found)
+        own = os.getpid()
+        while todo:
+            for child in children.get(todo.pop(), ()):
+                if child.pid not in found and child.pid != own:
+                    found[child.pid] = child
+                    todo.append(child.pid)
+        return list(found.values())
+
+    def _apply(self, procs, method, result=None, *args):
+        """Call proc.method(*args) on each process; returns the ones it worked on."""
+        done = []
+        for proc in procs:
+            try:
+                getattr(proc, method)(*args)
+                done.append(proc)
+            except psutil.NoSuchProcess:
+                if result is not None:
+                    result.gone += 1
+            except psutil.AccessDenied:
+                if result is not None:
+                    result.fail("access denied")
+            except (psutil.Error, OSError) as e:
+                if result is not None:
+                    result.fail(type(e).__name__)
+        return done
+
+    def _freeze(self, procs):
+        """Suspend a subtree, then once more for anything it forked meanwhile."""
+        stopped = self._apply(procs, "suspend")
+        known = {p.pid for p in procs}
+        late = [p for p in self._with_children(stopped) if p.pid not in known]
+        return procs + late, stopped + self._apply(late, "suspend")
+
+    # -------- actions
+    def _terminate(self, procs, result, tree, timeout, nice):
+        stopped = []
+        if tree and len(procs) > 1:
+            procs, stopped = self._freeze(procs)
+        signalled = self._apply(procs, "terminate", result)
+        # SIGTERM stays pending on a stopped process until it continues
+        self._apply(stopped, "resume")
+        alive = wait_exit(signalled, timeout)
+        killed = self._apply(alive, "kill", result)
+        wait_exit(killed, 1.0)
+        result.escalated = len(killed)
+        result.done = len(signalled)
+
+    def _kill(self, procs, result, tree, timeout, nice):
+        if tree and len(procs) > 1:
+            procs, _ = self._freeze(procs)
+        killed = self._apply(procs, "kill", result)
+        wait_exit(killed, 1.0)
+        result.done = len(killed)
+
+    def _suspend(self, procs, result, tree, timeout, nice):
+        result.done = len(self._apply(procs, "suspend", result))
+
+    def _resume(self, procs, result, tree, timeout, nice):
+        result.done = len(self._apply(procs, "resume", result))
+
+    def _renice(self, procs, result, tree, timeout, nice):
+        result.done = len(self._apply(procs, "nice", result, nice))
+
+
+def _running(proc):
+    try:
+        return proc.is_running() and proc.status() != psutil.STATUS_ZOMBIE
+    except psutil.Error:
+        return False
+
+
+def wait_exit(procs, timeout):
+    """Wait up to `timeout` seconds for procs to exit; returns the ones still running.
+
+    Like psutil.wait_procs(), but a zombie counts as exited: a process we
+    didn't start stays a zombie until its own parent reaps it, and
+    wait_procs() would wait out the whole timeout for it.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    alive = list(procs)
+    while alive:
+        alive = [p for p in alive if _running(p)]
+        remaining = deadline - time.monotonic()
+        if not alive or remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.1)
+    return alive
@@ -1,6 +1,12 @@
 # modules/processes/backend.py
 import psutil
 import threading
+from modules.processes.table import ProcessTable
+from modules.processes import procfs
+from modules.sources import MetricSource
+
+# read /proc directly on Linux; psutil everywhere else or when /proc is unusable
+USE_PROCFS = True
 
 def fetch_all_processes():
     procs = []
@@ -20,3 +26,34 @@ def fetch_in_thread(callback):
     t = threading.Thread(target=worker, daemon=True)
     t.start()
     return t
+
+def make_sampler():
+    """Return a callable producing a tuple of ProcRow per call (used by the collector)."""
+    if USE_PROCFS and procfs.available():
+        scanner = procfs.ProcfsScanner()
+        fallback = []
+
+        def sample():
+            if fallback:
+                return fallback[0]()
+            try:
+                return scanner.update()
+            except OSError:
+                # e.g. /proc unmounted or hidepid; switch to psutil for good
+                fallback.append(ProcessTable().update)
+                return fallback[0]()
+
+        return sample
+    return ProcessTable().update
+
+
+class ProcessSource(MetricSource):
+    """Live process list: a tuple of ProcRow per call."""
+
+    name = "processes"
+
+    def __init__(self):
+        self._sample = make_sampler()
+
+    def sample(self):
+        return self._sample()
@@ -0,0 +1,157 @@
+# modules/processes/details.py
+import collections
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import psutil
+
+CACHED_PROCESSES = 32   # processes whose details are kept after deselecting
+
+
+def _memory(proc):
+    info = proc.memory_full_info()   # USS/PSS need a walk of the page tables
+    return {field: getattr(info, field) for field in ("rss", "vms", "uss", "pss", "swap")
+            if hasattr(info, field)}
+
+
+def _io(proc):
+    io = proc.io_counters()
+    return {"read_bytes": io.read_bytes, "write_bytes": io.write_bytes,
+            "read_count": io.read_count, "write_count": io.write_count}
+
+
+def _open_files(proc):
+    return [f.path for f in proc.open_files()]
+
+
+def _connections(proc):
+    conns = proc.net_connections() if hasattr(proc, "net_connections") else proc.connections()
+    return [(c.status, f"{c.laddr.ip}:{c.laddr.port}" if c.laddr else "",
+             f"{c.raddr.ip}:{c.raddr.port}" if c.raddr else "") for c in conns]
+
+
+# (attribute, seconds a fetched value stays fresh, fetch)
+ATTRIBUTES = (
+    ("exe", 300.0, lambda p: p.exe()),
+    ("cmdline", 300.0, lambda p: " ".join(p.cmdline())),
+    ("cwd", 30.0, lambda p: p.cwd()),
+    ("status", 2.0, lambda p: p.status()),
+    ("nice", 10.0, lambda p: p.nice()),
+    ("threads", 5.0, lambda p: p.num_threads()),
+    ("memory", 5.0, _memory),
+    ("io", 2.0, _io),
+    ("open_files", 10.0, _open_files),
+    ("connections", 10.0, _connections),
+)
+
+
+class ProcessDetails:
+    """Fetches the expensive attributes of one process at a time, off the
+    Tk thread.
+
+    select(key) switches to another (pid, create_time) and queues a fetch
+    on a single worker thread; refresh() re-fetches whatever has outlived
+    its TTL. Each fetch runs inside psutil's oneshot() and skips attributes
+    still fresh in the cache. A newer select() cancels a queued fetch and
+    makes a running one stop before its next attribute, so results for a
+    row the user already left are never delivered.
+
+    on_result(key, details) is called on the worker thread with a dict of
+    attribute -> value; unreadable attributes map to psutil.AccessDenied
+    and "gone" is True once the process has exited. After the first result
+    for a selection, it is only called again when something was re-fetched.
+    """
+
+    def __init__(self, on_result):
+        self.on_result = on_result
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="details")
+        self._lock = threading.Lock()
+        self._cache = collections.OrderedDict()   # key -> {attribute: (fetched_at, value)}
+        self._generation = 0
+        self._key = None
+        self._future = None
+        self._delivered = None    # generation whose first result went out
+
+    @property
+    def key(self):
+        return self._key
+
+    def select(self, key):
+        with self._lock:
+            self._generation += 1
+            self._key = key
+            if self._future is not None:
+                self._future.cancel()
+                self._future = None
+        if key is not None:
+            self._submit()
+
+    def refresh(self):
+        """Fetch expired attributes of the selected process, unless a fetch is pending."""
+        with self._lock:
+            busy = self._future is not None and not self._future.done()
+        if self._key is not None and not busy:
+            self._submit()
+
+    def _submit(self):
+        with self._lock:
+            if self._key is None:
+                return
+            try:
+                self._future = self._executor.submit(self._fetch, self._key, self._generation)
+            except RuntimeError:
+                self._future = None   # closed
+
+    def close(self):
+        with self._lock:
+            self._generation += 1
+            self._key = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # -------- worker thread
+    def _current(self, generation):
+        return generation == self._generation
+
+    def _fetch(self, key, generation):
+        if not self._current(generation):
+            return
+        with self._lock:
+            entry = self._cache.pop(key, None) or {}
+            self._cache[key] = entry
+            while len(self._cache) > CACHED_PROCESSES:
+                self._cache.popitem(last=False)
+
+        pid, create_time = key
+        gone = False
+        fetched = False
+        try:
+            proc = psutil.Process(pid)
+            if abs(proc.create_time() - create_time) > 1.0:
+                raise psutil.NoSuchProcess(pid)   # the PID now belongs to another process
+            now = time.monotonic()
+            with proc.oneshot():
+                for name, ttl, fetch in ATTRIBUTES:
+                    if not self._current(generation):
+                        return
+                    cached = entry.get(name)
+                    if cached is not None and now - cached[0] < ttl:
+                        continue
+                    try:
+                        value = fetch(proc)
+                    except psutil.AccessDenied as e:
+                        value = e
+                    entry[name] = (now, value)
+                    fetched = True
+        except (psutil.NoSuchProcess, psutil.ZombieProcess):
+            gone = True
+        except psutil.Error:
+            pass
+
+        if not (fetched or gone) and self._delivered == generation:
+            return   # all from the cache: nothing new to show
+        if self._current(generation):
+            self._delivered = generation
+            details = {name: value for name, (_, value) in entry.items()}
+            details["gone"] = gone
+            self.on_result(key, details)
@@ -0,0 +1,305 @@
+# modules/processes/groups.py
+from modules.processes.ranking import top_k
+
+RESYNC_UPDATES = 1200   # recompute the sums from scratch this often (float drift)
+MAX_DEPTH = 256         # guards parent walks against PID-reuse cycles
+
+
+class TreeRow:
+    """One row of a grouped table: a group header or a process in a group
+    or tree. Quacks like ProcRow for ranking (pid, name, cpu, mem).
+
+    pid is the process id, or "group:<label>" for a group header; state is
+    None for a leaf, True/False for an expanded/collapsed row with children.
+    key is the process's (pid, create_time), None for a group header.
+    """
+
+    __slots__ = ("key", "pid", "name", "cpu", "mem", "depth", "state", "count")
+
+    def __init__(self, key, pid, name, cpu, mem, depth=0, state=None, count=1):
+        self.key = key
+        self.pid = pid
+        self.name = name
+        self.cpu = cpu
+        self.mem = mem
+        self.depth = depth
+        self.state = state
+        self.count = count
+
+    @property
+    def is_group(self):
+        return not isinstance(self.pid, int)
+
+    def label(self):
+        mark = "" if self.state is None else ("▾ " if self.state else "▸ ")
+        return "    " * self.depth + mark + self.name
+
+
+class _Group:
+    __slots__ = ("label", "cpu", "mem", "members")
+
+    def __init__(self, label):
+        self.label = label
+        self.cpu = 0.0
+        self.mem = 0.0
+        self.members = {}    # key -> ProcRow
+
+
+class ProcessGroups:
+    """Processes grouped by a row attribute (e.g. name or user), with the
+    CPU% and RAM% of each group summed.
+
+    update() diffs each snapshot against the previous one: rows that did
+    not change (the same ProcRow object) are skipped, and every other
+    start, exit or change adjusts its group's sums by the difference, so
+    a tick costs one pass over the list plus O(changes).
+
+    category(row) splits the groups per table (apps / system); a group
+    never mixes categories.
+    """
+
+    def __init__(self, group_of, category):
+        self.group_of = group_of
+        self.category = category
+        self.groups = {}      # (category, label) -> _Group
+        self._rows = {}       # key -> ProcRow
+        self._group = {}      # key -> (category, label)
+        self._updates = 0
+
+    def update(self, rows):
+        self._updates += 1
+        if self._updates % RESYNC_UPDATES == 0:
+            self._rows = {}
+            self._group = {}
+            self.groups = {}
+        old = self._rows
+        fresh = {}
+        groups, member_of, group_of = self.groups, self._group, self.group_of
+        for p in rows:
+            key = p.key
+            fresh[key] = p
+            prev = old.get(key)
+            if prev is p:
+                continue
+            if prev is not None:
+                gkey = member_of[key]
+                if group_of(p) == gkey[1]:
+                    # same group: only the sums move
+                    group = groups[gkey]
+                    group.members[key] = p
+                    group.cpu = max(0.0, group.cpu + p.cpu - prev.cpu)
+                    group.mem = max(0.0, group.mem + p.mem - prev.mem)
+                    continue
+                self._leave(key, prev)
+            self._join(key, p)
+        for key in old.keys() - fresh.keys():
+            self._leave(key, old[key])
+        self._rows = fresh
+
+    def _join(self, key, p):
+        gkey = (self.category(p), self.group_of(p))
+        group = self.groups.get(gkey)
+        if group is None:
+            group = self.groups[gkey] = _Group(gkey[1])
+        group.members[key] = p
+        group.cpu += p.cpu
+        group.mem += p.mem
+        self._group[key] = gkey
+
+    def _leave(self, key, p):
+        gkey = self._group.pop(key)
+        group = self.groups[gkey]
+        del group.members[key]
+        if not group.members:
+            del self.groups[gkey]
+            return
+        group.cpu = max(0.0, group.cpu - p.cpu)
+        group.mem = max(0.0, group.mem - p.mem)
+
+    def flatten(self, category, expanded, k, column, descending, matches=None):
+        """Rows to show for one table: the top k groups by `column`, each
+        followed by its members if its header is in `expanded`. Collapsed
+        groups contribute one row and no per-member work. With a search
+        (`matches`), only matching members and their groups are shown."""
+        heads = []
+        for (cat, label), group in self.groups.items():
+            if cat != category:
+                continue
+            if matches is not None and not any(key in matches for key in group.members):
+                continue
+            gid = f"group:{label}"
+            heads.append(TreeRow(None, gid, label, group.cpu, group.mem,
+                                 state=gid in expanded, count=len(group.members)))
+        out = []
+        for head in top_k(heads, k, column, descending):
+            out.append(head)
+            if head.state:
+                members = self.groups[(category, head.name)].members
+                rows = [p for key, p in members.items() if matches is None or key in matches]
+                out.extend(TreeRow(p.key, p.pid, p.name, p.cpu, p.mem, depth=1)
+                           for p in top_k(rows, None, column, descending))
+        return out
+
+
+class _Node:
+    __slots__ = ("row", "category", "parent", "children", "cpu", "mem")
+
+    def __init__(self, row, category):
+        self.row = row
+        self.category = category
+        self.parent = None       # key of the parent node, None for a root
+        self.children = set()    # keys
+        self.cpu = row.cpu       # subtree sums, this process included
+        self.mem = row.mem
+
+
+class ProcessTree:
+    """Processes as a parent/child tree with CPU% and RAM% summed over
+    each subtree.
+
+    update() diffs snapshots like ProcessGroups. A changed process adds
+    its difference to itself and each ancestor, so a tick costs one pass
+    over the list plus O(changes x depth). A process whose parent is not
+    (yet) known, or belongs to the other table, is a root; when the parent
+    shows up later, or the kernel re-parents it, it is moved and the sums
+    of both ancestor chains are adjusted.
+    """
+
+    def __init__(self, category):
+        self.category = category
+        self.nodes = {}       # key -> _Node
+        self._by_pid = {}     # pid -> key
+        self._waiting = {}    # ppid -> set of keys whose parent isn't known yet
+        self._updates = 0
+
+    def update(self, rows):
+        self._updates += 1
+        if self._updates % RESYNC_UPDATES == 0:
+            self.nodes, self._by_pid, self._waiting = {}, {}, {}
+        nodes = self.nodes
+        seen = set()
+        added = []
+        for p in rows:
+            key = p.key
+            seen.add(key)
+            node = nodes.get(key)
+            if node is None:
+                added.append(p)
+            elif node.row is not p:
+                prev = node.row
+                moved = p.ppid != prev.ppid
+                if moved:
+                    self._detach(key)
+                node.row = p
+                self._add(key, p.cpu - prev.cpu, p.mem - prev.mem)
+                if moved:
+                    self._attach(key)
+        for key in [key for key in nodes if key not in seen]:
+            self._remove(key)
+        # parents first, so most children find theirs on the way
+        for p in sorted(added, key=lambda p: p.create_time):
+            self._insert(p)
+
+    # -------- structure
+    def _insert(self, p):
+        key = p.key
+        self.nodes[key] = _Node(p, self.category(p))
+        self._by_pid[p.pid] = key
+        self._attach(key)
+        for child in self._waiting.pop(p.pid, ()):
+            if child in self.nodes and self.nodes[child].parent is None:
+                self._attach(child)
+
+    def _remove(self, key):
+        node = self.nodes[key]
+        self._detach(key)
+        for child in list(node.children):
+            # orphans stay visible as roots until they are re-parented
+            self._detach(child)
+            self._waiting.setdefault(node.row.pid, set()).add(child)
+        del self.nodes[key]
+        if self._by_pid.get(node.row.pid) == key:
+            del self._by_pid[node.row.pid]
+
+    def _attach(self, key):
+        node = self.nodes[key]
+        ppid = node.row.ppid
+        parent_key = self._by_pid.get(ppid)
+        parent = self.nodes.get(parent_key)
+        if (parent is None or parent.category != node.category
+                or parent.row.create_time > node.row.create_time
+                or self._is_descendant(parent_key, key)):
+            if ppid:
+                self._waiting.setdefault(ppid, set()).add(key)
+            return
+        node.parent = parent_key
+        parent.children.add(key)
+        self._add(parent_key, node.cpu, node.mem)
+
+    def _detach(self, key):
+        node = self.nodes[key]
+        waiting = self._waiting.get(node.row.ppid)
+        if waiting is not None:
+            waiting.discard(key)
+            if not waiting:
+                del self._waiting[node.row.ppid]
+        if node.parent is None:
+            return
+        parent = self.nodes.get(node.parent)
+        if parent is not None:
+            parent.children.discard(key)
+            self._add(node.parent, -node.cpu, -node.mem)
+        node.parent = None
+
+    def _is_descendant(self, key, ancestor):
+        for _ in range(MAX_DEPTH):
+            if key is None:
+                return False
+            if key == ancestor:
+                return True
+            key = self.nodes[key].parent
+        return True
+
+    def _add(self, key, cpu, mem):
+        """Add a difference to a node's subtree sums and its ancestors'."""
+        nodes = self.nodes
+        for _ in range(MAX_DEPTH):
+            if key is None:
+                return
+            node = nodes[key]
+            node.cpu = max(0.0, node.cpu + cpu)
+            node.mem = max(0.0, node.mem + mem)
+            key = node.parent
+
+    # -------- display
+    def flatten(self, category, expanded, k, column, descending, matches=None):
+        """Rows to show for one table: the top k roots by `column` and, below
+        every expanded node, its children (recursively). Collapsed nodes show
+        their subtree sums, expanded ones their own values. With a search
+        (`matches`) the tree is dropped and the matching processes listed."""
+        nodes = self.nodes
+        if matches is not None:
+            rows = [TreeRow(key, n.row.pid, n.row.name, n.row.cpu, n.row.mem)
+                    for key, n in nodes.items() if n.category == category and key in matches]
+            return top_k(rows, k, column, descending)
+
+        def row(key, depth):
+            n = nodes[key]
+            p = n.row
+            if not n.children:
+                return TreeRow(key, p.pid, p.name, p.cpu, p.mem, depth)
+            if p.pid in expanded:
+                return TreeRow(key, p.pid, p.name, p.cpu, p.mem, depth, True)
+            return TreeRow(key, p.pid, p.name, n.cpu, n.mem, depth, False, 1 + len(n.children))
+
+        roots = [row(key, 0) for key, n in nodes.items()
+                 if n.parent is None and n.category == category]
+        out = []
+        stack = list(reversed(top_k(roots, k, column, descending)))
+        while stack:
+            r = stack.pop()
+            out.append(r)
+            if r.state and r.depth < MAX_DEPTH:
+                children = [row(child, r.depth + 1) for child in nodes[r.key].children]
+                stack.extend(reversed(top_k(children, None, column, descending)))
+        return out
@@ -0,0 +1,174 @@
+# modules/processes/procfs.py
+import os
+import pwd
+import sys
+import time
+
+from modules.processes.table import ProcRow
+
+PROC_ROOT = "/proc"
+
+
+def available(root=PROC_ROOT):
+    """True when /proc looks like a Linux procfs this scanner can parse."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        scanner = ProcfsScanner(root)
+        return scanner._stat(os.getpid()) is not None
+    except Exception:
+        return False
+
+
+class ProcfsScanner:
+    """Linux process collector that reads /proc directly.
+
+    One pass per tick reads /proc/[pid]/stat and /proc/[pid]/statm for every
+    process into a reused buffer and computes CPU% (per-process, like
+    psutil: 100 = one full core) and memory% itself. /proc/[pid]/status (for
+    the uid) and cmdline (for names the kernel truncated) are read only the
+    first time a process is seen. Produces the same ProcRow records as
+    ProcessTable, keyed by (pid, create_time).
+    """
+
+    def __init__(self, root=PROC_ROOT):
+        self.root = root
+        self.clk_tck = os.sysconf("SC_CLK_TCK")
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+        self.boot_time = self._boot_time()
+        self.total_mem = self._total_mem()
+        self._buf = bytearray(8192)
+        self._view = memoryview(self._buf)
+        self._procs = {}   # pid -> [starttime ticks, cpu ticks, ProcRow]
+        self._users = {}   # uid -> user name
+        self._last = None
+        self.rows = ()
+
+    def __len__(self):
+        return len(self._procs)
+
+    # -------- file access
+    def _read(self, path):
+        """Read a small /proc file into the shared buffer; returns length."""
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return os.readv(fd, [self._buf])
+        finally:
+            os.close(fd)
+
+    def _boot_time(self):
+        with open(f"{self.root}/stat", "rb") as f:
+            for line in f:
+                if line.startswith(b"btime"):
+                    return float(line.split()[1])
+        return 0.0
+
+    def _total_mem(self):
+        with open(f"{self.root}/meminfo", "rb") as f:
+            for line in f:
+                if line.startswith(b"MemTotal:"):
+                    return int(line.split()[1]) * 1024
+        return 1
+
+    def _stat(self, pid):
+        """(comm, starttime, utime + stime, ppid) from /proc/[pid]/stat."""
+        n = self._read(f"{self.root}/{pid}/stat")
+        buf = self._buf
+        lp = buf.find(b"(", 0, n)
+        rp = buf.rfind(b")", 0, n)
+        if lp < 0 or rp < 0:
+            return None
+        comm = bytes(self._view[lp + 1:rp]).decode("utf-8", "replace")
+        # fields after ")": state(3) ppid(4) ... utime(14) stime(15) ... starttime(22)
+        fields = bytes(self._view[rp + 2:n]).split(None, 20)
+        return comm, int(fields[19]), int(fields[11]) + int(fields[12]), int(fields[1])
+
+    def _rss_pages(self, pid):
+        n = self._read(f"{self.root}/{pid}/statm")
+        sp = self._buf.find(b" ", 0, n)
+        end = self._buf.find(b" ", sp + 1, n)
+        return int(bytes(self._view[sp + 1:end if end > 0 else n]))
+
+    def _user(self, pid):
+        uid = None
+        try:
+            n = self._read(f"{self.root}/{pid}/status")
+            start = self._buf.find(b"\nUid:", 0, n)
+            if start >= 0:
+                uid = int(bytes(self._view[start + 5:self._buf.find(b"\n", start + 5, n)]).split()[0])
+        except (OSError, ValueError):
+            return ""
+        if uid is None:
+            return ""
+        name = self._users.get(uid)
+        if name is None:
+            try:
+                name = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                name = str(uid)
+            self._users[uid] = name
+        return name
+
+    def _full_name(self, pid, comm):
+        # the kernel truncates comm to 15 chars; take the executable name instead
+        if len(comm) < 15:
+            return comm
+        try:
+            n = self._read(f"{self.root}/{pid}/cmdline")
+        except OSError:
+            return comm
+        end = self._buf.find(b"\0", 0, n)
+        exe = bytes(self._view[:end if end >= 0 else n]).decode("utf-8", "replace")
+        exe = os.path.basename(exe)
+        return exe if exe.startswith(comm) else comm
+
+    # -------- scan
+    def update(self):
+        now = time.monotonic()
+        elapsed = (now - self._last) if self._last else 0.0
+        self._last = now
+        ticks_per_pct = self.clk_tck * elapsed / 100.0 if elapsed else 0.0
+        mem_scale = self.page_size * 100.0 / self.total_mem
+
+        procs = self._procs
+        seen = {}
+        rows = []
+        for entry in os.scandir(self.root):
+            name = entry.name
+            if not name.isdigit():
+                continue
+            pid = int(name)
+            try:
+                stat = self._stat(pid)
+                if stat is None:
+                    continue
+                comm, start, ticks, ppid = stat
+                mem = self._rss_pages(pid) * mem_scale
+                known = procs.get(pid)
+                if known is not None and known[0] != start:
+                    known = None    # PID reused by a new process
+                if known is None:
+                    row = ProcRow(pid, self.boot_time + start / self.clk_tck,
+                                  self._full_name(pid, comm), self._user(pid), 0.0, mem, ppid)
+                else:
+                    prev = known[2]
+                    cpu = (ticks - known[1]) / ticks_per_pct if ticks_per_pct else 0.0
+                    cpu = round(max(0.0, cpu), 1)
+                    if prev.name[:15] != comm[:15]:
+                        nm = self._full_name(pid, comm)   # exec'd into something else
+                    else:
+                        nm = prev.name
+                    if cpu != prev.cpu or mem != prev.mem or nm != prev.name or ppid != prev.ppid:
+                        row = ProcRow(pid, prev.create_time, nm, prev.user, cpu, mem, ppid)
+                    else:
+                        row = prev
+            except (OSError, ValueError, IndexError):
+                # exited mid-scan or not readable
+                continue
+            seen[pid] = [start, ticks, row]
+            rows.append(row)
+
+        # anything not seen this pass has exited
+        self._procs = seen
+        self.rows = tuple(rows)
+        return self.rows
@@ -0,0 +1,30 @@
+# modules/processes/ranking.py
+import heapq
+from operator import attrgetter
+
+# column -> (sort key, descending by default)
+SORT_KEYS = {
+    "pid": (attrgetter("pid"), False),
+    "name": (lambda p: p.name.lower(), False),
+    "cpu": (attrgetter("cpu"), True),
+    "mem": (attrgetter("mem"), True),
+}
+
+
+def default_descending(column):
+    return SORT_KEYS[column][1]
+
+
+def top_k(items, k, column, descending):
+    """The first k rows of `items` ordered by `column`.
+
+    With k smaller than the list this is a heap selection, O(N log k)
+    instead of a full O(N log N) sort, so only the rows that can be shown
+    are ever ordered. k=None sorts everything.
+    """
+    key = SORT_KEYS[column][0]
+    if k is None or k >= len(items):
+        return sorted(items, key=key, reverse=descending)
+    if descending:
+        return heapq.nlargest(k, items, key=key)
+    return heapq.nsmallest(k, items, key=key)
@@ -0,0 +1,170 @@
+# modules/processes/search.py
+import os
+import re
+import threading
+
+import psutil
+
+CMDLINE_CHARS = 256     # command line characters indexed per process
+_WORD = re.compile(r"[a-z0-9]+")
+_PROC_CMDLINE = "/proc/self/cmdline"
+
+
+def read_cmdline(pid):
+    """Command line as one space-separated string ("" when unreadable)."""
+    if os.path.exists(_PROC_CMDLINE):
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                data = f.read(4096)
+            return data.replace(b"\0", b" ").decode("utf-8", "replace").strip()
+        except OSError:
+            return ""
+    try:
+        return " ".join(psutil.Process(pid).cmdline())
+    except psutil.Error:
+        return ""
+
+
+def _grams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _prefixes(text):
+    out = set()
+    for word in _WORD.findall(text):
+        out.add(word[:1])
+        out.add(word[:2])
+    return out
+
+
+class ProcessIndex:
+    """Search index over the live process list, keyed by (pid, create_time).
+
+    Names and the first CMDLINE_CHARS of each command line are indexed by
+    trigram (queries of 3+ characters: take the rarest trigram's postings,
+    then confirm the substring) and by word prefix (1-2 character queries
+    match the start of a word). Users and PIDs are plain hash lookups.
+
+    update() takes each process snapshot and only touches processes that
+    started, exited or were renamed since the previous one; the command
+    line is read once, when a process is first seen. Queries and updates
+    run on different threads, so both hold the lock.
+
+    Query syntax: whitespace-separated terms, all of which must match.
+    "user:NAME" matches the user exactly, "pid:N" or a bare number the PID
+    (a bare number also matches as text), anything else is a substring of
+    the name or command line. Case-insensitive.
+    """
+
+    def __init__(self, cmdline=read_cmdline):
+        self.cmdline = cmdline
+        self._lock = threading.Lock()
+        self._rows = {}      # key -> ProcRow last indexed
+        self._text = {}      # key -> "name\0cmdline", lower case
+        self._grams = {}     # trigram -> set of keys
+        self._prefix = {}    # 1-2 char word prefix -> set of keys
+        self._users = {}     # user (lower case) -> set of keys
+        self._pids = {}      # pid -> key
+        self.version = 0
+        self._cache = (None, None, None)   # (query, version, result)
+
+    def __len__(self):
+        return len(self._rows)
+
+    # -------- maintenance (collector thread)
+    def update(self, rows):
+        old = self._rows
+        fresh = {}
+        added = []
+        for p in rows:
+            key = p.key
+            fresh[key] = p
+            prev = old.get(key)
+            if prev is None or (prev is not p and prev.name != p.name):
+                added.append(p)
+        gone = [key for key in old if key not in fresh]
+        # command lines are read outside the lock
+        docs = [(p, f"{p.name}\0{self.cmdline(p.pid)[:CMDLINE_CHARS]}".lower())
+                for p in added]
+        with self._lock:
+            for key in gone:
+                self._remove(key)
+            for p, text in docs:
+                if p.key in self._text:
+                    self._remove(p.key)
+                self._add(p, text)
+            self._rows = fresh
+            if gone or docs:
+                self.version += 1
+
+    def _add(self, p, text):
+        key = p.key
+        self._text[key] = text
+        for g in _grams(text):
+            self._grams.setdefault(g, set()).add(key)
+        for w in _prefixes(text):
+            self._prefix.setdefault(w, set()).add(key)
+        self._users.setdefault(p.user.lower(), set()).add(key)
+        self._pids[p.pid] = key
+
+    def _remove(self, key):
+        text = self._text.pop(key)
+        p = self._rows[key]
+        for index, tokens in ((self._grams, _grams(text)), (self._prefix, _prefixes(text)),
+                              (self._users, (p.user.lower(),))):
+            for t in tokens:
+                keys = index.get(t)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del index[t]
+        if self._pids.get(p.pid) == key:
+            del self._pids[p.pid]
+
+    # -------- queries (Tk thread)
+    def search(self, query):
+        """Set of matching keys, or None for an empty query (no filter)."""
+        query = query.strip().lower()
+        if not query:
+            return None
+        with self._lock:
+            q, version, result = self._cache
+            if q == query and version == self.version:
+                return result
+            result = None
+            for term in query.split():
+                keys = self._term(term)
+                result = keys if result is None else result & keys
+                if not result:
+                    break
+            result = frozenset(result or ())
+            self._cache = (query, self.version, result)
+            return result
+
+    def _term(self, term):
+        if term.startswith("user:"):
+            return set(self._users.get(term[5:], ()))
+        if term.startswith("pid:"):
+            key = self._pids.get(int(term[4:])) if term[4:].isdigit() else None
+            return {key} if key is not None else set()
+        keys = self._text_match(term)
+        if term.isdigit():
+            key = self._pids.get(int(term))
+            if key is not None:
+                keys.add(key)
+        return keys
+
+    def _text_match(self, term):
+        if len(term) < 3:
+            return set(self._prefix.get(term, ()))
+        # the rarest trigram bounds the candidates; the substring test on
+        # those is cheaper than intersecting the larger posting sets
+        rarest = None
+        for g in _grams(term):
+            keys = self._grams.get(g)
+            if not keys:
+                return set()
+            if rarest is None or len(keys) < len(rarest):
+                rarest = keys
+        text = self._text
+        return {key for key in rarest if term in text[key]}
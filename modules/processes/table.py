@@ -0,0 +1,110 @@
+# modules/processes/table.py
+import psutil
+
+
+class ProcRow:
+    """One process as seen in one tick. Treated as immutable: a new row is
+    only built when a displayed value changes, otherwise the previous
+    tick's object is reused."""
+
+    __slots__ = ("pid", "create_time", "name", "user", "cpu", "mem", "ppid")
+
+    def __init__(self, pid, create_time, name, user, cpu, mem, ppid=0):
+        self.pid = pid
+        self.create_time = create_time
+        self.name = name
+        self.user = user
+        self.cpu = cpu
+        self.mem = mem
+        self.ppid = ppid
+
+    @property
+    def key(self):
+        return (self.pid, self.create_time)
+
+    def __repr__(self):
+        return f"ProcRow(pid={self.pid}, name={self.name!r}, cpu={self.cpu}, mem={self.mem:.1f})"
+
+
+class ProcessTable:
+    """Live process table keyed by (pid, create_time).
+
+    psutil.Process handles are kept between ticks so cpu_percent(None)
+    measures the interval since the previous tick. Processes that exited
+    are dropped on the next update and a reused PID gets a fresh entry, so
+    the table never grows beyond the processes currently running.
+    """
+
+    def __init__(self):
+        self._procs = {}   # pid -> [psutil.Process, ProcRow]
+        self.rows = ()
+
+    def __len__(self):
+        return len(self._procs)
+
+    def handle(self, pid):
+        entry = self._procs.get(pid)
+        return entry[0] if entry else None
+
+    def update(self):
+        procs = self._procs
+        pids = psutil.pids()
+        alive = set(pids)
+        for pid in [pid for pid in procs if pid not in alive]:
+            del procs[pid]
+
+        rows = []
+        for pid in pids:
+            entry = procs.get(pid)
+            try:
+                if entry is not None and not entry[0].is_running():
+                    # exited and the PID was handed to a new process
+                    del procs[pid]
+                    entry = None
+                if entry is None:
+                    entry = self._track(pid)
+                row = self._refresh(entry)
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                procs.pop(pid, None)
+                continue
+            except psutil.Error:
+                continue
+            rows.append(row)
+
+        self.rows = tuple(rows)
+        return self.rows
+
+    def _track(self, pid):
+        proc = psutil.Process(pid)
+        try:
+            user = proc.username()
+        except psutil.AccessDenied:
+            user = ""
+        proc.cpu_percent(interval=None)   # prime; the first reading is always 0.0
+        entry = [proc, ProcRow(pid, proc.create_time(), "", user or "", 0.0, 0.0)]
+        self._procs[pid] = entry
+        return entry
+
+    def _refresh(self, entry):
+        proc, row = entry
+        with proc.oneshot():
+            try:
+                name = proc.name() or ""
+            except psutil.AccessDenied:
+                name = row.name
+            try:
+                cpu = proc.cpu_percent(interval=None)
+            except psutil.AccessDenied:
+                cpu = 0.0
+            try:
+                mem = proc.memory_percent()
+            except psutil.AccessDenied:
+                mem = 0.0
+            try:
+                ppid = proc.ppid()   # changes when the parent exits and it is re-parented
+            except psutil.AccessDenied:
+                ppid = row.ppid
+        if name != row.name or cpu != row.cpu or mem != row.mem or ppid != row.ppid:
+            row = ProcRow(row.pid, row.create_time, name, row.user, cpu, mem, ppid)
+            entry[1] = row
+        return row
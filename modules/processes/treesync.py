@@ -0,0 +1,143 @@
+# modules/processes/treesync.py
+import bisect
+
+
+class TreeSync:
+    """Keeps a ttk.Treeview in step with a keyed, ordered list of rows.
+
+    Rows are identified by key (the PID for the process tables), which is
+    also used as the Treeview iid. Each set_rows() call deletes rows that
+    disappeared, inserts new ones at their position, rewrites only the cells
+    whose text changed and moves only the rows that left the longest run of
+    rows already in order. Selection and scroll position are preserved.
+    """
+
+    def __init__(self, tree, vsb=None, stripe_tags=("even", "odd")):
+        self.tree = tree
+        self.vsb = vsb
+        self.stripe_tags = stripe_tags
+        self.columns = tuple(tree["columns"])
+        self._values = {}   # iid -> values tuple
+        self._order = []    # iids in display order
+        self._tags = {}     # iid -> stripe tag currently applied
+        self.last_ops = {"insert": 0, "delete": 0, "cells": 0, "move": 0}
+        # restripe rows that scroll into view
+        tree.configure(yscrollcommand=self._on_yscroll)
+
+    def set_rows(self, rows):
+        """rows: iterable of (key, values) in display order."""
+        tree = self.tree
+        new_order = []
+        new_values = {}
+        for key, values in rows:
+            iid = str(key)
+            if iid in new_values:
+                continue
+            new_order.append(iid)
+            new_values[iid] = values
+        old_values = self._values
+        ops = {"insert": 0, "delete": 0, "cells": 0, "move": 0}
+
+        # exited rows
+        gone = [iid for iid in self._order if iid not in new_values]
+        if gone:
+            tree.delete(*gone)
+            for iid in gone:
+                self._tags.pop(iid, None)
+            ops["delete"] = len(gone)
+
+        # changed cells
+        columns = self.columns
+        for iid, values in new_values.items():
+            old = old_values.get(iid)
+            if old is None or old == values:
+                continue
+            changed = [(col, b) for col, a, b in zip(columns, old, values) if a != b]
+            if len(changed) == 1:
+                tree.set(iid, *changed[0])
+            else:
+                # several cells: one Tcl call is cheaper than one per cell
+                tree.item(iid, values=values)
+            ops["cells"] += len(changed)
+
+        # new rows and reordering
+        if new_order != self._order:
+            old_pos = {}
+            for i, iid in enumerate(self._order):
+                if iid in new_values:
+                    old_pos[iid] = i
+            stable = _longest_increasing([old_pos.get(iid, -1) for iid in new_order])
+            movers = [iid for i, iid in enumerate(new_order) if iid in old_pos and i not in stable]
+            if movers:
+                # detached rows keep their state and are re-attached below
+                tree.detach(*movers)
+            stripes = self.stripe_tags
+            for i, iid in enumerate(new_order):
+                if iid not in old_pos:
+                    tag = stripes[i % 2]
+                    tree.insert("", i, iid=iid, values=new_values[iid], tags=(tag,))
+                    self._tags[iid] = tag
+                    ops["insert"] += 1
+                elif i not in stable:
+                    tree.move(iid, "", i)
+                    ops["move"] += 1
+
+        self._order = new_order
+        self._values = new_values
+        self.last_ops = ops
+        self._restripe_visible()
+
+    # -------- stripes
+    def _on_yscroll(self, first, last):
+        if self.vsb is not None:
+            self.vsb.set(first, last)
+        self._restripe_visible(float(first), float(last))
+
+    def _restripe_visible(self, first=None, last=None):
+        # stripe tags follow the row position, so rows shift parity whenever
+        # something is inserted above them; fix up only what is on screen
+        order = self._order
+        if not order:
+            return
+        if first is None:
+            try:
+                first, last = self.tree.yview()
+            except Exception:
+                first, last = 0.0, 1.0
+        n = len(order)
+        lo = max(0, int(first * n) - 1)
+        hi = min(n, int(last * n) + 2)
+        stripes = self.stripe_tags
+        tags = self._tags
+        for i in range(lo, hi):
+            iid = order[i]
+            tag = stripes[i % 2]
+            if tags.get(iid) != tag:
+                self.tree.item(iid, tags=(tag,))
+                tags[iid] = tag
+
+
+def _longest_increasing(seq):
+    """Indexes of one longest strictly increasing subsequence of seq,
+    ignoring negative entries (rows that are new)."""
+    tails = []       # seq values ending the best run of each length
+    tails_idx = []   # index in seq of those values
+    prev = [-1] * len(seq)
+    for i, v in enumerate(seq):
+        if v < 0:
+            continue
+        j = bisect.bisect_left(tails, v)
+        if j:
+            prev[i] = tails_idx[j - 1]
+        if j == len(tails):
+            tails.append(v)
+            tails_idx.append(i)
+        else:
+            tails[j] = v
+            tails_idx[j] = i
+    result = set()
+    i = tails_idx[-1] if tails_idx else -1
+    while i >= 0:
+        result.add(i)
+        i = prev[i]
+    return result
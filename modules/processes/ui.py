@@ -1,14 +1,29 @@
 # modules/processes/ui.py
 import os
-import threading
-import time
 import getpass
 import psutil
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import ttk, messagebox
-
-REFRESH_INTERVAL = 0.25
+from modules import profiling
+from modules.collector import get_collector
+from modules.scheduler import FrameScheduler
+from modules.processes.actions import ProcessActions
+from modules.processes.details import ProcessDetails
+from modules.processes.groups import ProcessGroups, ProcessTree, TreeRow
+from modules.processes.ranking import top_k, default_descending
+from modules.processes.search import ProcessIndex
+from modules.processes.treesync import TreeSync
+from modules.processes.virtual_list import VirtualList
+
+MAX_FPS = 2  # table redraw cap, independent of the collector tick
+VIRTUAL_TABLE = True  # draw only visible rows (False = ttk.Treeview + keyed diff)
+TOP_K_CHOICES = ("20", "50", "100", "All")  # rows shown per table
+DEFAULT_TOP_K = "50"
+DEFAULT_SORT = ("cpu", True)  # (column, descending); headings change it per table
+GROUP_MODES = ("Flat", "Tree", "Name", "User")   # Tree = by parent process
+COLUMN_TITLES = {"pid": "PID", "name": "Name", "cpu": "CPU%", "mem": "RAM%"}
+SYSTEM_USERS = ("system", "nt authority\\system", "local service", "network service", "")
 
 # THEME A COLORS
 BG_MAIN = "#0f0e0f"        # Main background
@@ -17,6 +32,7 @@ INNER_BG = "#141416"       # Inner table background
 TEXT_PRIMARY = "#ffffff"
 ROW_ODD = "#121212"
 ROW_EVEN = "#151515"
+ROW_SELECTED = "#4a6984"
 NEON_ACCENT = "#ff8a2b"    # Neon orange strip
 NEON_LIME = "#8CFF3E"   # Neon lime for suspend
 
@@ -30,13 +46,93 @@ def fmt(x, precision=1):
         return "0.0"
 
 
+def fmt_bytes(n):
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024.0
+    return f"{n:.1f} TB"
+
+
+def _cells(it):
+    if isinstance(it, TreeRow):
+        pid = f"{it.count} procs" if it.is_group else it.pid
+        return (pid, it.label(), fmt(it.cpu,1), fmt(it.mem,1))
+    return (it.pid, it.name, fmt(it.cpu,1), fmt(it.mem,1))
+
+
+def _memory_text(m):
+    return "  ".join(f"{name.upper()} {fmt_bytes(value)}" for name, value in m.items())
+
+
+def _io_text(io):
+    return (f"read {fmt_bytes(io['read_bytes'])} ({io['read_count']} ops), "
+            f"written {fmt_bytes(io['write_bytes'])} ({io['write_count']} ops)")
+
+
+def _list_text(items, limit=8):
+    if not items:
+        return "none"
+    shown = [" ".join(filter(None, it)) if isinstance(it, tuple) else it for it in items[:limit]]
+    more = f"\n  … {len(items) - limit} more" if len(items) > limit else ""
+    return f"{len(items)}\n  " + "\n  ".join(shown) + more
+
+
+def _format_details(key, row, details):
+    """Panel text for one process; attributes not fetched yet show as "…"."""
+    def show(name, render=str):
+        value = details.get(name)
+        if value is None:
+            return "…"
+        if isinstance(value, psutil.AccessDenied):
+            return "access denied"
+        return render(value)
+
+    pid = key[0]
+    title = f"{row.name}  (PID {pid})" if row else f"PID {pid}"
+    lines = [title + ("  — exited" if details.get("gone") else ""), ""]
+    if row:
+        lines.append(f"User     {row.user or '?'}")
+        lines.append(f"CPU/RAM  {fmt(row.cpu)}% / {fmt(row.mem)}%")
+    lines += [
+        f"Status   {show('status')}   nice {show('nice')}   threads {show('threads')}",
+        f"Exe      {show('exe')}",
+        f"Cwd      {show('cwd')}",
+        f"Command  {show('cmdline')}",
+        "",
+        f"Memory   {show('memory', _memory_text)}",
+        f"I/O      {show('io', _io_text)}",
+        "",
+        f"Open files   {show('open_files', _list_text)}",
+        f"Connections  {show('connections', _list_text)}",
+    ]
+    return "\n".join(lines)
+
+
 class ProcessesUI(ctk.CTkFrame):
     def __init__(self, parent, *args, **kwargs):
         super().__init__(parent, fg_color=BG_MAIN)
         self.parent = parent
         self.current_user = getpass.getuser()
-        self._stop = threading.Event()
         self._process_cache = {}
+        self._pid_keys = {}      # pid -> (pid, create_time) of the running process
+        self._snapshot = None
+        self._table_sync = {}
+        self._sort = {}          # tree -> [column, descending]
+        self._titles = {}        # tree -> (title label, base title)
+        self._is_app_user = {}   # username -> shown under applications
+        self.top_k = int(DEFAULT_TOP_K)
+        self.index = ProcessIndex()
+        self._query = ""
+        self.details = ProcessDetails(self._on_details)
+        self.group_mode = GROUP_MODES[0]
+        self._grouping = None    # ProcessGroups / ProcessTree while grouped
+        self._expanded = {}      # tree -> expanded group headers / tree PIDs
+        self._details = None     # (key, details) from the worker, shown on the Tk thread
+        self._detail_text = ""   # what the detail box shows now
+        self.actions = ProcessActions(self._on_action_done)
+        self._action_result = None   # ActionResult from the worker, shown on the Tk thread
+        self._active = False
         self._build_ui()
         self._start_background_updates()
 
@@ -59,12 +155,51 @@ class ProcessesUI(ctk.CTkFrame):
         top.pack(fill="x", padx=padx, pady=(8, 16))
 
         self.btn_refresh = ctk.CTkButton(top, text="Refresh", width=120,fg_color="#124c0c", command=self.refresh_now)
-        self.btn_kill = ctk.CTkButton(top, text="Kill Selected", width=140, fg_color="#e66b6b")
-        self.btn_suspend = ctk.CTkButton(top, text="Suspend", width=120, fg_color="#ff9b4a")
+        self.btn_kill = ctk.CTkButton(top, text="Kill Selected", width=140, fg_color="#e66b6b",
+                                      command=lambda: self._run_action("terminate"))
+        self.btn_suspend = ctk.CTkButton(top, text="Suspend", width=120, fg_color="#ff9b4a",
+                                         command=lambda: self._run_action("suspend"))
+        self.btn_resume = ctk.CTkButton(top, text="Resume", width=100, fg_color="#3f7d3a",
+                                        command=lambda: self._run_action("resume"))
+        self.btn_renice = ctk.CTkButton(top, text="Renice…", width=100, fg_color="#4a6984",
+                                        command=self._renice_selected)
+        # actions also reach every descendant of the selected processes
+        self.include_children = ctk.CTkCheckBox(top, text="Include children",
+                                                text_color=TEXT_PRIMARY, fg_color=NEON_ACCENT)
 
         self.btn_refresh.grid(row=0, column=0, padx=(0,12))
         self.btn_kill.grid(row=0, column=1, padx=(0,12))
-        self.btn_suspend.grid(row=0, column=2)
+        self.btn_suspend.grid(row=0, column=2, padx=(0,12))
+        self.btn_resume.grid(row=0, column=3, padx=(0,12))
+        self.btn_renice.grid(row=0, column=4, padx=(0,12))
+        self.include_children.grid(row=0, column=5)
+
+        # how many rows each table ranks and shows
+        self.top_selector = ctk.CTkSegmentedButton(top, values=list(TOP_K_CHOICES),
+                                                   command=self._set_top_k,
+                                                   selected_color=NEON_ACCENT)
+        self.top_selector.set(DEFAULT_TOP_K)
+        top.grid_columnconfigure(6, weight=1)
+        self.group_selector = ctk.CTkSegmentedButton(top, values=list(GROUP_MODES),
+                                                     command=self._set_group_mode,
+                                                     selected_color=NEON_ACCENT)
+        self.group_selector.set(GROUP_MODES[0])
+        ctk.CTkLabel(top, text="Group", text_color=TEXT_PRIMARY).grid(row=0, column=7, padx=(0, 8))
+        self.group_selector.grid(row=0, column=8, padx=(0, 16))
+        ctk.CTkLabel(top, text="Show top", text_color=TEXT_PRIMARY).grid(row=0, column=9, padx=(0, 8))
+        self.top_selector.grid(row=0, column=10)
+
+        # search box: filters both tables through the process index
+        # (no textvariable: CTkEntry drops the placeholder when one is set)
+        self.search_entry = ctk.CTkEntry(self, height=34,
+                                         placeholder_text="Search name or command line  ·  user:NAME  ·  pid:N")
+        self.search_entry.pack(fill="x", padx=padx, pady=(0, 12))
+        self.search_entry.bind("<KeyRelease>", lambda e: self._search_changed())
+        self.search_entry.bind("<Escape>", lambda e: self._clear_search())
+
+        # outcome of the last process action
+        self.action_status = ctk.CTkLabel(self, text="", anchor="w", text_color=TEXT_PRIMARY)
+        self.action_status.pack(fill="x", padx=padx, pady=(0, 8))
 
         # Content area
         content = ctk.CTkFrame(self, fg_color="transparent")
@@ -73,6 +208,7 @@ class ProcessesUI(ctk.CTkFrame):
         content.grid_rowconfigure(0, weight=1)
         content.grid_rowconfigure(1, weight=1)
         content.grid_columnconfigure(0, weight=1)
+        content.grid_columnconfigure(1, weight=0, minsize=360)
 
         # Application Processes Card
         self.app_card = self._create_card(content, "Application Processes")
@@ -82,6 +218,10 @@ class ProcessesUI(ctk.CTkFrame):
         self.sys_card = self._create_card(content, "System Processes")
         self.sys_card.grid(row=1, column=0, sticky="nsew", pady=(12, 0))
 
+        # Details of the selected process, fetched on demand
+        self.detail_card = self._create_detail_card(content)
+        self.detail_card.grid(row=0, column=1, rowspan=2, sticky="nsew", padx=(16, 0))
+
     # --------------------------------------------------
     # CREATE CARD
     # --------------------------------------------------
@@ -104,14 +244,63 @@ class ProcessesUI(ctk.CTkFrame):
         table_frame = ctk.CTkFrame(inner, fg_color="transparent")
         table_frame.pack(fill="both", expand=True, padx=12, pady=4)
 
-        # Treeview
+        if VIRTUAL_TABLE:
+            tree = self._create_virtual_list(table_frame)
+        else:
+            tree = self._create_treeview(table_frame)
+
+        # Store tree based on title
+        if "Application" in title:
+            self.apps_tree = tree
+        else:
+            self.system_tree = tree
+        self._titles[tree] = (lbl, title)
+        self._sort[tree] = list(DEFAULT_SORT)
+        self._expanded[tree] = set()
+        if VIRTUAL_TABLE:
+            tree.set_sort(*DEFAULT_SORT)
+            tree.bind("<<VirtualListSort>>", lambda e, t=tree: self._sort_by(t, t.sort_request))
+            tree.bind("<<VirtualListSelect>>", lambda e, t=tree: self._on_select(t))
+            tree.bind("<<VirtualListActivate>>", lambda e, t=tree: self._on_activate(t, t.activated))
+        else:
+            for col in COLUMN_TITLES:
+                tree.heading(col, command=lambda t=tree, c=col: self._sort_by(t, c))
+            self._show_sort(tree)
+            tree.bind("<<TreeviewSelect>>", lambda e, t=tree: self._on_select(t))
+            tree.bind("<Double-1>", lambda e, t=tree: self._on_activate(t, t.focus()))
+
+        return outer
+
+    def _create_detail_card(self, parent):
+        outer = ctk.CTkFrame(parent, fg_color=CARD_BG, corner_radius=CORNER, width=360)
+        ctk.CTkLabel(outer, text="Details", font=ctk.CTkFont(size=16, weight="bold"),
+                     text_color=TEXT_PRIMARY).pack(anchor="w", padx=14, pady=(12, 6))
+        self.detail_text = ctk.CTkTextbox(outer, font=ctk.CTkFont(family="Courier", size=12),
+                                          fg_color=INNER_BG, text_color=TEXT_PRIMARY, wrap="word")
+        self.detail_text.pack(fill="both", expand=True, padx=12, pady=(0, 12))
+        self._set_detail_text("Select a process to see its command line, memory\n"
+                              "(USS/PSS), I/O, threads, open files and connections.")
+        return outer
+
+    def _create_virtual_list(self, table_frame):
+        # only the rows in view are drawn; the process list stays in Python
+        columns = (("pid", "PID", 100, "w"), ("name", "Name", None, "w"),
+                   ("cpu", "CPU%", 90, "center"), ("mem", "RAM%", 90, "center"))
+        tree = VirtualList(table_frame, columns,
+                           key=lambda it: it.pid,
+                           formatter=_cells,
+                           rowheight=42, font=("Segoe UI", 14), heading_font=("Segoe UI", 16, "bold"),
+                           bg=ROW_ODD, stripes=(ROW_EVEN, ROW_ODD), select_bg=ROW_SELECTED,
+                           fg=TEXT_PRIMARY, heading_bg=INNER_BG)
+        tree.pack(side="top", fill="both", expand=True)
+        return tree
+
+    def _create_treeview(self, table_frame):
         columns = ("pid", "name", "cpu", "mem")
         tree = ttk.Treeview(table_frame, columns=columns, show="headings", selectmode="extended")
 
-        tree.heading("pid", text="PID")
-        tree.heading("name", text="Name")
-        tree.heading("cpu", text="CPU%")
-        tree.heading("mem", text="RAM%")
+        for col, title in COLUMN_TITLES.items():
+            tree.heading(col, text=title)
 
         tree.column("pid", width=100, anchor="w")
         tree.column("name", anchor="w")
@@ -126,6 +315,9 @@ class ProcessesUI(ctk.CTkFrame):
         vsb.pack(side="right", fill="y")
         hsb.pack(side="bottom", fill="x")
 
+        # rows are keyed by PID and updated in place
+        self._table_sync[tree] = TreeSync(tree, vsb)
+
         # Style
         style = ttk.Style()
         style.theme_use("clam")
@@ -146,81 +338,234 @@ class ProcessesUI(ctk.CTkFrame):
         tree.tag_configure("odd", background=ROW_ODD)
         tree.tag_configure("even", background=ROW_EVEN)
 
-        # Store tree based on title
-        if "Application" in title:
-            self.apps_tree = tree
-        else:
-            self.system_tree = tree
-
-        return outer
+        return tree
 
     # --------------------------------------------------
     # BACKGROUND REFRESH LOOP
     # --------------------------------------------------
     def _start_background_updates(self):
-        threading.Thread(target=self._updater_loop, daemon=True).start()
-
-    def _updater_loop(self):
-        while not self._stop.is_set():
-            try:
-                procs = list(psutil.process_iter(attrs=["pid","name","username","cpu_percent","memory_percent"]))
+        self.frames = FrameScheduler(self.parent, self._update_ui, max_fps=MAX_FPS)
+        self.detail_frames = FrameScheduler(self.parent, self._show_details)
+        self.action_frames = FrameScheduler(self.parent, self._show_action_result)
+        self.collector = get_collector()
+        self.on_show()
+
+    # page lifecycle (PageManager): no scanning while the page is hidden
+    def on_show(self):
+        if self._active:
+            return
+        self._active = True
+        self.collector.subscribe("processes", self._on_snapshot)
+
+    def on_hide(self):
+        self._active = False
+        self.collector.unsubscribe("processes", self._on_snapshot)
+        self._snapshot = None
+
+    def _on_snapshot(self, snapshot):
+        # collector thread: index the snapshot, merge it on the Tk thread
+        self.index.update(snapshot)
+        self._snapshot = snapshot
+        self.frames.request()
+
+    def _merge_snapshot(self):
+        snapshot, self._snapshot = self._snapshot, None
+        if snapshot is None:
+            return
+        # the snapshot only holds running processes, keyed by (pid, create_time)
+        self._process_cache = {p.key: p for p in snapshot}
+        self._pid_keys = {p.pid: p.key for p in snapshot}
+        if self._grouping is not None:
+            self._grouping.update(snapshot)
 
-                for p in procs:
-                    info = p.info
-                    pid = info.get("pid")
-                    try:
-                        cpu = p.cpu_percent(interval=None)
-                    except:
-                        cpu = info.get("cpu_percent", 0.0)
+    # --------------------------------------------------
+    # UI POPULATION
+    # --------------------------------------------------
+    def _is_app(self, info):
+        """True for the current user's processes (the applications table)."""
+        is_app = self._is_app_user.get(info.user)
+        if is_app is None:
+            user = info.user.lower()
+            is_app = self._is_app_user[info.user] = (
+                user not in SYSTEM_USERS and self.current_user.lower() in user)
+        return is_app and info.pid != 0
 
-                    mem = info.get("memory_percent", 0.0)
+    def _update_ui(self):
+        self._merge_snapshot()
+        matches = self.index.search(self._query)
+        if self._grouping is not None:
+            self._update_grouped(matches)
+            self.details.refresh()
+            return
 
-                    self._process_cache[pid] = {
-                        "pid": pid,
-                        "name": info.get("name") or "",
-                        "user": info.get("username") or "",
-                        "cpu": cpu,
-                        "mem": mem
-                    }
+        apps = []
+        system = []
+        is_app = self._is_app
+        for info in self._process_cache.values():
+            if matches is not None and info.key not in matches:
+                continue
+            if is_app(info):
+                apps.append(info)
+            else:
+                system.append(info)
 
-                self.parent.after(0, self._update_ui)
+        for tree, rows in ((self.apps_tree, apps), (self.system_tree, system)):
+            column, descending = self._sort[tree]
+            k = self.top_k or None
+            self._fill_tree(tree, top_k(rows, k, column, descending))
+            label, title = self._titles[tree]
+            text = title
+            if k and k < len(rows):
+                text += f"  ·  top {k} of {len(rows)}"
+            elif matches is not None:
+                text += f"  ·  {len(rows)}"
+            if matches is not None:
+                text += " matching"
+            if label.cget("text") != text:
+                label.configure(text=text)
+
+        # re-fetch whatever detail attributes have expired (no-op when fresh)
+        self.details.refresh()
 
-            except:
-                pass
+    # --------------------------------------------------
+    # GROUPED VIEW
+    # --------------------------------------------------
+    def _set_group_mode(self, mode):
+        self.group_mode = mode
+        if mode == "Tree":
+            self._grouping = ProcessTree(self._is_app)
+        elif mode == "Name":
+            self._grouping = ProcessGroups(lambda p: p.name, self._is_app)
+        elif mode == "User":
+            self._grouping = ProcessGroups(lambda p: p.user or "?", self._is_app)
+        else:
+            self._grouping = None
+        if self._grouping is not None:
+            self._grouping.update(tuple(self._process_cache.values()))
+        for expanded in self._expanded.values():
+            expanded.clear()
+        self._update_ui()
 
-            time.sleep(REFRESH_INTERVAL)
+    def _update_grouped(self, matches):
+        k = self.top_k or None
+        for tree, category in ((self.apps_tree, True), (self.system_tree, False)):
+            column, descending = self._sort[tree]
+            rows = self._grouping.flatten(category, self._expanded[tree], k, column,
+                                          descending, matches)
+            self._fill_tree(tree, rows)
+            label, title = self._titles[tree]
+            text = f"{title}  ·  by {self.group_mode.lower()}"
+            if matches is not None:
+                text += "  ·  matching"
+            if label.cget("text") != text:
+                label.configure(text=text)
+
+    def _on_activate(self, tree, key):
+        # double click opens a tree node; group headers already react to one click
+        if key and not key.startswith("group:"):
+            self._toggle(tree, key)
+
+    def _toggle(self, tree, key):
+        """Expand or collapse a group header ("group:…") or a tree node (PID)."""
+        if self._grouping is None or not key:
+            return
+        ident = key if key.startswith("group:") else int(key)
+        self._expanded[tree] ^= {ident}
+        self._update_ui()
 
     # --------------------------------------------------
-    # UI POPULATION
+    # SEARCH / SORTING / TOP-K
     # --------------------------------------------------
-    def _update_ui(self):
-        apps = []
-        system = []
+    def _search_changed(self):
+        query = self.search_entry.get()
+        if query != self._query:
+            self._query = query
+            self._update_ui()
+
+    def _clear_search(self):
+        self.search_entry.delete(0, "end")
+        self._search_changed()
+
+    def _set_top_k(self, choice):
+        self.top_k = 0 if choice == "All" else int(choice)
+        self._update_ui()
 
-        for pid, info in self._process_cache.items():
-            user = (info.get("user") or "").lower()
+    def _sort_by(self, tree, column):
+        current, descending = self._sort[tree]
+        # same column flips the order, a new one starts in its natural order
+        descending = not descending if column == current else default_descending(column)
+        self._sort[tree] = [column, descending]
+        self._show_sort(tree)
+        self._update_ui()
 
-            if user in ("system","nt authority\\system","local service","network service","") or pid == 0:
-                system.append(info)
-            else:
-                if self.current_user.lower() in user:
-                    apps.append(info)
-                else:
-                    system.append(info)
+    def _show_sort(self, tree):
+        column, descending = self._sort[tree]
+        if isinstance(tree, VirtualList):
+            tree.set_sort(column, descending)
+            return
+        for col, title in COLUMN_TITLES.items():
+            if col == column:
+                title += " ▼" if descending else " ▲"
+            tree.heading(col, text=title)
 
-        apps = sorted(apps, key=lambda x: x["name"].lower() if x["name"] else "")
-        system = sorted(system, key=lambda x: x["pid"])
+    def _fill_tree(self, tree, items):
+        t0 = profiling.start()
+        if isinstance(tree, VirtualList):
+            tree.set_rows(items)
+            profiling.stop("table.fill.virtual", t0)
+            return
+        self._table_sync[tree].set_rows((it.pid, _cells(it)) for it in items)
+        profiling.stop("table.fill.treeview", t0)
 
-        self._fill_tree(self.apps_tree, apps)
-        self._fill_tree(self.system_tree, system)
+    # --------------------------------------------------
+    # DETAIL PANEL
+    # --------------------------------------------------
+    def _on_select(self, tree):
+        selection = tree.selection()
+        if len(selection) == 1 and selection[0].startswith("group:"):
+            # group headers aren't processes: a click opens or closes them
+            self._toggle(tree, selection[0])
+            return
+        pids = [sel for sel in selection if not sel.startswith("group:")]
+        if not pids:
+            return
+        pid = int(pids[-1])
+        key = self._pid_keys.get(pid)
+        if key is None or key == self.details.key:
+            return
+        self._details = None
+        row = self._process_cache[key]
+        self._set_detail_text(f"{row.name}  (PID {row.pid})\nLoading…")
+        self.details.select(key)
+
+    def _on_details(self, key, details):
+        # worker thread: hand over to the Tk thread
+        self._details = (key, details)
+        self.detail_frames.request()
+
+    def _show_details(self):
+        if self._details is None:
+            return
+        key, details = self._details
+        if key != self.details.key:
+            return
+        row = self._process_cache.get(key)
+        self._set_detail_text(_format_details(key, row, details))
 
-    def _fill_tree(self, tree, items):
-        tree.delete(*tree.get_children())
-        for i, it in enumerate(items):
-            tag = "even" if i % 2 == 0 else "odd"
-            tree.insert("", "end",
-                        values=(it["pid"], it["name"], fmt(it["cpu"],1), fmt(it["mem"],1)),
-                        tags=(tag,))
+    def _set_detail_text(self, text):
+        if text == self._detail_text:
+            return
+        same_process = text.split("\n", 1)[0] == self._detail_text.split("\n", 1)[0]
+        self._detail_text = text
+        box = self.detail_text
+        top = box.yview()[0]
+        box.configure(state="normal")
+        box.delete("1.0", "end")
+        box.insert("1.0", text)
+        box.configure(state="disabled")
+        if same_process:
+            # a refresh of the same process keeps the reader's scroll position
+            box.yview_moveto(top)
 
     # --------------------------------------------------
     # BUTTON ACTIONS
@@ -228,34 +573,71 @@ class ProcessesUI(ctk.CTkFrame):
     def refresh_now(self):
         self._update_ui()
 
-    def _get_selected_pids(self):
-        pids = []
-        for tree in (self.apps_tree, self.system_tree):
+    def _get_selected_keys(self):
+        """(pid, create_time) of the selected processes; a selected group
+        header stands for all of its members."""
+        keys = []
+        for tree, category in ((self.apps_tree, True), (self.system_tree, False)):
             for sel in tree.selection():
-                try:
-                    pids.append(int(sel))
-                except:
-                    pass
-        return pids
-
-    def _kill_selected(self):
-        pids = self._get_selected_pids()
-        if not pids:
+                if sel.startswith("group:"):
+                    group = getattr(self._grouping, "groups", {}).get((category, sel[6:]))
+                    if group is not None:
+                        keys.extend(group.members)
+                    continue
+                key = self._pid_keys.get(int(sel))
+                if key is not None:
+                    keys.append(key)
+        return list(dict.fromkeys(keys))
+
+    def _run_action(self, action, **kwargs):
+        keys = self._get_selected_keys()
+        if not keys:
+            return
+        tree = bool(self.include_children.get())
+        if action in ("terminate", "kill") and (len(keys) > 1 or tree):
+            scope = f"{len(keys)} processes" if len(keys) > 1 else "this process"
+            if tree:
+                scope += " and all their children"
+            if not messagebox.askyesno("End processes", f"End {scope}?"):
+                return
+        # the worker reports back through _on_action_done; the UI never waits
+        self.actions.submit(action, keys, tree=tree, **kwargs)
+        self.action_status.configure(text=f"{action.capitalize()}: {len(keys)} selected…",
+                                     text_color=TEXT_PRIMARY)
+
+    def _renice_selected(self):
+        if not self._get_selected_keys():
+            return
+        dialog = ctk.CTkInputDialog(title="Renice", text="Nice value (-20 … 19):")
+        value = dialog.get_input()
+        try:
+            nice = int(value)
+        except (TypeError, ValueError):
+            return
+        self._run_action("renice", nice=max(-20, min(19, nice)))
+
+    def _on_action_done(self, result):
+        # worker thread: hand over to the Tk thread
+        self._action_result = result
+        self.action_frames.request()
+
+    def _show_action_result(self):
+        result, self._action_result = self._action_result, None
+        if result is None:
             return
-        for pid in pids:
-            try:
-                psutil.Process(pid).kill()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to kill PID {pid}\n{e}")
-
-    def _suspend_selected(self):
-        pids = self._get_selected_pids()
-        for pid in pids:
-            try:
-                psutil.Process(pid).suspend()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to suspend PID {pid}\n{e}")
+        self.action_status.configure(text=result.summary(),
+                                     text_color=NEON_LIME if result.ok else "#e66b6b")
+        self.details.refresh()
+        self.frames.request()
+
+    def stop_updates(self):
+        self.on_hide()
+        self.frames.close()
+        self.detail_frames.close()
+        self.action_frames.close()
+        self.details.close()
+        self.actions.close()
 
     def destroy(self):
-        self._stop.set()
+        self.stop_updates()
         super().destroy()
@@ -0,0 +1,248 @@
+# modules/processes/virtual_list.py
+import math
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+
+
+class VirtualList(tk.Frame):
+    """Table widget that only draws the rows in the viewport.
+
+    The full dataset stays in a Python list (set_rows); a small pool of canvas
+    items covering the visible rows plus `overscan` rows above and below is
+    reused while scrolling, and rows are formatted only when they are drawn.
+    Refresh and scroll cost depend on the viewport height, not on len(rows).
+
+    columns: sequence of (name, title, width, anchor); width None stretches.
+    key(item) identifies a row for selection, formatter(item) returns the
+    cell texts. selection() mirrors ttk.Treeview and returns the keys as str.
+    A click on a column heading generates <<VirtualListSort>> with the
+    column name in `sort_request`; the owner sorts and calls set_sort().
+    A double click on a row generates <<VirtualListActivate>> with its key
+    (as str) in `activated`.
+    """
+
+    def __init__(self, parent, columns, key, formatter, rowheight=42,
+                 font=("Segoe UI", 14), heading_font=("Segoe UI", 16, "bold"),
+                 bg="#121212", stripes=("#151515", "#121212"), select_bg="#4a6984",
+                 fg="#ffffff", heading_bg="#141416", overscan=4):
+        super().__init__(parent, bg=bg)
+        self.columns = list(columns)
+        self.key = key
+        self.formatter = formatter
+        self.rowheight = rowheight
+        self.overscan = overscan
+        self.stripes = stripes
+        self.select_bg = select_bg
+        self.fg = fg
+        self.font = tkfont.Font(font=font)
+        self.heading_font = tkfont.Font(font=heading_font)
+
+        self._items = []
+        self._selected = set()
+        self._anchor = None       # index of the last plain click, for shift-click
+        self._offset = 0          # scroll position in pixels
+        self._slots = []
+        self._layout = []         # (x, width, anchor, max_chars) per column
+        self._width = 0
+        self._height = 0
+        self._head_ids = []
+        self.sort_column = None
+        self.sort_descending = False
+        self.sort_request = None
+        self.activated = None
+
+        head_h = self.heading_font.metrics("linespace") + 14
+        self.header = tk.Canvas(self, height=head_h, bg=heading_bg, highlightthickness=0)
+        self.body = tk.Canvas(self, bg=bg, highlightthickness=0, takefocus=1)
+        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+
+        self.header.grid(row=0, column=0, sticky="ew")
+        self.body.grid(row=1, column=0, sticky="nsew")
+        self.vsb.grid(row=0, column=1, rowspan=2, sticky="ns")
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.header.bind("<Button-1>", self._on_heading_click)
+        self.body.bind("<Configure>", self._on_resize)
+        self.body.bind("<Button-1>", self._on_click)
+        self.body.bind("<Control-Button-1>", lambda e: self._on_click(e, toggle=True))
+        self.body.bind("<Shift-Button-1>", lambda e: self._on_click(e, extend=True))
+        self.body.bind("<Double-Button-1>", self._on_double_click)
+        for widget in (self.body, self.header):
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Button-4>", lambda e: self.yview("scroll", -3, "units"))
+            widget.bind("<Button-5>", lambda e: self.yview("scroll", 3, "units"))
+
+    # -------- model
+    def set_rows(self, items):
+        self._items = items
+        self._clamp()
+        self._render()
+        self._update_scrollbar()
+
+    def selection(self):
+        if not self._selected:
+            return ()
+        present = {self.key(it) for it in self._items}
+        return tuple(str(k) for k in self._selected if k in present)
+
+    def set_sort(self, column, descending):
+        """Show the sort arrow on `column` (the rows are sorted by the owner)."""
+        self.sort_column, self.sort_descending = column, descending
+        self._draw_headings()
+
+    def selection_clear(self):
+        self._selected.clear()
+        self._render()
+
+    # -------- scrolling
+    def yview(self, *args):
+        total = len(self._items) * self.rowheight
+        if not args:
+            if not total:
+                return 0.0, 1.0
+            return self._offset / total, min(1.0, (self._offset + self._height) / total)
+        if args[0] == "moveto":
+            self._offset = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = self.rowheight if args[2] == "units" else max(self.rowheight, self._height - self.rowheight)
+            self._offset += int(args[1]) * step
+        self._clamp()
+        self._render()
+        self._update_scrollbar()
+
+    def _on_wheel(self, event):
+        units = -int(event.delta / 120) * 3 if abs(event.delta) >= 120 else -event.delta
+        if units:
+            self.yview("scroll", units, "units")
+
+    def _clamp(self):
+        max_offset = max(0, len(self._items) * self.rowheight - self._height)
+        self._offset = min(max(0, self._offset), max_offset)
+
+    def _update_scrollbar(self):
+        first, last = self.yview()
+        self.vsb.set(first, last)
+
+    # -------- layout
+    def _on_resize(self, event):
+        self._width, self._height = event.width, event.height
+        self._layout_columns()
+        self._build_pool()
+        self._clamp()
+        self._render()
+        self._update_scrollbar()
+
+    def _layout_columns(self):
+        fixed = sum(c[2] for c in self.columns if c[2])
+        stretch = [c for c in self.columns if not c[2]]
+        extra = max(60, self._width - fixed) // max(1, len(stretch))
+        char_w = max(1, self.font.measure("0"))
+        self._layout = []
+        x = 0
+        self.header.delete("all")
+        self._head_ids = []
+        for name, title, width, anchor in self.columns:
+            w = width or extra
+            self._layout.append((x, w, anchor, max(1, (w - 16) // char_w)))
+            tx = x + w // 2 if anchor == "center" else x + 8
+            self._head_ids.append(self.header.create_text(
+                tx, self.header.winfo_reqheight() // 2, text=title,
+                anchor=anchor, fill=self.fg, font=self.heading_font))
+            x += w
+        self._draw_headings()
+
+    def _draw_headings(self):
+        for (name, title, _, _), item in zip(self.columns, self._head_ids):
+            if name == self.sort_column:
+                title += " ▼" if self.sort_descending else " ▲"
+            self.header.itemconfigure(item, text=title)
+
+    def _on_heading_click(self, event):
+        for (name, *_), (x, w, _, _) in zip(self.columns, self._layout):
+            if x <= event.x < x + w:
+                self.sort_request = name
+                self.event_generate("<<VirtualListSort>>")
+                return
+
+    def _build_pool(self):
+        body = self.body
+        body.delete("all")
+        self._slots = []
+        count = math.ceil(self._height / self.rowheight) + 1 + 2 * self.overscan
+        for i in range(count):
+            tag = f"slot{i}"
+            rect = body.create_rectangle(0, 0, self._width, self.rowheight, width=0,
+                                         fill=self.stripes[0], tags=(tag,), state="hidden")
+            texts = []
+            for x, w, anchor, _ in self._layout:
+                tx = x + w // 2 if anchor == "center" else x + 8
+                texts.append(body.create_text(tx, self.rowheight // 2, text="", anchor=anchor,
+                                              fill=self.fg, font=self.font, tags=(tag,), state="hidden"))
+            # [tag, rect, text ids, y, fill, texts, hidden]
+            self._slots.append([tag, rect, texts, 0, None, [None] * len(texts), True])
+
+    # -------- drawing
+    def _render(self):
+        if not self._slots:
+            return
+        body = self.body
+        h = self.rowheight
+        items = self._items
+        first = max(0, self._offset // h - self.overscan)
+        layout = self._layout
+        for i, slot in enumerate(self._slots):
+            tag, rect, text_ids, y, fill, texts, hidden = slot
+            idx = first + i
+            if idx >= len(items):
+                if not hidden:
+                    body.itemconfigure(tag, state="hidden")
+                    slot[6] = True
+                continue
+
+            item = items[idx]
+            new_y = idx * h - self._offset
+            if new_y != y:
+                body.move(tag, 0, new_y - y)
+                slot[3] = new_y
+            new_fill = self.select_bg if self.key(item) in self._selected else self.stripes[idx % 2]
+            if new_fill != fill:
+                body.itemconfigure(rect, fill=new_fill)
+                slot[4] = new_fill
+            for c, value in enumerate(self.formatter(item)):
+                text = str(value)
+                max_chars = layout[c][3]
+                if len(text) > max_chars:
+                    text = text[:max_chars - 1] + "…"
+                if text != texts[c]:
+                    body.itemconfigure(text_ids[c], text=text)
+                    texts[c] = text
+            if hidden:
+                body.itemconfigure(tag, state="normal")
+                slot[6] = False
+
+    # -------- selection
+    def _on_click(self, event, toggle=False, extend=False):
+        self.body.focus_set()
+        idx = (self._offset + event.y) // self.rowheight
+        if idx >= len(self._items):
+            return
+        key = self.key(self._items[idx])
+        if extend and self._anchor is not None:
+            lo, hi = sorted((min(self._anchor, len(self._items) - 1), idx))
+            self._selected = {self.key(it) for it in self._items[lo:hi + 1]}
+        elif toggle:
+            self._selected ^= {key}
+            self._anchor = idx
+        else:
+            self._selected = {key}
+            self._anchor = idx
+        self._render()
+        self.event_generate("<<VirtualListSelect>>")
+
+    def _on_double_click(self, event):
+        idx = (self._offset + event.y) // self.rowheight
+        if idx < len(self._items):
+            self.activated = str(self.key(self._items[idx]))
+            self.event_generate("<<VirtualListActivate>>")
@@ -0,0 +1,118 @@
+# modules/profiling.py
+"""Opt-in latency histograms for the dashboard's own hot paths.
+
+Hooks are written as
+
+    t0 = profiling.start()
+    ...work...
+    profiling.stop("frame.PerformanceUI._refresh_ui", t0)
+
+While profiling is off, start() returns 0 and stop() returns at once, so
+a hook costs two function calls. Switch it on at run time with enable()
+(Settings page) or from the start with SYSMON_PROFILE=1.
+"""
+import json
+import math
+import os
+import threading
+import time
+
+BUCKETS_PER_OCTAVE = 4     # ~19% wide buckets
+MIN_SECONDS = 1e-6         # everything faster lands in bucket 0
+
+enabled = bool(os.environ.get("SYSMON_PROFILE"))
+_hists = {}
+_lock = threading.Lock()
+_since = time.time()
+
+
+class Histogram:
+    """Log-bucketed latency histogram: O(1) record, bounded memory."""
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        if seconds > MIN_SECONDS:
+            b = int(math.log2(seconds / MIN_SECONDS) * BUCKETS_PER_OCTAVE) + 1
+        else:
+            b = 0
+        self.buckets[b] = self.buckets.get(b, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q):
+        """Upper edge of the bucket holding the q-th percentile, in seconds."""
+        if not self.count:
+            return 0.0
+        rank = q / 100.0 * self.count
+        seen = 0
+        for b in sorted(self.buckets):
+            seen += self.buckets[b]
+            if seen >= rank:
+                return min(self.max, MIN_SECONDS * 2 ** (b / BUCKETS_PER_OCTAVE))
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p95_ms": round(self.percentile(95) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "total_ms": round(self.total * 1000, 1),
+        }
+
+
+# -------- hooks
+def start():
+    return time.perf_counter() if enabled else 0.0
+
+
+def stop(name, t0):
+    if t0:
+        record(name, time.perf_counter() - t0)
+
+
+def record(name, seconds):
+    with _lock:
+        hist = _hists.get(name)
+        if hist is None:
+            hist = _hists[name] = Histogram()
+        hist.record(seconds)
+
+
+# -------- control / results
+def enable(on=True):
+    global enabled
+    enabled = bool(on)
+
+
+def reset():
+    global _since
+    with _lock:
+        _hists.clear()
+        _since = time.time()
+
+
+def snapshot():
+    """{name: summary} sorted by total time spent, most expensive first."""
+    with _lock:
+        items = [(name, hist.summary()) for name, hist in _hists.items()]
+    items.sort(key=lambda kv: kv[1]["total_ms"], reverse=True)
+    return dict(items)
+
+
+def dump(path):
+    data = {"since": _since, "until": time.time(), "enabled": enabled, "hooks": snapshot()}
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+    return path
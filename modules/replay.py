@@ -0,0 +1,358 @@
+# modules/replay.py
+"""Record the collector's sample stream and play it back.
+
+    python main.py --headless --top 0 --record batch.rec.gz    # capture
+    python main.py --replay batch.rec.gz --replay-speed 10x    # look at it
+
+A recording is gzip-compressed JSON lines: one header line, then one line
+per sample in arrival order. Performance samples are stored whole;
+process lists are delta-encoded against the previous list of the same
+recording (started / exited processes, and CPU/RAM of the ones that
+changed), keyed by (pid, create_time).
+"""
+import gzip
+import json
+import threading
+import time
+
+from modules.performance.backend import PerfSample
+from modules.processes.table import ProcRow
+from modules.sources import MetricSource
+
+FORMAT = "sysmon-recording"
+VERSION = 1
+
+
+def add_arguments(parser):
+    group = parser.add_argument_group("record / replay")
+    group.add_argument("--record", metavar="FILE",
+                       help="record every performance sample and process list to FILE")
+    group.add_argument("--replay", metavar="FILE",
+                       help="feed a recording to the app instead of the live system")
+    group.add_argument("--replay-speed", default="1x", type=parse_speed,
+                       help="1x, 10x, any factor, or max (default %(default)s)")
+    group.add_argument("--replay-loop", action="store_true",
+                       help="start over at the end of the recording")
+
+
+def parse_speed(text):
+    text = str(text).strip().lower()
+    if text == "max":
+        return 0.0
+    value = float(text.rstrip("x"))
+    if value <= 0:
+        raise ValueError("speed must be positive")
+    return value
+
+
+# --------------------------------------------------
+# RECORDING
+# --------------------------------------------------
+class Recorder:
+    """Collector subscriber writing both sources to a recording.
+
+    Keeps the processes source sampling for as long as it records, so the
+    process list is complete even when no page shows it.
+    """
+
+    def __init__(self, collector, path, compresslevel=6):
+        self.collector = collector
+        self.path = path
+        self._f = gzip.open(path, "wt", compresslevel=compresslevel, encoding="utf-8")
+        self._dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+        self._lock = threading.Lock()
+        self._procs = {}      # (pid, create_time) -> ProcRow last written
+        self._header = False
+        self.samples = 0
+
+    def start(self):
+        self.collector.subscribe("performance", self._on_performance)
+        self.collector.subscribe("processes", self._on_processes)
+        return self
+
+    def close(self):
+        self.collector.unsubscribe("performance", self._on_performance)
+        self.collector.unsubscribe("processes", self._on_processes)
+        with self._lock:
+            if self._f is not None:
+                self._f.close()
+                self._f = None
+
+    def _write(self, record):
+        with self._lock:
+            if self._f is None:
+                return
+            if not self._header:
+                # written lazily, so it carries the interval actually in use
+                self._f.write(self._dumps({
+                    "format": FORMAT, "version": VERSION, "interval": self.collector.interval,
+                    "start": time.time(), "performance": PerfSample._fields,
+                    "processes": ProcRow.__slots__}) + "\n")
+                self._header = True
+            self._f.write(self._dumps(record) + "\n")
+            self.samples += 1
+
+    # -------- collector thread
+    def _on_performance(self, sample):
+        self._write({"k": "p", "t": round(sample.ts, 3), "v": [round(v, 3) for v in sample[1:]]})
+
+    def _on_processes(self, rows):
+        prev = self._procs
+        cur = {}
+        added, changed = [], []
+        for p in rows:
+            key = p.key
+            cur[key] = p
+            old = prev.get(key)
+            if old is p:
+                continue   # tables reuse the row object when nothing changed
+            if old is None or old.name != p.name or old.user != p.user or old.ppid != p.ppid:
+                added.append([p.pid, p.create_time, p.name, p.user, p.cpu, round(p.mem, 4), p.ppid])
+            elif old.cpu != p.cpu or old.mem != p.mem:
+                changed.append([p.pid, p.create_time, p.cpu, round(p.mem, 4)])
+        gone = [list(key) for key in prev.keys() - cur.keys()]
+        self._procs = cur
+        # recording a replay keeps the replayed time
+        ts = getattr(self.collector.source("processes"), "ts", None)
+        if ts is None:
+            ts = time.time()
+        self._write({"k": "q", "t": round(ts, 3), "a": added, "d": gone, "c": changed})
+
+
+def read_header(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+    if header.get("format") != FORMAT:
+        raise ValueError(f"{path} is not a recording")
+    return header
+
+
+# --------------------------------------------------
+# REPLAY
+# --------------------------------------------------
+class ReplayClock:
+    """Recorded time reached by the fastest replay stream, so a stream
+    that wasn't sampled for a while (its page was hidden) skips ahead
+    instead of lagging behind. `lap` counts passes over a looping file.
+
+    stamp() maps a recorded time to the replay's own timeline: the first
+    record stamped lands on the wall-clock time it was first sampled and
+    every later one at its recorded offset divided by `scale` (the replay
+    speed; 1 for "max"), so the same recording always yields the same
+    spacing. Each lap continues where the previous one ended.
+    """
+
+    def __init__(self):
+        self.lap = 0
+        self.t = float("-inf")
+        self.t0 = None        # first recorded time stamped
+        self.now0 = None      # its wall-clock stamp
+        self.span = 0.0       # recorded length of one lap, known after the first EOF
+
+    def advance(self, lap, t):
+        if (lap, t) > (self.lap, self.t):
+            self.lap, self.t = lap, t
+
+    def behind(self, lap, t, slack):
+        return (lap, t + slack) < (self.lap, self.t)
+
+    def lap_ended(self, last_t, interval):
+        if self.t0 is not None:
+            self.span = max(self.span, last_t + interval - self.t0)
+
+    def stamp(self, lap, t, scale=1.0):
+        if self.t0 is None:
+            self.t0, self.now0 = t, time.time()
+        return self.now0 + (lap * self.span + t - self.t0) / scale
+
+
+class NotStarted(Exception):
+    pass
+
+
+class _ReplayStream(MetricSource):
+    """One record kind of a recording, as a MetricSource.
+
+    sample() blocks until `go` is set, so a replay doesn't start running
+    ahead before all of its consumers have subscribed; the call that had
+    to wait raises NotStarted, which drops that tick, so playback begins
+    on a tick that samples every subscribed stream. At the end of a
+    non-looping recording sample() raises EOFError, `done` is set and
+    on_finish() (if any) is called once; without one, `finished` is set.
+    """
+
+    kind = None
+
+    def __init__(self, path, clock, interval, loop=False, rebase=True, finished=None,
+                 speed=1.0, go=None):
+        self.path = path
+        self.clock = clock
+        self.interval = interval
+        self.slack = interval / 2.0
+        self.loop = loop
+        self.rebase = rebase
+        self.scale = speed or 1.0
+        self.finished = finished or threading.Event()
+        self.on_finish = None
+        self.started = False    # sampled at least once
+        self.done = False
+        self.lap = 0
+        self.ts = None          # time of the latest snapshot
+        if go is None:
+            go = threading.Event()
+            go.set()
+        self._go = go
+        self._last_t = None
+        self._f = None
+        self._open()
+
+    def _open(self):
+        if self._f is not None:
+            self._f.close()
+        self._f = gzip.open(self.path, "rt", encoding="utf-8")
+        self._f.readline()   # header
+        self._reset()
+
+    def _reset(self):
+        pass
+
+    def _next(self):
+        while True:
+            line = self._f.readline()
+            if not line:
+                if self._last_t is not None:
+                    self.clock.lap_ended(self._last_t, self.interval)
+                if not self.loop:
+                    if not self.done:
+                        self.done = True
+                        if self.on_finish is not None:
+                            self.on_finish()
+                        else:
+                            self.finished.set()
+                    raise EOFError("end of recording")
+                self.lap += 1
+                self._open()
+                continue
+            record = json.loads(line)
+            self._last_t = record["t"]
+            if record["k"] == self.kind:
+                return record
+
+    def sample(self):
+        if not self._go.is_set():
+            self._go.wait()
+            raise NotStarted("replay started meanwhile; sample again")
+        self.started = True
+        record = self._next()
+        self._apply(record)
+        while self.clock.behind(self.lap, record["t"], self.slack):
+            record = self._next()
+            self._apply(record)
+        self.clock.advance(self.lap, record["t"])
+        self.ts = self.clock.stamp(self.lap, record["t"], self.scale) if self.rebase else record["t"]
+        return self._snapshot(record)
+
+    def close(self):
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+
+class PerformanceReplay(_ReplayStream):
+    """Recorded PerfSamples, re-stamped onto the replay's timeline unless rebase=False."""
+
+    name = "performance"
+    kind = "p"
+
+    def _apply(self, record):
+        pass
+
+    def _snapshot(self, record):
+        return PerfSample(self.ts, *record["v"])
+
+
+class ProcessReplay(_ReplayStream):
+    """Recorded process lists, rebuilt from the deltas."""
+
+    name = "processes"
+    kind = "q"
+
+    def _reset(self):
+        self._rows = {}
+
+    def _apply(self, record):
+        rows = self._rows
+        for pid, ct in record["d"]:
+            rows.pop((pid, ct), None)
+        # recordings made before ppid was tracked have six fields per process
+        for pid, ct, name, user, cpu, mem, *ppid in record["a"]:
+            rows[(pid, ct)] = ProcRow(pid, ct, name, user, cpu, mem, ppid[0] if ppid else 0)
+        for pid, ct, cpu, mem in record["c"]:
+            old = rows.get((pid, ct))
+            if old is not None:
+                rows[(pid, ct)] = ProcRow(pid, ct, old.name, old.user, cpu, mem, old.ppid)
+
+    def _snapshot(self, record):
+        return tuple(self._rows.values())
+
+
+class Replay:
+    """Both replay streams of one recording, installed on a collector.
+
+    Nothing is played until start(): call it once every consumer
+    (recorder, exporter, headless writer) has subscribed, or a "max" speed
+    collector drains the first subscribed stream before the others join.
+    `finished` is set once every stream that was sampled has reached the
+    end of the recording.
+    """
+
+    def __init__(self, path, speed=1.0, loop=False, rebase=True):
+        self.header = read_header(path)
+        self.speed = speed
+        self.interval = self.header["interval"] / speed if speed else 0.0
+        self.finished = threading.Event()
+        self._go = threading.Event()
+        self._lock = threading.Lock()
+        self._collector = None
+        clock = ReplayClock()
+        self.sources = [cls(path, clock, self.header["interval"], loop, rebase,
+                            speed=speed, go=self._go)
+                        for cls in (PerformanceReplay, ProcessReplay)]
+
+    def install(self, collector):
+        self._collector = collector
+        collector.interval = self.interval
+        for source in self.sources:
+            source.on_finish = self._stream_done
+            collector.add_source(source.name, source)
+        return self
+
+    def start(self):
+        self._go.set()
+        return self
+
+    def _stream_done(self):
+        with self._lock:
+            if self.finished.is_set() or not all(s.done for s in self.sources if s.started):
+                return
+            self.finished.set()
+        if self._collector is not None:
+            # nothing left to play: don't let a "max" speed collector spin
+            self._collector.interval = self.header["interval"]
+
+
+def setup(collector, args):
+    """Apply --replay / --record. Returns (replay, recorder); either may be None.
+
+    A replay is installed but not started: call replay.start() once every
+    consumer has subscribed.
+    """
+    import atexit
+
+    replay = recorder = None
+    if args.replay:
+        replay = Replay(args.replay, args.replay_speed, args.replay_loop).install(collector)
+    if args.record:
+        recorder = Recorder(collector, args.record).start()
+        atexit.register(recorder.close)
+    return replay, recorder
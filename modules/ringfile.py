@@ -0,0 +1,138 @@
+# modules/ringfile.py
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAGIC = b"SMRING1\0"
+# magic, ncols, capacity, columns crc, reserved, head, count
+HEADER = struct.Struct("<8sIIIIQQ")
+HEADER_SIZE = 64
+FLUSH_INTERVAL = 30.0  # seconds between msync() calls
+
+
+def default_path(name="performance.ring"):
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "system-monitor", name)
+
+
+class RingFile:
+    """Fixed-size ring of float64 records in a memory-mapped file.
+
+    Each record is one row ordered like `columns` (ts first). append() writes
+    one record and bumps the head in the header, so writes are O(1) and the
+    file never grows; pages are flushed to disk every FLUSH_INTERVAL seconds
+    and on close(). A file written with other columns or another capacity
+    is started afresh. Only one process may hold the file open for writing.
+    """
+
+    def __init__(self, path, columns, capacity):
+        self.path = path
+        self.columns = tuple(columns)
+        self.ncols = len(self.columns)
+        self.capacity = capacity
+        self.record = struct.Struct(f"<{self.ncols}d")
+        self._sig = zlib.crc32(",".join(self.columns).encode())
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        size = HEADER_SIZE + capacity * self.record.size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock_file(self._fd)
+            fresh = os.fstat(self._fd).st_size != size
+            if fresh:
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+            self._mm = mmap.mmap(self._fd, size)
+        except Exception:
+            os.close(self._fd)
+            raise
+
+        magic, ncols, cap, sig, _, head, count = HEADER.unpack_from(self._mm, 0)
+        if fresh or magic != MAGIC or ncols != self.ncols or cap != capacity or sig != self._sig:
+            self._mm[:HEADER_SIZE] = bytes(HEADER_SIZE)
+            head = count = 0
+        self._head = head % capacity
+        self._count = min(count, capacity)
+        self._write_header()
+
+    def __len__(self):
+        return self._count
+
+    def _write_header(self):
+        HEADER.pack_into(self._mm, 0, MAGIC, self.ncols, self.capacity, self._sig, 0,
+                         self._head, self._count)
+
+    def append(self, row):
+        with self._lock:
+            if self._mm is None:
+                return
+            self.record.pack_into(self._mm, HEADER_SIZE + self._head * self.record.size, *row)
+            self._head = (self._head + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+            self._write_header()
+            now = time.monotonic()
+            if now - self._last_flush >= FLUSH_INTERVAL:
+                self._mm.flush()
+                self._last_flush = now
+
+    def tail(self, n=None, since=None):
+        """Newest n records (oldest first), optionally only those with ts >= since.
+
+        Returns a 2-D NumPy array (rows x columns), or a list of tuples
+        without NumPy.
+        """
+        with self._lock:
+            n = self._count if n is None else max(0, min(n, self._count))
+            start = (self._head - n) % self.capacity
+            first = min(n, self.capacity - start)
+            if np is not None:
+                data = np.frombuffer(self._mm, dtype="<f8", count=self.capacity * self.ncols,
+                                     offset=HEADER_SIZE).reshape(self.capacity, self.ncols)
+                rows = np.concatenate((data[start:start + first], data[:n - first]))
+                del data   # release the buffer export so the map can be closed
+                if since is not None and len(rows):
+                    rows = rows[rows[:, 0] >= since]
+                return rows
+            size = self.record.size
+            raw = (self._mm[HEADER_SIZE + start * size:HEADER_SIZE + (start + first) * size]
+                   + self._mm[HEADER_SIZE:HEADER_SIZE + (n - first) * size])
+        rows = list(self.record.iter_unpack(raw))
+        if since is not None:
+            rows = [r for r in rows if r[0] >= since]
+        return rows
+
+    def close(self):
+        with self._lock:
+            if self._mm is None:
+                return
+            self._mm.flush()
+            self._mm.close()
+            self._mm = None
+            os.close(self._fd)
+
+
+def _lock_file(fd):
+    """Take an exclusive, non-blocking lock; raises OSError if another
+    instance already holds the file."""
+    try:
+        import fcntl
+    except ImportError:
+        import msvcrt
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return
+    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
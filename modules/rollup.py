@@ -0,0 +1,188 @@
+# modules/rollup.py
+from modules.timeseries import TimeSeriesStore, np
+
+# (bucket seconds, buckets kept): 1 h of 1 s, 24 h of 10 s, 24 h of 1 min
+TIERS = ((1, 3600), (10, 8640), (60, 1440))
+
+
+class RollupTier:
+    """Fixed-width time buckets with avg/min/max per column.
+
+    Samples are folded into the open bucket as they arrive; when a sample
+    lands in a later bucket the open one is closed and appended to the
+    avg, min and max stores (timestamped with the bucket start).
+    """
+
+    def __init__(self, columns, bucket, capacity):
+        self.bucket = bucket
+        self.avg = TimeSeriesStore(columns, capacity)
+        self.min = TimeSeriesStore(columns, capacity)
+        self.max = TimeSeriesStore(columns, capacity)
+        self.ncols = len(self.avg.columns) - 1
+        self._start = None
+        self._n = 0
+        self._sum = [0.0] * self.ncols
+        self._min = [0.0] * self.ncols
+        self._max = [0.0] * self.ncols
+
+    @property
+    def retention(self):
+        return self.bucket * self.avg.capacity
+
+    def add(self, row):
+        ts = row[0]
+        start = ts - ts % self.bucket
+        if start != self._start:
+            if self._n:
+                self._close()
+            self._start = start
+            self._n = 1
+            self._sum = list(row[1:])
+            self._min = list(row[1:])
+            self._max = list(row[1:])
+            return
+        self._n += 1
+        s, lo, hi = self._sum, self._min, self._max
+        for i, v in enumerate(row[1:]):
+            s[i] += v
+            if v < lo[i]:
+                lo[i] = v
+            elif v > hi[i]:
+                hi[i] = v
+
+    def _close(self):
+        n = self._n
+        self.avg.append([self._start] + [v / n for v in self._sum])
+        self.min.append([self._start] + self._min)
+        self.max.append([self._start] + self._max)
+        self._n = 0
+
+    def load(self, rows):
+        """Bulk-add chronological rows (2-D array), e.g. history read from disk."""
+        if np is None or not len(rows):
+            for row in rows:
+                self.add(row)
+            return
+        if self._n:
+            self._close()
+        ts = rows[:, 0]
+        starts_ts = ts - ts % self.bucket
+        cut = np.flatnonzero(np.r_[True, starts_ts[1:] != starts_ts[:-1]])
+        values = rows[:, 1:]
+        counts = np.diff(np.r_[cut, len(rows)])
+        sums = np.add.reduceat(values, cut, axis=0)
+        mins = np.minimum.reduceat(values, cut, axis=0)
+        maxs = np.maximum.reduceat(values, cut, axis=0)
+        bucket_ts = starts_ts[cut][:, None]
+        # every bucket but the last is complete
+        self.avg.extend(np.hstack((bucket_ts[:-1], sums[:-1] / counts[:-1, None])))
+        self.min.extend(np.hstack((bucket_ts[:-1], mins[:-1])))
+        self.max.extend(np.hstack((bucket_ts[:-1], maxs[:-1])))
+        self._start = float(bucket_ts[-1, 0])
+        self._n = int(counts[-1])
+        self._sum = sums[-1].tolist()
+        self._min = mins[-1].tolist()
+        self._max = maxs[-1].tolist()
+
+
+class Rollups:
+    """Raw samples rolled up into every tier in TIERS, incrementally."""
+
+    def __init__(self, columns, tiers=TIERS):
+        self.tiers = [RollupTier(columns, bucket, capacity) for bucket, capacity in tiers]
+
+    def append(self, row):
+        for tier in self.tiers:
+            tier.add(row)
+
+    def extend(self, rows):
+        for tier in self.tiers:
+            tier.load(rows)
+
+    def pick(self, window, max_points):
+        """Finest tier covering `window` seconds with at most max_points buckets."""
+        covering = [t for t in self.tiers if t.retention >= window] or self.tiers[-1:]
+        for tier in covering:
+            if window / tier.bucket <= max_points:
+                return tier
+        return covering[-1]
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the indices of n_out points of (x, y) that keep the visual
+    shape: first and last point, plus from each of n_out - 2 equal buckets
+    the point forming the largest triangle with the previously chosen
+    point and the average of the next bucket.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return list(range(n))
+    xs = x.tolist() if hasattr(x, "tolist") else list(x)
+    ys = y.tolist() if hasattr(y, "tolist") else list(y)
+    every = (n - 2) / (n_out - 2)
+    out = [0]
+    a = 0
+    for i in range(n_out - 2):
+        nxt_lo = int((i + 1) * every) + 1
+        nxt_hi = min(int((i + 2) * every) + 1, n)
+        span = nxt_hi - nxt_lo
+        avg_x = sum(xs[nxt_lo:nxt_hi]) / span
+        avg_y = sum(ys[nxt_lo:nxt_hi]) / span
+
+        ax, ay = xs[a], ys[a]
+        dx, dy = ax - avg_x, avg_y - ay
+        best = -1.0
+        best_j = lo = int(i * every) + 1
+        for j in range(lo, int((i + 1) * every) + 1):
+            area = abs(dx * (ys[j] - ay) - (ax - xs[j]) * dy)
+            if area > best:
+                best = area
+                best_j = j
+        out.append(best_j)
+        a = best_j
+    out.append(n - 1)
+    return out
+
+
+def lttb_columns(x, ys, n_out, passes=2):
+    """LTTB for several series sharing x, vectorised with NumPy.
+
+    Returns an (len(ys) x n_out) index array, one row per series. Every
+    bucket's argmax runs at once instead of one bucket after another: the
+    first pass anchors each triangle on the previous bucket's average, and
+    each further pass on the point the previous pass picked there. Two
+    passes match lttb() on most points and differ only where triangles are
+    nearly equal, at a fraction of its cost.
+    """
+    x = np.asarray(x, dtype=float)
+    ys = np.atleast_2d(np.asarray(ys, dtype=float))
+    c, n = ys.shape
+    if n_out >= n or n_out < 3:
+        return np.broadcast_to(np.arange(n), (c, n))
+    every = (n - 2) / (n_out - 2)
+    # n_out - 2 buckets plus the last point, as in lttb()
+    starts = (np.arange(n_out - 1) * every).astype(np.intp) + 1
+    counts = np.diff(np.append(starts, n))
+    mean_x = np.add.reduceat(x, starts) / counts
+    mean_y = np.add.reduceat(ys, starts, axis=1) / counts
+    nb = n_out - 2
+    # buckets padded to equal width: (nb x width) point indices
+    idx = starts[:nb, None] + np.arange(int(counts[:nb].max()))
+    valid = idx < starts[1:, None]
+    idx = np.where(valid, idx, starts[:nb, None])
+    px, py = x[idx], ys[:, idx]
+    nx, ny = mean_x[1:], mean_y[:, 1:]
+    ax = np.broadcast_to(np.concatenate(([x[0]], mean_x[:nb - 1])), (c, nb))
+    ay = np.concatenate((ys[:, :1], mean_y[:, :nb - 1]), axis=1)
+    rows = np.arange(nb)
+    for _ in range(passes):
+        area = np.abs((ax - nx)[..., None] * (py - ay[..., None])
+                      - (ax[..., None] - px) * (ny - ay)[..., None])
+        area[:, ~valid] = -1.0
+        chosen = idx[rows, area.argmax(axis=2)]
+        ax = np.concatenate((np.full((c, 1), x[0]), x[chosen[:, :-1]]), axis=1)
+        ay = np.concatenate((ys[:, :1], np.take_along_axis(ys, chosen[:, :-1], axis=1)), axis=1)
+    return np.concatenate((np.zeros((c, 1), dtype=np.intp), chosen,
+                           np.full((c, 1), n - 1, dtype=np.intp)), axis=1)
@@ -0,0 +1,124 @@
+# modules/scheduler.py
+import threading
+import time
+import weakref
+
+from modules import profiling
+
+DEFAULT_MAX_FPS = 4
+
+# every live scheduler, so the frame rate can be throttled app-wide
+_instances = weakref.WeakSet()
+_throttle = 1.0
+
+
+def set_throttle(factor):
+    """Stretch the minimum frame interval of every scheduler (existing and
+    future) by `factor`; 1.0 restores each one's own max_fps."""
+    global _throttle
+    _throttle = max(1.0, factor)
+    for scheduler in list(_instances):
+        scheduler._apply_rate()
+
+
+def all_stats():
+    """stats() of every live scheduler, by name (shown in the Settings profiler)."""
+    return {s.name: s.stats() for s in sorted(list(_instances), key=lambda s: s.name)}
+
+
+class FrameScheduler:
+    """Coalesces refresh requests for one page into Tk `after` callbacks.
+
+    request() may be called from any thread. At most one callback is queued
+    at a time; requests arriving while one is pending replace it (the older
+    frame is counted as dropped), and redraws never start closer together
+    than 1 / max_fps seconds, whatever the sampling rate is.
+    """
+
+    def __init__(self, widget, render, max_fps=DEFAULT_MAX_FPS):
+        self.widget = widget
+        self.render = render
+        self.name = "frame." + getattr(render, "__qualname__", "render")
+        self.max_fps = max_fps
+        self.min_interval = 1.0 / max_fps
+        self._lock = threading.Lock()
+        self._pending = False      # a frame is waiting to be drawn
+        self._scheduled = False    # an after() callback is queued
+        self._requested_at = 0.0
+        self._last_render = 0.0
+        self._closed = False
+
+        self.requested = 0
+        self.rendered = 0
+        self.dropped = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self.last_render_time = 0.0
+        _instances.add(self)
+        self._apply_rate()
+
+    def set_max_fps(self, max_fps):
+        self.max_fps = max_fps
+        self._apply_rate()
+
+    def _apply_rate(self):
+        self.min_interval = _throttle / self.max_fps
+
+    def request(self):
+        now = time.monotonic()
+        with self._lock:
+            if self._closed:
+                return
+            self.requested += 1
+            if self._pending:
+                self.dropped += 1
+            else:
+                self._requested_at = now
+            self._pending = True
+            if self._scheduled:
+                return
+            self._scheduled = True
+            delay = max(0.0, self._last_render + self.min_interval - now)
+        try:
+            self.widget.after(int(delay * 1000), self._run)
+        except Exception:
+            # widget already destroyed
+            with self._lock:
+                self._scheduled = False
+
+    def _run(self):
+        with self._lock:
+            self._scheduled = False
+            if not self._pending or self._closed:
+                return
+            self._pending = False
+            requested_at = self._requested_at
+
+        start = time.monotonic()
+        self._last_render = start
+        try:
+            self.render()
+        finally:
+            end = time.monotonic()
+            if profiling.enabled:
+                profiling.record(self.name, end - start)
+                profiling.record("frame.latency", end - requested_at)
+            self.rendered += 1
+            self.last_render_time = end - start
+            self.last_latency = end - requested_at
+            self.max_latency = max(self.max_latency, self.last_latency)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._pending = False
+
+    def stats(self):
+        return {
+            "requested": self.requested,
+            "rendered": self.rendered,
+            "dropped": self.dropped,
+            "last_latency_ms": round(self.last_latency * 1000, 1),
+            "max_latency_ms": round(self.max_latency * 1000, 1),
+            "last_render_ms": round(self.last_render_time * 1000, 1),
+        }
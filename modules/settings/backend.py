@@ -5,27 +5,31 @@ import json
 import os
 
 
+DEFAULTS = {
+    'update_interval': 0.25,      # seconds between samples (fastest the adaptive rate goes)
+    'adaptive_rate': True,        # back off when the dashboard's own CPU use exceeds the budget
+    'cpu_budget': 2.0,            # percent of one core
+    'start_with_system': False,
+    'minimize_to_tray': False,
+    'theme': 'light'
+}
+
+
 class SettingsManager:
-    def _init_(self, config_file='config.json'):
+    def __init__(self, config_file='config.json'):
         self.config_file = config_file
         self.settings = self.load_settings()
     
     def load_settings(self):
-        """Load settings from file"""
+        """Load settings from file (missing keys fall back to DEFAULTS)"""
+        settings = dict(DEFAULTS)
         if os.path.exists(self.config_file):
             try:
                 with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                    settings.update(json.load(f))
             except:
                 pass
-        
-        # Default settings
-        return {
-            'update_interval': 1,
-            'start_with_system': False,
-            'minimize_to_tray': False,
-            'theme': 'light'
-        }
+        return settings
     
     def save_settings(self):
         """Save settings to file"""
@@ -1,15 +1,169 @@
 # modules/settings/ui.py
+import os
+import time
 import customtkinter as ctk
-from modules import styles
+from tkinter import filedialog
+from modules import styles, adaptive, profiling, scheduler
+from modules.settings.backend import SettingsManager
+
+INTERVALS = ("0.25", "0.5", "1", "2")   # base sampling interval choices, seconds
+STATUS_REFRESH_MS = 1000
+
 
 class SettingsUI:
     def __init__(self, parent):
         self.parent = parent
         self.parent.configure(fg_color=styles.BG_MAIN)
+        self.settings = SettingsManager()
+        self._status_job = None
         self.build()
 
     def build(self):
         frame = ctk.CTkFrame(self.parent, fg_color=styles.BG_MAIN)
         frame.pack(fill="both", expand=True, padx=16, pady=16)
         ctk.CTkLabel(frame, text="SETTINGS", text_color=styles.TEXT_PRIMARY, font=ctk.CTkFont(size=26, weight="bold")).pack(anchor="w")
-        ctk.CTkLabel(frame, text="(Add settings later)", text_color=styles.TEXT_MUTED).pack(anchor="w", pady=(6,0))
+
+        # -------- sampling / CPU budget
+        card = ctk.CTkFrame(frame, fg_color=styles.CARD_BG, corner_radius=styles.CORNER_RADIUS)
+        card.pack(fill="x", pady=(14, 0))
+        card.grid_columnconfigure(1, weight=1)
+        ctk.CTkLabel(card, text="Sampling", text_color=styles.TEXT_PRIMARY,
+                     font=ctk.CTkFont(size=16, weight="bold")).grid(row=0, column=0, sticky="w", padx=14, pady=(12, 8))
+
+        ctk.CTkLabel(card, text="Update interval (s)", text_color=styles.TEXT_MUTED).grid(row=1, column=0, sticky="w", padx=14, pady=6)
+        interval = str(self.settings.get_setting("update_interval"))
+        self.interval_var = ctk.StringVar(value=interval.rstrip("0").rstrip(".") if "." in interval else interval)
+        ctk.CTkOptionMenu(card, values=list(INTERVALS), variable=self.interval_var, width=120,
+                          fg_color=styles.CARD_BG_ALT, button_color=styles.NEON_ORANGE).grid(row=1, column=1, sticky="w", padx=14, pady=6)
+
+        self.adaptive_var = ctk.BooleanVar(value=bool(self.settings.get_setting("adaptive_rate")))
+        ctk.CTkSwitch(card, text="Adaptive rate (slow down when over the CPU budget)",
+                      variable=self.adaptive_var, progress_color=styles.NEON_ORANGE,
+                      text_color=styles.TEXT_PRIMARY).grid(row=2, column=0, columnspan=2, sticky="w", padx=14, pady=6)
+
+        ctk.CTkLabel(card, text="CPU budget (% of one core)", text_color=styles.TEXT_MUTED).grid(row=3, column=0, sticky="w", padx=14, pady=6)
+        budget_row = ctk.CTkFrame(card, fg_color="transparent")
+        budget_row.grid(row=3, column=1, sticky="ew", padx=14, pady=6)
+        self.budget_var = ctk.DoubleVar(value=float(self.settings.get_setting("cpu_budget")))
+        self.budget_label = ctk.CTkLabel(budget_row, width=50, text_color=styles.TEXT_PRIMARY)
+        ctk.CTkSlider(budget_row, from_=0.5, to=10, number_of_steps=19, variable=self.budget_var,
+                      button_color=styles.NEON_ORANGE, command=self._show_budget).pack(side="left", fill="x", expand=True)
+        self.budget_label.pack(side="left", padx=(10, 0))
+        self._show_budget(self.budget_var.get())
+
+        self.status = ctk.CTkLabel(card, text="", text_color=styles.TEXT_MUTED, justify="left")
+        self.status.grid(row=4, column=0, columnspan=2, sticky="w", padx=14, pady=(8, 4))
+
+        bottom = ctk.CTkFrame(card, fg_color="transparent")
+        bottom.grid(row=5, column=0, columnspan=2, sticky="w", padx=14, pady=(4, 14))
+        ctk.CTkButton(bottom, text="Save", width=120, fg_color=styles.NEON_ORANGE,
+                      command=self._save).pack(side="left")
+        self.message = ctk.CTkLabel(bottom, text="", text_color=styles.TEXT_MUTED)
+        self.message.pack(side="left", padx=12)
+
+        # -------- self-profiling
+        prof = ctk.CTkFrame(frame, fg_color=styles.CARD_BG, corner_radius=styles.CORNER_RADIUS)
+        prof.pack(fill="both", expand=True, pady=(14, 0))
+        top = ctk.CTkFrame(prof, fg_color="transparent")
+        top.pack(fill="x", padx=14, pady=(12, 8))
+        ctk.CTkLabel(top, text="Profiler", text_color=styles.TEXT_PRIMARY,
+                     font=ctk.CTkFont(size=16, weight="bold")).pack(side="left")
+        self.profile_var = ctk.BooleanVar(value=profiling.enabled)
+        ctk.CTkSwitch(top, text="Record timings", variable=self.profile_var, command=self._toggle_profiling,
+                      progress_color=styles.NEON_ORANGE, text_color=styles.TEXT_PRIMARY).pack(side="left", padx=16)
+        ctk.CTkButton(top, text="Dump to file…", width=120, fg_color=styles.CARD_BG_ALT,
+                      command=self._dump_profile).pack(side="right")
+        ctk.CTkButton(top, text="Reset", width=90, fg_color=styles.CARD_BG_ALT,
+                      command=profiling.reset).pack(side="right", padx=8)
+
+        self.profile_table = ctk.CTkTextbox(prof, font=ctk.CTkFont(family="Courier", size=12),
+                                            fg_color=styles.CARD_BG_ALT, text_color=styles.TEXT_PRIMARY,
+                                            wrap="none")
+        self.profile_table.pack(fill="both", expand=True, padx=14, pady=(0, 14))
+
+    def _show_budget(self, value):
+        self.budget_label.configure(text=f"{float(value):.1f}%")
+
+    def _save(self):
+        values = {"update_interval": float(self.interval_var.get()),
+                  "adaptive_rate": bool(self.adaptive_var.get()),
+                  "cpu_budget": round(float(self.budget_var.get()), 1)}
+        ok, msg = self.settings.update_settings(values)
+        controller = adaptive.get_controller()
+        if controller is not None:
+            controller.configure(base_interval=values["update_interval"], budget=values["cpu_budget"],
+                                 enabled=values["adaptive_rate"])
+        self.message.configure(text=msg, text_color=styles.NEON_LIME if ok else styles.NEON_PINK)
+
+    def _toggle_profiling(self):
+        profiling.enable(self.profile_var.get())
+
+    def _dump_profile(self):
+        path = filedialog.asksaveasfilename(
+            parent=self.parent, defaultextension=".json",
+            initialfile=f"profile-{time.strftime('%Y%m%d-%H%M%S')}.json",
+            filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        try:
+            profiling.dump(path)
+            self.message.configure(text=f"Profile written to {os.path.basename(path)}",
+                                   text_color=styles.NEON_LIME)
+        except OSError as e:
+            self.message.configure(text=f"Failed to write profile: {e}", text_color=styles.NEON_PINK)
+
+    def _render_profile(self):
+        rows = profiling.snapshot()
+        if not rows:
+            text = ("Switch on \"Record timings\" to collect latency histograms for sampling,\n"
+                    "frame callbacks, graph draws and table fills." if not profiling.enabled
+                    else "Waiting for samples…")
+        else:
+            lines = [f"{'hook':<38}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+                     f"{'max ms':>10}{'total s':>10}"]
+            for name, h in rows.items():
+                lines.append(f"{name[:37]:<38}{h['count']:>8}{h['p50_ms']:>10.3f}{h['p95_ms']:>10.3f}"
+                             f"{h['p99_ms']:>10.3f}{h['max_ms']:>10.3f}{h['total_ms'] / 1000:>10.2f}")
+            text = "\n".join(lines)
+        text += "\n\n" + _frame_table(scheduler.all_stats())
+        self.profile_table.configure(state="normal")
+        self.profile_table.delete("1.0", "end")
+        self.profile_table.insert("1.0", text)
+        self.profile_table.configure(state="disabled")
+
+    # -------- live status while the page is shown
+    def on_show(self):
+        if self._status_job is None:
+            self._update_status()
+
+    def on_hide(self):
+        if self._status_job is not None:
+            self.parent.after_cancel(self._status_job)
+            self._status_job = None
+
+    stop_updates = on_hide
+
+    def _update_status(self):
+        controller = adaptive.get_controller()
+        if controller is None:
+            self.status.configure(text="Rate control is off (replay)")
+        else:
+            s = controller.status()
+            mode = "adaptive" if s["enabled"] else "fixed"
+            self.status.configure(
+                text=f"Now sampling every {s['interval']:.2f} s ({mode}, "
+                     f"{'focused' if s['focused'] else 'in background'})   •   "
+                     f"own CPU {s['overhead']:.1f}% of a core, {s['tick_cost_ms']:.1f} ms per tick")
+        self._render_profile()
+        self._status_job = self.parent.after(STATUS_REFRESH_MS, self._update_status)
+
+
+def _frame_table(frames):
+    """Per-page frame counters: always kept, whether timings are recorded or not."""
+    lines = [f"{'frame scheduler':<38}{'requests':>10}{'drawn':>8}{'dropped':>9}"
+             f"{'last lat ms':>13}{'max lat ms':>12}{'render ms':>11}"]
+    for name, s in frames.items():
+        lines.append(f"{name[6:][:37]:<38}{s['requested']:>10}{s['rendered']:>8}{s['dropped']:>9}"
+                     f"{s['last_latency_ms']:>13.1f}{s['max_latency_ms']:>12.1f}"
+                     f"{s['last_render_ms']:>11.1f}")
+    return "\n".join(lines)
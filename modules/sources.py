@@ -0,0 +1,24 @@
+# modules/sources.py
+
+
+class MetricSource:
+    """One stream of snapshots the collector can sample.
+
+    `name` is the collector source it feeds ("performance", "processes");
+    sample() returns one immutable snapshot per call. Live backends and
+    replayed recordings implement the same interface, so pages, the
+    exporter and headless mode can't tell them apart. Sources are callable,
+    which is all Collector.add_source() needs.
+    """
+
+    name = None
+    ts = None   # time of the latest snapshot, when the snapshot itself has none
+
+    def sample(self):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __call__(self):
+        return self.sample()
@@ -0,0 +1,177 @@
+# modules/timeseries.py
+import threading
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # plain array.array buffers, memoryview views
+    np = None
+
+
+class TimeSeriesStore:
+    """Preallocated columnar ring buffer: a "ts" column plus one float
+    column per metric.
+
+    Every value is written twice, at i and i + capacity, so the latest n
+    samples of a column are always one contiguous slice of its buffer.
+    view() therefore returns a zero-copy view (a NumPy array, or a
+    memoryview when NumPy is missing) that can go straight to plotting or
+    export. Views alias the buffer: an append that happens while a full
+    window is being read may overwrite its oldest element.
+    """
+
+    def __init__(self, columns, capacity):
+        self.columns = ("ts",) + tuple(c for c in columns if c != "ts")
+        self._lock = threading.Lock()
+        self._alloc(capacity)
+
+    @classmethod
+    def for_retention(cls, columns, seconds, interval):
+        """Store sized to keep `seconds` of samples taken every `interval` seconds."""
+        return cls(columns, max(1, int(round(seconds / interval))))
+
+    def _alloc(self, capacity):
+        self.capacity = capacity
+        if np is not None:
+            self._data = {c: np.zeros(2 * capacity) for c in self.columns}
+        else:
+            self._data = {c: array("d", bytes(16 * capacity)) for c in self.columns}
+        self._cols = [self._data[c] for c in self.columns]
+        self._head = 0     # next write position in [0, capacity)
+        self._count = 0
+        self.version = 0   # bumped on every append
+
+    def __len__(self):
+        return self._count
+
+    # -------- writing
+    def append(self, row):
+        """row: sequence ordered like self.columns (ts first), e.g. a PerfSample."""
+        with self._lock:
+            i = self._head
+            j = i + self.capacity
+            for buf, value in zip(self._cols, row):
+                buf[i] = value
+                buf[j] = value
+            self._head = (i + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+            self.version += 1
+
+    def extend(self, rows):
+        if np is not None and isinstance(rows, np.ndarray):
+            self._load(rows)
+            return
+        for row in rows:
+            self.append(row)
+
+    def _load(self, rows):
+        # bulk path for 2-D arrays (rows x columns), e.g. history read from disk
+        rows = rows[-self.capacity:]
+        n = len(rows)
+        if not n:
+            return
+        with self._lock:
+            idx = (self._head + np.arange(n)) % self.capacity
+            for c, buf in enumerate(self._cols):
+                buf[idx] = rows[:, c]
+                buf[idx + self.capacity] = rows[:, c]
+            self._head = (self._head + n) % self.capacity
+            self._count = min(self.capacity, self._count + n)
+            self.version += 1
+
+    def set_capacity(self, capacity):
+        """Change retention, keeping the newest samples that still fit."""
+        if capacity == self.capacity:
+            return
+        with self._lock:
+            keep = min(self._count, capacity)
+            old = {c: list(self._window(c, keep)) for c in self.columns}
+            self._alloc(capacity)
+            for k in range(keep):
+                for c, buf in zip(self.columns, self._cols):
+                    buf[k] = buf[k + capacity] = old[c][k]
+            self._head = keep % capacity
+            self._count = keep
+
+    def clear(self):
+        with self._lock:
+            self._head = 0
+            self._count = 0
+            self.version += 1
+
+    # -------- reading
+    def _window(self, column, n):
+        end = self._head + self.capacity
+        buf = self._data[column]
+        if np is None:
+            return memoryview(buf)[end - n:end]
+        return buf[end - n:end]
+
+    def view(self, column, n=None):
+        """Zero-copy view of the last n samples of `column` (oldest first)."""
+        with self._lock:
+            count = self._count
+            n = count if n is None else max(0, min(n, count))
+            return self._window(column, n)
+
+    def views(self, columns=None, n=None):
+        """Consistent views of several columns, as a dict."""
+        with self._lock:
+            count = self._count
+            n = count if n is None else max(0, min(n, count))
+            return {c: self._window(c, n) for c in (columns or self.columns)}
+
+    def latest(self, column, default=0.0):
+        with self._lock:
+            if not self._count:
+                return default
+            return self._data[column][self._head + self.capacity - 1]
+
+
+class MatrixRing:
+    """Ring buffer of fixed-width rows (e.g. per-core CPU%) with timestamps.
+
+    Double-written like TimeSeriesStore, so the newest n rows are always
+    one contiguous (n x width) NumPy view. append() takes a (ts, values)
+    pair such as a CoreSample; rows of another width are cut or
+    zero-padded.
+    """
+
+    def __init__(self, width, capacity):
+        if np is None:
+            raise RuntimeError("MatrixRing needs NumPy")
+        self.width = width
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._ts = np.zeros(2 * capacity)
+        self._rows = np.zeros((2 * capacity, width))
+        self._head = 0
+        self._count = 0
+        self.version = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, sample):
+        ts, values = sample
+        values = values[:self.width]
+        with self._lock:
+            i = self._head
+            j = i + self.capacity
+            self._ts[i] = self._ts[j] = ts
+            n = len(values)
+            self._rows[i, :n] = self._rows[j, :n] = values
+            if n < self.width:
+                self._rows[i, n:] = self._rows[j, n:] = 0.0
+            self._head = (i + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+            self.version += 1
+
+    def window(self, n=None):
+        """(ts, rows) views of the newest n rows, oldest first."""
+        with self._lock:
+            n = self._count if n is None else max(0, min(n, self._count))
+            end = self._head + self.capacity
+            return self._ts[end - n:end], self._rows[end - n:end]